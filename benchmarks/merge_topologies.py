@@ -0,0 +1,111 @@
+"""
+========================================================================================================================
+Name: merge_topologies.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+
+Compares the merge topologies of the AOV networks for 10, 40 and 120 AOVs.
+
+Outside Nuke it reports the node count and the merge depth of every topology:
+
+    python benchmarks/merge_topologies.py
+
+Inside Nuke it also renders the networks, with a CheckerBoard standing in for every AOV Read:
+
+    nuke -t benchmarks/merge_topologies.py
+"""
+try:
+    import nuke
+except ImportError:
+    nuke = None
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+
+AOVS_COUNTS = (10, 40, 120)
+RENDER_REPEATS = 3
+
+
+def get_merge_depth(graph: AOVGraph, key: str) -> int:
+    """Gets the number of merges on the longest path that ends in the node."""
+    depths = {}
+
+    for graph_node in graph.get_sorted_nodes():
+        inputs_depth = max((depths[input_key] for input_key in graph_node.inputs if input_key), default=0)
+        depths[graph_node.key] = inputs_depth + (graph_node.node_class == 'Merge2')
+
+    return depths[key]
+
+
+def plan_network(topology: str, aovs_count: int) -> AOVGraph:
+    """Plans a multi files network with the topology."""
+    files_paths = [(f'/render/shot.aov{i:03d}.exr', f'aov{i:03d}', None) for i in range(aovs_count)]
+
+    planner = AOVNetworkPlanner()
+    planner.set_topology(topology=topology)
+
+    graph = planner.plan_standard_network_from_multi_files(files_paths=files_paths)
+
+    if nuke:
+        for graph_node in graph.get_nodes():
+            if graph_node.node_class == 'Read':
+                graph_node.node_class = 'CheckerBoard2'
+                graph_node.knobs = {}
+
+    return graph
+
+
+def render_network(graph: AOVGraph) -> float:
+    """Renders the network output and returns the best render time."""
+    from maurice_aov_compositor.core.aov_graph_materializer import AOVGraphMaterializer
+
+    materializer = AOVGraphMaterializer()
+    materializer.set_mode(mode=AOVGraphMaterializer.FAST)
+    nodes = materializer.materialize(graph=graph)
+
+    write_node = nuke.nodes.Write(file=os.path.join(tempfile.gettempdir(), 'merge_topologies.exr').replace('\\', '/'))
+    write_node.setInput(0, nodes[graph.output_key])
+
+    render_times = []
+
+    for _ in range(RENDER_REPEATS):
+        nuke.clearRAMCache()
+
+        start_time = time.perf_counter()
+        nuke.execute(write_node, 1, 1)
+        render_times.append(time.perf_counter() - start_time)
+
+    for node in list(nodes.values()) + [write_node]:
+        nuke.delete(node)
+
+    return min(render_times)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    if nuke:
+        nuke.root()['format'].setValue('HD_1080')
+
+    print(f'{"AOVs":>6} {"Topology":>10} {"Nodes":>6} {"Depth":>6} {"Render (s)":>11}')
+
+    for aovs_count in AOVS_COUNTS:
+        for topology in AOVNetworkPlanner.TOPOLOGIES:
+            graph = plan_network(topology=topology, aovs_count=aovs_count)
+            depth = get_merge_depth(graph=graph, key=graph.output_key)
+            render_time = f'{render_network(graph=graph):.3f}' if nuke else '-'
+
+            print(f'{aovs_count:>6} {topology:>10} {graph.get_node_count():>6} {depth:>6} {render_time:>11}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""
+========================================================================================================================
+Name: __main__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+
+Command line entry point, it runs without Nuke or Qt:
+
+    python -m maurice_aov_compositor build /shots/sh010/render /shots/sh020/render/beauty.diffuse.exr --preset arnold
+    python -m maurice_aov_compositor audit /shots/sh010/render --output sh010_audit.json
+    python -m maurice_aov_compositor beauty /shots/sh010/render --workers 8
+"""
+import argparse
+import logging
+import json
+import sys
+
+from maurice_aov_compositor.core.aov_beauty_engine import AOVBeautyEngine
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineCodec
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph_layout import AOVGraphLayout
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_network_batch import AOVNetworkBatch
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+from maurice_aov_compositor.core.aov_render_audit import AOVRenderAudit
+import maurice_aov_compositor as maurice
+
+
+def audit(args: argparse.Namespace) -> int:
+    """Audits the AOV files of the renders and writes the JSON report."""
+    aov_network_batch = AOVNetworkBatch()
+    aov_network_batch.set_preset(preset=args.preset)
+    aov_network_batch.set_compositing_operation(compositing_operation=args.operation)
+
+    try:
+        aov_render_audit = AOVRenderAudit(
+            aovs_settings=aov_network_batch.get_aovs_settings(),
+            header_cache=AOVHeaderCache(persistent=not args.no_cache),
+            index_cache=AOVIndexCache() if not args.no_cache else None,
+            naming_template=AOVNamingTemplate(template=args.template))
+    except AOVGraphError as error:
+        print(f'error: {error}', file=sys.stderr)
+
+        return 2
+
+    aov_render_audit.set_max_depth(max_depth=max(args.depth, 0))
+
+    reports = []
+    failed = False
+
+    for path in args.paths:
+        try:
+            reports.append(aov_render_audit.audit(path=path))
+        except AOVGraphError as error:
+            logging.error('Failed to audit %s: %s', path, error)
+
+            failed = True
+
+    if args.output:
+        AOVRenderAudit.write_json(reports=reports, file_path=args.output)
+    else:
+        print(json.dumps(reports, indent=2))
+
+    return 1 if failed else 0
+
+
+def beauty(args: argparse.Namespace) -> int:
+    """Rebuilds the beauty of the renders from their AOV files."""
+    aov_network_batch = AOVNetworkBatch()
+    aov_network_batch.set_preset(preset=args.preset)
+    aov_network_batch.set_compositing_operation(compositing_operation=args.operation)
+
+    aov_beauty_engine = AOVBeautyEngine(aovs_settings=aov_network_batch.get_aovs_settings())
+    aov_beauty_engine.set_output_folder_path(output_folder_path=args.output)
+    aov_beauty_engine.set_max_workers(max_workers=args.workers)
+    aov_beauty_engine.set_use_index_cache(use_index_cache=not args.no_cache)
+    aov_beauty_engine.set_compression(compression=args.compression)
+    aov_beauty_engine.set_pixel_type(pixel_type=args.pixel_type)
+
+    try:
+        aov_beauty_engine.set_naming_template(naming_template=args.template)
+        aov_beauty_engine.set_max_depth(max_depth=args.depth)
+        aov_beauty_engine.set_block_lines(block_lines=args.block_lines)
+    except AOVGraphError as error:
+        print(f'error: {error}', file=sys.stderr)
+
+        return 2
+
+    failed = False
+
+    for path in args.paths:
+        try:
+            results = aov_beauty_engine.build(path=path)
+        except AOVGraphError as error:
+            logging.error('Failed to rebuild %s: %s', path, error)
+
+            failed = True
+
+            continue
+
+        for output_file_path, result in sorted(results.items()):
+            if isinstance(result, Exception):
+                failed = True
+            else:
+                print(output_file_path)
+
+    return 1 if failed else 0
+
+
+def build(args: argparse.Namespace) -> int:
+    """Builds the Nuke scripts of the shots."""
+    aov_network_batch = AOVNetworkBatch()
+    aov_network_batch.set_preset(preset=args.preset)
+    aov_network_batch.set_compositing_operation(compositing_operation=args.operation)
+    aov_network_batch.set_topology(topology=args.topology)
+    aov_network_batch.set_layout_style(style=args.layout)
+    aov_network_batch.set_layer_native(layer_native=args.layer_native)
+    aov_network_batch.set_crop_overscan(crop_overscan=args.crop_overscan)
+    aov_network_batch.set_output_folder_path(output_folder_path=args.output)
+    aov_network_batch.set_max_workers(max_workers=args.workers)
+    aov_network_batch.set_use_index_cache(use_index_cache=not args.no_cache)
+    aov_network_batch.set_strict(strict=args.strict)
+
+    try:
+        aov_network_batch.set_naming_template(naming_template=args.template)
+        aov_network_batch.set_max_depth(max_depth=args.depth)
+    except AOVGraphError as error:
+        print(f'error: {error}', file=sys.stderr)
+
+        return 2
+
+    results = aov_network_batch.run(paths=args.paths)
+    failed_paths = [path for path, result in results.items() if isinstance(result, Exception)]
+
+    for path in args.paths:
+        if path not in failed_paths:
+            print(results[path][0])
+
+    return 1 if failed_paths else 0
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Gets the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog='maurice_aov_compositor',
+        description=f'{maurice.AOV_COMPOSITOR} {maurice.VERSION}.')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log every built shot')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='build the AOV network scripts of render folders or EXR files')
+    build_parser.add_argument('paths', nargs='+', help='render folders or AOV EXR files, one script per path')
+    build_parser.add_argument(
+        '-p', '--preset', choices=sorted(AOVNetworkBatch.PRESETS), default=AOVNetworkBatch.ARNOLD,
+        help='renderer preset')
+    build_parser.add_argument(
+        '--operation', choices=AOVNetworkBatch.COMPOSITING_OPERATIONS, default=AOVNetworkBatch.STANDARD,
+        help='render compositing operation')
+    build_parser.add_argument(
+        '--topology', choices=AOVNetworkPlanner.TOPOLOGIES, default=AOVNetworkPlanner.LINEAR, help='merge topology')
+    build_parser.add_argument(
+        '--layout', choices=AOVGraphLayout.STYLES, default=AOVGraphLayout.GRID, help='layout style')
+    build_parser.add_argument('--layer-native', action='store_true', help='merge the Read nodes without Shuffle nodes')
+    build_parser.add_argument(
+        '--crop-overscan', action='store_true', help='crop the data windows that overflow the format')
+    build_parser.add_argument('-o', '--output', default='', help='scripts folder, by default the folder of every shot')
+    build_parser.add_argument('-j', '--workers', type=int, default=None, help='processes, by default one per CPU')
+    build_parser.add_argument(
+        '-t', '--template', default=AOVNamingTemplate.DEFAULT,
+        help=f'AOV files naming template, such as "{{shot}}_{{layer}}.{{aov}}.{{frame}}.exr" (default: %(default)s)')
+    build_parser.add_argument(
+        '-d', '--depth', type=int, default=AOVFileFinder.MAX_DEPTH,
+        help='render layers subfolders depth searched, 0 searches only the given folder (default: %(default)s)')
+    build_parser.add_argument(
+        '--strict', action='store_true',
+        help='fail the shots whose AOV files differ in resolution, pixel type or color channels')
+    build_parser.add_argument(
+        '--no-cache', action='store_true',
+        help='list the render folders and read the EXR headers again, skip the caches')
+    build_parser.set_defaults(function=build)
+
+    audit_parser = subparsers.add_parser(
+        'audit', help='report the compression, layout, pixel types, channels and data windows of the AOV files')
+    audit_parser.add_argument('paths', nargs='+', help='render folders or AOV EXR files')
+    audit_parser.add_argument(
+        '-p', '--preset', choices=sorted(AOVNetworkBatch.PRESETS), default=AOVNetworkBatch.ARNOLD,
+        help='renderer preset')
+    audit_parser.add_argument(
+        '--operation', choices=AOVNetworkBatch.COMPOSITING_OPERATIONS, default=AOVNetworkBatch.STANDARD,
+        help='render compositing operation')
+    audit_parser.add_argument('-o', '--output', default='', help='JSON report file, by default printed')
+    audit_parser.add_argument(
+        '-t', '--template', default=AOVNamingTemplate.DEFAULT,
+        help='AOV files naming template (default: %(default)s)')
+    audit_parser.add_argument(
+        '-d', '--depth', type=int, default=AOVFileFinder.MAX_DEPTH,
+        help='render layers subfolders depth searched (default: %(default)s)')
+    audit_parser.add_argument(
+        '--no-cache', action='store_true',
+        help='list the render folders and read the EXR headers again, skip the caches')
+    audit_parser.set_defaults(function=audit)
+
+    beauty_parser = subparsers.add_parser(
+        'beauty', help='rebuild the beauty of render folders or EXR files by adding their AOVs, without Nuke')
+    beauty_parser.add_argument('paths', nargs='+', help='render folders or AOV EXR files')
+    beauty_parser.add_argument(
+        '-p', '--preset', choices=sorted(AOVNetworkBatch.PRESETS), default=AOVNetworkBatch.ARNOLD,
+        help='renderer preset')
+    beauty_parser.add_argument(
+        '--operation', choices=AOVNetworkBatch.COMPOSITING_OPERATIONS, default=AOVNetworkBatch.STANDARD,
+        help='render compositing operation')
+    beauty_parser.add_argument(
+        '-o', '--output', default='', help='beauty folder, by default the folder of every render')
+    beauty_parser.add_argument('-j', '--workers', type=int, default=None, help='processes, by default one per CPU')
+    beauty_parser.add_argument(
+        '--compression', choices=AOVEXRScanlineCodec.SUPPORTED_COMPRESSIONS, default='zip',
+        help='beauty compression (default: %(default)s)')
+    beauty_parser.add_argument(
+        '--pixel-type', choices=AOVBeautyEngine.PIXEL_TYPES, default='float',
+        help='beauty pixel type (default: %(default)s)')
+    beauty_parser.add_argument(
+        '--block-lines', type=int, default=AOVBeautyEngine.BLOCK_LINES,
+        help='scanlines read and added at a time (default: %(default)s)')
+    beauty_parser.add_argument(
+        '-t', '--template', default=AOVNamingTemplate.DEFAULT,
+        help='AOV files naming template (default: %(default)s)')
+    beauty_parser.add_argument(
+        '-d', '--depth', type=int, default=AOVFileFinder.MAX_DEPTH,
+        help='render layers subfolders depth searched (default: %(default)s)')
+    beauty_parser.add_argument('--no-cache', action='store_true', help='list the render folders again, skip the cache')
+    beauty_parser.set_defaults(function=beauty)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """Runs the command line."""
+    args = get_parser().parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(levelname)s: %(message)s')
+
+    return args.function(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
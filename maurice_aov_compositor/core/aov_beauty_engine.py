@@ -0,0 +1,321 @@
+"""
+========================================================================================================================
+Name: aov_beauty_engine.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+import logging
+import os
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineCodec
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineReader
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineWriter
+from maurice_aov_compositor.core.aov_exr_image import check_numpy
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVBeautyEngine(object):
+    """AOV beauty engine.
+
+    Rebuilds the beauty of renders outside Nuke, without Nuke licenses, by adding the red, green and blue channels of
+    the AOVs of the AOVs settings together, as the plus merges of the AOV networks do. The AOV files are read and the
+    beauty is written block by block of scanlines, a frame is never loaded whole, every block is added with vectorized
+    NumPy operations. The frames are rebuilt in parallel by a pool of processes.
+
+    The beauty covers the union of the data windows of the AOVs. Only single part scanline files with the NONE, RLE,
+    ZIPS and ZIP compressions are read. Every beauty file is written to a temporary file next to it and moved into
+    place once complete, so a frame that fails never leaves a truncated file behind.
+    """
+    COLOR_CHANNELS = {'red': 'R', 'green': 'G', 'blue': 'B'}
+
+    FRAME_TOKEN = '%04d'
+
+    BLOCK_LINES = 64
+
+    OUTPUT_SUFFIX = '_beauty_rebuild'
+
+    PIXEL_TYPES = ('half', 'float')
+
+    def __init__(self, aovs_settings: dict = None):
+        """Initializes class attributes."""
+        self.aovs_settings = aovs_settings or {}
+        self.aovs = set(self.aovs_settings.values())
+        self.naming_template = AOVNamingTemplate.DEFAULT
+        self.max_depth = AOVFileFinder.MAX_DEPTH
+        self.use_index_cache = True
+        self.max_workers = None
+        self.block_lines = AOVBeautyEngine.BLOCK_LINES
+        self.pixel_type = 'float'
+        self.compression = 'zip'
+        self.output_folder_path = ''
+
+    def build(self, path: str) -> dict:
+        """Rebuilds the beauty of every frame of the renders of a render folder, of the render of one of its AOV files
+        or of a single file with its AOVs as layers, and returns the output file path, or the error, by frame file.
+
+        Raises AOVGraphError if no AOV file is found.
+        """
+        check_numpy()
+
+        path = path.replace('\\', '/')
+        file_finder = AOVFileFinder(
+            aovs_settings=self.aovs_settings,
+            index_cache=AOVIndexCache() if self.use_index_cache else None,
+            naming_template=AOVNamingTemplate(template=self.naming_template))
+        file_finder.set_max_depth(max_depth=self.max_depth)
+
+        if os.path.isdir(path):
+            renders = file_finder.get_renders(folder_path=path.rstrip('/'))
+        else:
+            files_paths = file_finder.find_files_paths(target_file_path=path)
+            base_name = file_finder.get_base_name(file_name=os.path.basename(path))
+            renders = {base_name: files_paths} if files_paths else {}
+
+        frames = []
+
+        for base_name in sorted(renders):
+            folder_path = self.output_folder_path or os.path.dirname(renders[base_name][0][0])
+            frames.extend(self.get_render_frames(
+                files_paths=renders[base_name],
+                output_file_path=f'{folder_path}/{base_name}{AOVBeautyEngine.OUTPUT_SUFFIX}'))
+
+        if not frames and os.path.isfile(path):
+            aovs = AOVHeaderCache().get_header(file_path=path).get_channel_index().get_aovs(aovs=self.aovs)
+            folder_path = self.output_folder_path or os.path.dirname(path)
+            file_name = os.path.splitext(os.path.basename(path))[0]
+
+            if aovs:
+                frames.append((
+                    [(path, aov) for aov in aovs],
+                    f'{folder_path}/{file_name}{AOVBeautyEngine.OUTPUT_SUFFIX}.exr'))
+
+        if not frames:
+            raise AOVGraphError(f'No AOV files found: {path}')
+
+        return self.build_frames(frames=frames)
+
+    def build_frame(self, sources: list, output_file_path: str) -> str:
+        """Rebuilds the beauty of a frame from the (file path, layer) AOV sources and returns its output file path.
+
+        Raises AOVEXRHeaderError if an AOV file cannot be read or the beauty cannot be written.
+        """
+        readers = []
+        temp_file_path = self.get_temp_file_path(file_path=output_file_path)
+
+        try:
+            for file_path, layer in sources:
+                reader = AOVEXRScanlineReader(file_path=file_path).open()
+                readers.append((reader, reader.get_channels_names(layer=layer)))
+
+                if not readers[-1][1]:
+                    logger.warning('No %s channels in %s.', layer, file_path)
+
+            data_window = self.get_data_windows_union(data_windows=[reader.part.data_window for reader, _ in readers])
+            x_min, y_min, x_max, y_max = data_window
+            width = x_max - x_min + 1
+
+            with AOVEXRScanlineWriter(
+                    file_path=temp_file_path,
+                    channels_names=list(AOVBeautyEngine.COLOR_CHANNELS.values()),
+                    data_window=data_window,
+                    display_window=readers[0][0].part.display_window,
+                    pixel_type=self.pixel_type,
+                    compression=self.compression) as writer:
+                for y_start in range(y_min, y_max + 1, self.block_lines):
+                    y_end = min(y_start + self.block_lines, y_max + 1)
+                    block = {
+                        channel_name: np.zeros((y_end - y_start, width), dtype=np.float32)
+                        for channel_name in AOVBeautyEngine.COLOR_CHANNELS.values()}
+
+                    for reader, channels_names in readers:
+                        self.add_lines(
+                            block=block,
+                            block_y=y_start,
+                            block_x=x_min,
+                            reader=reader,
+                            channels_names=channels_names)
+
+                    writer.write_lines(channels=block)
+
+            os.replace(temp_file_path, output_file_path)
+        except OSError as error:
+            self.remove_file(file_path=temp_file_path)
+
+            raise AOVEXRHeaderError(f'Cannot write EXR file: {error}') from error
+        except Exception:
+            self.remove_file(file_path=temp_file_path)
+
+            raise
+        finally:
+            for reader, _ in readers:
+                reader.close()
+
+        return output_file_path
+
+    def build_frames(self, frames: list) -> dict:
+        """Rebuilds the beauty of the (sources, output file path) frames in parallel and returns the output file path,
+        or the error, by output file path.
+        """
+        results = {}
+
+        if self.output_folder_path:
+            os.makedirs(self.output_folder_path, exist_ok=True)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.build_frame, sources, output_file_path): output_file_path
+                for sources, output_file_path in frames}
+
+            for future in as_completed(futures):
+                output_file_path = futures[future]
+
+                try:
+                    results[output_file_path] = future.result()
+                except Exception as error:
+                    logger.error('Failed to rebuild %s: %s', output_file_path, error)
+
+                    results[output_file_path] = error
+                else:
+                    logger.info('Rebuilt %s.', output_file_path)
+
+        return results
+
+    @staticmethod
+    def add_lines(block: dict, block_y: int, block_x: int, reader: AOVEXRScanlineReader,
+                  channels_names: dict) -> None:
+        """Adds the color channels of the scanlines of an AOV file to the (lines, width) arrays of a block, at their
+        place in the block.
+        """
+        lines_count, _ = next(iter(block.values())).shape
+        result = reader.read_lines(y_start=block_y, y_end=block_y + lines_count)
+
+        if result is None:
+            return
+
+        lines_y, lines = result
+        x_min, _, x_max, _ = reader.part.data_window
+        rows = slice(lines_y - block_y, lines_y - block_y + len(lines))
+        columns = slice(x_min - block_x, x_max - block_x + 1)
+
+        for suffix, channel_name in AOVBeautyEngine.COLOR_CHANNELS.items():
+            if suffix in channels_names:
+                block[channel_name][rows, columns] += lines[channels_names[suffix]]
+
+    @staticmethod
+    def get_data_windows_union(data_windows: list) -> tuple:
+        """Gets the (x min, y min, x max, y max) union of the data windows."""
+        return (
+            min(data_window[0] for data_window in data_windows),
+            min(data_window[1] for data_window in data_windows),
+            max(data_window[2] for data_window in data_windows),
+            max(data_window[3] for data_window in data_windows))
+
+    @staticmethod
+    def get_render_frames(files_paths: list, output_file_path: str) -> list:
+        """Gets the (sources, output file path) frames of the (file path, AOV, frame range) files of a render, the
+        output file path is given without extension. The frames are the ones every AOV sequence has, the output files
+        have the frame padding of the first AOV sequence.
+        """
+        frames_ranges = [frame_range for _, _, frame_range in files_paths if frame_range]
+
+        if not frames_ranges:
+            return [([(file_path, 'rgba') for file_path, _, _ in files_paths], f'{output_file_path}.exr')]
+
+        first_frame = max(frame_range[0] for frame_range in frames_ranges)
+        last_frame = min(frame_range[1] for frame_range in frames_ranges)
+
+        if len(set(frames_ranges)) > 1:
+            logger.warning('The AOV frame ranges differ, rebuilding frames %d to %d.', first_frame, last_frame)
+
+        frame_token = next(
+            AOVSequence.get_frame_token(pattern=file_path) for file_path, _, frame_range in files_paths if frame_range)
+        output_pattern = f'{output_file_path}.{frame_token or AOVBeautyEngine.FRAME_TOKEN}.exr'
+        frames = []
+
+        for frame in range(first_frame, last_frame + 1):
+            sources = [
+                (AOVSequence.get_frame_file_path(pattern=file_path, frame=frame) if frame_range else file_path, 'rgba')
+                for file_path, _, frame_range in files_paths]
+            frames.append((sources, AOVSequence.get_frame_file_path(pattern=output_pattern, frame=frame)))
+
+        return frames
+
+    @staticmethod
+    def get_temp_file_path(file_path: str) -> str:
+        """Gets the hidden temporary file a file is written to, in the same folder so it is moved into place at once."""
+        folder_path, file_name = os.path.split(file_path)
+
+        return os.path.join(folder_path, f'.{file_name}.{os.getpid()}.tmp')
+
+    @staticmethod
+    def remove_file(file_path: str) -> None:
+        """Removes a file if it exists."""
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def set_block_lines(self, block_lines: int) -> None:
+        """Sets the number of scanlines read, added and written at a time."""
+        if block_lines < 1:
+            raise AOVGraphError(f'Invalid block lines: {block_lines}')
+
+        self.block_lines = block_lines
+
+    def set_compression(self, compression: str) -> None:
+        """Sets the compression of the beauty files."""
+        if compression not in AOVEXRScanlineCodec.SUPPORTED_COMPRESSIONS:
+            raise AOVGraphError(f'Unsupported EXR compression: {compression}')
+
+        self.compression = compression
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets the maximum depth of the render layers subfolders searched, 0 searches only the render folder."""
+        if max_depth < 0:
+            raise AOVGraphError(f'Invalid subfolders depth: {max_depth}')
+
+        self.max_depth = max_depth
+
+    def set_max_workers(self, max_workers: int | None) -> None:
+        """Sets the maximum number of processes, None uses one per CPU."""
+        self.max_workers = max_workers
+
+    def set_naming_template(self, naming_template: str) -> None:
+        """Sets the naming template of the AOV files, see AOVNamingTemplate."""
+        AOVNamingTemplate.compile(template=naming_template)
+
+        self.naming_template = naming_template
+
+    def set_output_folder_path(self, output_folder_path: str) -> None:
+        """Sets the folder the beauty files are written to, by default the folder of every render."""
+        self.output_folder_path = output_folder_path
+
+    def set_pixel_type(self, pixel_type: str) -> None:
+        """Sets the pixel type of the beauty files."""
+        if pixel_type not in AOVBeautyEngine.PIXEL_TYPES:
+            raise AOVGraphError(f'Unsupported pixel type: {pixel_type}')
+
+        self.pixel_type = pixel_type
+
+    def set_use_index_cache(self, use_index_cache: bool) -> None:
+        """Sets if the render folders indices are read from and stored in the persistent cache."""
+        self.use_index_cache = use_index_cache
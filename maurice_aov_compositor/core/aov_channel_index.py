@@ -0,0 +1,106 @@
+"""
+========================================================================================================================
+Name: aov_channel_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+
+
+class AOVChannelIndex(object):
+    """AOV channel index.
+
+    Maps every layer of a file to the set of its channels suffixes, such as 'diffuse' to {'red', 'green', 'blue'}, from
+    Nuke channel names. The channels are split once when the index is built, the layers and channels are then looked
+    up in constant time by the discovery, the validation and the network builders, even for files with hundreds of
+    channels. The color, alpha and vector (x, y, z) suffixes are recognized in any case, the other suffixes are kept as
+    custom channels.
+    """
+    COLOR_SUFFIXES = frozenset(('red', 'green', 'blue'))
+    ALPHA_SUFFIX = 'alpha'
+    VECTOR_SUFFIXES = frozenset(('x', 'y', 'z'))
+
+    COLOR = 'color'
+    VECTOR = 'vector'
+    SCALAR = 'scalar'
+    CUSTOM = 'custom'
+
+    def __init__(self, channels: list = None):
+        """Initializes class attributes."""
+        self.layers = {}
+
+        for channel in channels or []:
+            self.add_channel(channel=channel)
+
+    def __contains__(self, layer: str) -> bool:
+        """Checks if the layer is in the index."""
+        return layer in self.layers
+
+    def __len__(self) -> int:
+        """Gets the number of layers."""
+        return len(self.layers)
+
+    def add_channel(self, channel: str) -> None:
+        """Adds a 'layer.suffix' channel, the channels without layer are skipped."""
+        layer, _, suffix = channel.partition('.')
+
+        if layer and suffix:
+            self.layers.setdefault(layer, set()).add(suffix)
+
+    def get_aovs(self, aovs: set) -> list:
+        """Gets the sorted AOVs that are layers of the index with color channels."""
+        return sorted(aov for aov in aovs if self.has_color_channels(layer=aov))
+
+    def get_channels(self, layer: str) -> set:
+        """Gets the suffixes of the channels of a layer."""
+        return self.layers.get(layer, set())
+
+    def get_custom_channels(self, layer: str) -> set:
+        """Gets the suffixes of the channels of a layer that are not color, alpha or vector channels."""
+        return {
+            suffix for suffix in self.get_channels(layer=layer)
+            if suffix not in self.COLOR_SUFFIXES and suffix != self.ALPHA_SUFFIX
+            and suffix.lower() not in self.VECTOR_SUFFIXES}
+
+    def get_layer_kind(self, layer: str) -> str:
+        """Gets the kind of a layer: color with red, green and blue channels, vector with x, y and z channels, scalar
+        with a single channel or custom.
+        """
+        if self.is_color_layer(layer=layer):
+            return AOVChannelIndex.COLOR
+
+        if self.is_vector_layer(layer=layer):
+            return AOVChannelIndex.VECTOR
+
+        if len(self.get_channels(layer=layer)) == 1:
+            return AOVChannelIndex.SCALAR
+
+        return AOVChannelIndex.CUSTOM
+
+    def get_layers(self) -> list:
+        """Gets the sorted layers."""
+        return sorted(self.layers)
+
+    def get_missing_color_channels(self, layer: str) -> list:
+        """Gets the red, green and blue channels the layer does not have."""
+        channels = self.get_channels(layer=layer)
+
+        return [suffix for suffix in ('red', 'green', 'blue') if suffix not in channels]
+
+    def has_alpha(self, layer: str) -> bool:
+        """Checks if the layer has an alpha channel."""
+        return self.ALPHA_SUFFIX in self.get_channels(layer=layer)
+
+    def has_color_channels(self, layer: str) -> bool:
+        """Checks if the layer has any of the red, green and blue channels."""
+        return not self.COLOR_SUFFIXES.isdisjoint(self.get_channels(layer=layer))
+
+    def is_color_layer(self, layer: str) -> bool:
+        """Checks if the layer has the red, green and blue channels."""
+        return self.COLOR_SUFFIXES <= self.get_channels(layer=layer)
+
+    def is_vector_layer(self, layer: str) -> bool:
+        """Checks if the layer has the x, y and z channels, in any case."""
+        return self.VECTOR_SUFFIXES <= {suffix.lower() for suffix in self.get_channels(layer=layer)}
@@ -0,0 +1,140 @@
+"""
+========================================================================================================================
+Name: aov_directory_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import os
+
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+class AOVDirectoryIndex(object):
+    """AOV directory index.
+
+    Lists a render folder once with os.scandir and groups its files by base name, AOV and frame. The file names are
+    parsed by an AOVNamingTemplate, '<base name>.<AOV>.exr' or '<base name>.<AOV>.<frame>.exr' by default, the files
+    without frame are stored with the frame None. The frames of an AOV are collapsed into an AOVSequence. The names of
+    the subfolders are kept for the recursive discovery. Once built, the index is queried without touching the file
+    system again.
+    """
+
+    def __init__(self, folder_path: str, naming_template: AOVNamingTemplate = None):
+        """Initializes class attributes."""
+        self.folder_path = folder_path.replace('\\', '/').rstrip('/')
+        self.naming_template = naming_template or AOVNamingTemplate()
+        self.renders = {}
+        self.folders_names = []
+        self.entries_count = 0
+
+    def __contains__(self, base_name: str) -> bool:
+        """Checks if the base name is in the index."""
+        return base_name in self.renders
+
+    def build(self) -> 'AOVDirectoryIndex':
+        """Lists the folder and indexes its files."""
+        self.renders = {}
+        self.folders_names = []
+        self.entries_count = 0
+
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                self.entries_count += 1
+
+                parsed_file_name = self.naming_template.parse(file_name=entry.name)
+
+                if parsed_file_name is not None and entry.is_file():
+                    self.add_file_name(file_name=entry.name, parsed_file_name=parsed_file_name)
+                elif entry.is_dir():
+                    self.folders_names.append(entry.name)
+
+        self.folders_names.sort()
+
+        return self
+
+    def add_file_name(self, file_name: str, parsed_file_name: tuple = None) -> None:
+        """Adds a file name to the index, the file names that are not AOV files are skipped."""
+        parsed_file_name = parsed_file_name or self.naming_template.parse(file_name=file_name)
+
+        if parsed_file_name is not None:
+            base_name, aov, frame = parsed_file_name
+            self.renders.setdefault(base_name, {}).setdefault(aov, {})[frame] = file_name
+
+    def load(self, files_names: list, entries_count: int, folders_names: list = None) -> 'AOVDirectoryIndex':
+        """Indexes the file names of a previous listing of the folder without listing it again."""
+        self.renders = {}
+        self.folders_names = sorted(folders_names or [])
+        self.entries_count = entries_count
+
+        for file_name in files_names:
+            self.add_file_name(file_name=file_name)
+
+        return self
+
+    def get_aovs(self, base_name: str) -> list:
+        """Gets the sorted AOVs of a base name."""
+        return sorted(self.renders.get(base_name, {}))
+
+    def get_base_names(self) -> list:
+        """Gets the sorted base names."""
+        return sorted(self.renders)
+
+    def get_file_path(self, base_name: str, aov: str, frame: int | None = None) -> str | None:
+        """Gets the path of the file of an AOV at a frame."""
+        file_name = self.renders.get(base_name, {}).get(aov, {}).get(frame)
+
+        return f'{self.folder_path}/{file_name}' if file_name else None
+
+    def get_files_names(self, base_name: str, aov: str) -> dict:
+        """Gets the file names of an AOV by frame."""
+        return self.renders.get(base_name, {}).get(aov, {})
+
+    def get_files_paths(self, base_name: str, aovs: set = None) -> list:
+        """Gets the (file path, AOV, frame range) files of a base name, only of the AOVs if given.
+
+        The AOVs with frames get their sequence pattern and (first frame, last frame) range, the other AOVs their
+        single file and no range.
+        """
+        files_paths = []
+
+        for aov in self.get_aovs(base_name=base_name):
+            if aovs is not None and aov not in aovs:
+                continue
+
+            sequence = self.get_sequence(base_name=base_name, aov=aov)
+
+            if sequence:
+                files_paths.append((sequence.get_pattern(), aov, sequence.get_frame_range()))
+            else:
+                files_paths.append((self.get_file_path(base_name=base_name, aov=aov), aov, None))
+
+        return files_paths
+
+    def get_all_files_names(self) -> list:
+        """Gets the names of every indexed file."""
+        return [
+            file_name for aovs in self.renders.values() for files_names in aovs.values()
+            for file_name in files_names.values()]
+
+    def get_folders_paths(self) -> list:
+        """Gets the sorted paths of the subfolders."""
+        return [f'{self.folder_path}/{folder_name}' for folder_name in self.folders_names]
+
+    def get_frames(self, base_name: str, aov: str) -> list:
+        """Gets the sorted frames of an AOV, without the None frame."""
+        return sorted(frame for frame in self.get_files_names(base_name=base_name, aov=aov) if frame is not None)
+
+    def get_sequence(self, base_name: str, aov: str) -> AOVSequence | None:
+        """Gets the sequence of the frames of an AOV, None if the AOV has no frames."""
+        sequence = AOVSequence(
+            folder_path=self.folder_path,
+            base_name=base_name,
+            aov=aov,
+            files_names=self.get_files_names(base_name=base_name, aov=aov),
+            naming_template=self.naming_template)
+
+        return sequence if len(sequence) else None
@@ -0,0 +1,409 @@
+"""
+========================================================================================================================
+Name: aov_exr_header.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import struct
+import io
+
+from maurice_aov_compositor.core.aov_channel_index import AOVChannelIndex
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+
+
+class AOVEXRHeaderError(AOVGraphError):
+    """AOV EXR header error."""
+
+
+class AOVEXRChannel(object):
+    """AOV EXR channel.
+
+    A channel of the channel list of an EXR part, such as 'diffuse.R', with its pixel type and sampling.
+    """
+    NUKE_SUFFIXES = {
+        'r': 'red', 'red': 'red',
+        'g': 'green', 'green': 'green',
+        'b': 'blue', 'blue': 'blue',
+        'a': 'alpha', 'alpha': 'alpha'}
+
+    def __init__(self, name: str, pixel_type: str, linear: bool = False, x_sampling: int = 1, y_sampling: int = 1):
+        """Initializes class attributes."""
+        self.name = name
+        self.pixel_type = pixel_type
+        self.linear = linear
+        self.x_sampling = x_sampling
+        self.y_sampling = y_sampling
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f'AOVEXRChannel({self.name!r}, {self.pixel_type!r})'
+
+    def get_layer(self) -> str:
+        """Gets the layer of the channel, the name before its last dot, empty for the channels without layer."""
+        return self.name.rpartition('.')[0]
+
+    def get_nuke_name(self, default_layer: str = '') -> str:
+        """Gets the name Nuke gives to the channel, such as 'diffuse.red' for 'diffuse.R'.
+
+        The dots of the layer are replaced by underscores, the red, green, blue and alpha channels without layer go to
+        the default layer or rgba, the Z channel without layer to depth and the other ones to the other layer.
+        """
+        layer, _, suffix = self.name.rpartition('.')
+        nuke_suffix = AOVEXRChannel.NUKE_SUFFIXES.get(suffix.lower(), suffix)
+
+        if not layer:
+            if default_layer:
+                layer = default_layer
+            elif nuke_suffix in AOVEXRChannel.NUKE_SUFFIXES.values():
+                layer = 'rgba'
+            elif suffix.lower() == 'z':
+                layer, nuke_suffix = 'depth', 'Z'
+            else:
+                layer = 'other'
+
+        return f'{layer.replace(".", "_")}.{nuke_suffix}'
+
+
+class AOVEXRPart(object):
+    """AOV EXR part.
+
+    The attributes of a part of an EXR file, a single part file has one. The structural attributes, channels,
+    compression, windows and tiles, are exposed as attributes, every attribute, metadata included, is kept in the
+    attributes dict.
+    """
+
+    def __init__(self, attributes: dict, tiled: bool = False):
+        """Initializes class attributes."""
+        self.attributes = attributes
+        self.name = attributes.get('name', '')
+        self.type = attributes.get('type', 'tiledimage' if tiled else 'scanlineimage')
+        self.channels = attributes.get('channels', [])
+        self.compression = AOVEXRHeader.COMPRESSIONS.get(attributes.get('compression'), 'unknown')
+        self.data_window = attributes.get('dataWindow')
+        self.display_window = attributes.get('displayWindow')
+        self.tiled = self.type in ('tiledimage', 'deeptile')
+        self.channel_index = None
+
+    def get_channel_index(self) -> AOVChannelIndex:
+        """Gets the channel index of the Nuke channels of the part, built on the first call."""
+        if self.channel_index is None:
+            self.channel_index = AOVChannelIndex(channels=self.get_nuke_channels())
+
+        return self.channel_index
+
+    def get_channels_names(self) -> list:
+        """Gets the names of the channels."""
+        return [channel.name for channel in self.channels]
+
+    def get_data_window_size(self) -> tuple:
+        """Gets the (width, height) of the data window."""
+        x_min, y_min, x_max, y_max = self.data_window
+
+        return x_max - x_min + 1, y_max - y_min + 1
+
+    def get_display_window_size(self) -> tuple:
+        """Gets the (width, height) of the display window."""
+        x_min, y_min, x_max, y_max = self.display_window
+
+        return x_max - x_min + 1, y_max - y_min + 1
+
+    def get_layers(self) -> list:
+        """Gets the sorted layers of the channels, without the empty layer."""
+        return sorted({channel.get_layer() for channel in self.channels} - {''})
+
+    def get_metadata(self) -> dict:
+        """Gets the attributes that are not required by the EXR format."""
+        return {key: value for key, value in self.attributes.items() if key not in AOVEXRHeader.REQUIRED_ATTRIBUTES}
+
+    def get_nuke_channels(self, default_layer: str = '') -> list:
+        """Gets the names Nuke gives to the channels, the channels without layer go to the default layer if given."""
+        return [channel.get_nuke_name(default_layer=default_layer) for channel in self.channels]
+
+    def get_pixel_types(self) -> dict:
+        """Gets the pixel type of every channel name."""
+        return {channel.name: channel.pixel_type for channel in self.channels}
+
+    def get_scanlines_per_chunk(self) -> int | None:
+        """Gets the number of scanlines compressed together in a chunk, None if the compression is unknown."""
+        return AOVEXRHeader.COMPRESSIONS_SCANLINES.get(self.compression)
+
+
+class AOVEXRHeader(object):
+    """AOV EXR header.
+
+    Reads the header of an EXR file without Nuke or the OpenEXR bindings: only the header bytes are read, a few
+    kilobytes, never the pixels. Single part, tiled, multipart and deep files are supported, every part is read into an
+    AOVEXRPart. The attributes of unknown types are kept as bytes.
+    """
+    MAGIC = 20000630
+
+    TILED_FLAG = 0x200
+    LONG_NAMES_FLAG = 0x400
+    DEEP_FLAG = 0x800
+    MULTIPART_FLAG = 0x1000
+
+    PIXEL_TYPES = {0: 'uint', 1: 'half', 2: 'float'}
+    PIXEL_TYPES_SIZES = {'uint': 4, 'half': 2, 'float': 4}
+
+    COMPRESSIONS = {
+        0: 'none', 1: 'rle', 2: 'zips', 3: 'zip', 4: 'piz', 5: 'pxr24', 6: 'b44', 7: 'b44a', 8: 'dwaa', 9: 'dwab',
+        10: 'htj2k'}
+
+    COMPRESSIONS_SCANLINES = {
+        'none': 1, 'rle': 1, 'zips': 1, 'zip': 16, 'piz': 32, 'pxr24': 16, 'b44': 32, 'b44a': 32, 'dwaa': 32,
+        'dwab': 256}
+
+    REQUIRED_ATTRIBUTES = (
+        'channels', 'compression', 'dataWindow', 'displayWindow', 'lineOrder', 'pixelAspectRatio',
+        'screenWindowCenter', 'screenWindowWidth', 'tiles', 'name', 'type', 'version', 'chunkCount')
+
+    ATTRIBUTES_STRUCTS = {
+        'int': struct.Struct('<i'),
+        'float': struct.Struct('<f'),
+        'double': struct.Struct('<d'),
+        'compression': struct.Struct('<B'),
+        'lineOrder': struct.Struct('<B'),
+        'envmap': struct.Struct('<B'),
+        'deepImageState': struct.Struct('<B'),
+        'box2i': struct.Struct('<4i'),
+        'box2f': struct.Struct('<4f'),
+        'v2i': struct.Struct('<2i'),
+        'v2f': struct.Struct('<2f'),
+        'v2d': struct.Struct('<2d'),
+        'v3i': struct.Struct('<3i'),
+        'v3f': struct.Struct('<3f'),
+        'v3d': struct.Struct('<3d'),
+        'm33f': struct.Struct('<9f'),
+        'm33d': struct.Struct('<9d'),
+        'm44f': struct.Struct('<16f'),
+        'm44d': struct.Struct('<16d'),
+        'rational': struct.Struct('<iI'),
+        'chromaticities': struct.Struct('<8f'),
+        'keycode': struct.Struct('<7i'),
+        'timecode': struct.Struct('<2I'),
+        'tiledesc': struct.Struct('<IIB')}
+
+    CHANNEL_STRUCT = struct.Struct('<iB3xii')
+    INT_STRUCT = struct.Struct('<i')
+
+    BUFFER_SIZE = 16 * 1024
+
+    def __init__(self, file_path: str):
+        """Initializes class attributes."""
+        self.file_path = file_path
+        self.version = 0
+        self.flags = 0
+        self.parts = []
+        self.channel_index = None
+        self.header_size = 0
+        self.data = b''
+
+    def load(self, data: bytes) -> 'AOVEXRHeader':
+        """Reads the header from the header bytes of a previous read, without opening the file."""
+        try:
+            self.read_file(file=io.BytesIO(data))
+        except struct.error as error:
+            raise AOVEXRHeaderError(f'Truncated EXR header: {self.file_path}') from error
+
+        self.data = data
+
+        return self
+
+    def read(self) -> 'AOVEXRHeader':
+        """Reads the header of the file, its bytes are kept so the header can be cached."""
+        try:
+            with open(self.file_path, 'rb', buffering=AOVEXRHeader.BUFFER_SIZE) as file:
+                self.read_file(file=file)
+
+                file.seek(0)
+                self.data = file.read(self.header_size)
+        except OSError as error:
+            raise AOVEXRHeaderError(f'Cannot read EXR file: {error}') from error
+        except struct.error as error:
+            raise AOVEXRHeaderError(f'Truncated EXR header: {self.file_path}') from error
+
+        return self
+
+    def read_file(self, file) -> None:
+        """Reads the header from an opened file."""
+        magic, version_field = struct.unpack('<ii', self.read_bytes(file=file, size=8))
+
+        if magic != AOVEXRHeader.MAGIC:
+            raise AOVEXRHeaderError(f'Not an EXR file: {self.file_path}')
+
+        self.version = version_field & 0xff
+        self.flags = version_field & ~0xff
+        self.parts = []
+        self.channel_index = None
+
+        while True:
+            attributes = self.read_attributes(file=file)
+
+            if not attributes:
+                break
+
+            self.parts.append(AOVEXRPart(attributes=attributes, tiled=bool(self.flags & AOVEXRHeader.TILED_FLAG)))
+
+            if not self.is_multipart():
+                break
+
+        if not self.parts:
+            raise AOVEXRHeaderError(f'EXR file without header: {self.file_path}')
+
+        self.header_size = file.tell()
+
+    def read_attributes(self, file) -> dict:
+        """Reads the attributes of a part up to the null byte that ends them."""
+        attributes = {}
+
+        while True:
+            name = self.read_string(file=file)
+
+            if not name:
+                return attributes
+
+            attribute_type = self.read_string(file=file)
+            size = AOVEXRHeader.INT_STRUCT.unpack(self.read_bytes(file=file, size=4))[0]
+            attributes[name] = self.parse_attribute(
+                attribute_type=attribute_type,
+                data=self.read_bytes(file=file, size=size))
+
+    def read_bytes(self, file, size: int) -> bytes:
+        """Reads bytes, the header is truncated if fewer bytes are read."""
+        data = file.read(size)
+
+        if len(data) != size:
+            raise AOVEXRHeaderError(f'Truncated EXR header: {self.file_path}')
+
+        return data
+
+    def read_string(self, file) -> str:
+        """Reads a null terminated string."""
+        characters = bytearray()
+
+        while True:
+            character = self.read_bytes(file=file, size=1)
+
+            if character == b'\0':
+                return characters.decode('utf-8', errors='replace')
+
+            characters += character
+
+    def parse_attribute(self, attribute_type: str, data: bytes) -> object:
+        """Parses the value of an attribute, the values of unknown types are kept as bytes."""
+        if attribute_type == 'chlist':
+            return self.parse_channels(data=data)
+        elif attribute_type == 'string':
+            return data.decode('utf-8', errors='replace')
+        elif attribute_type == 'stringvector':
+            return self.parse_strings(data=data)
+        elif attribute_type == 'preview':
+            return struct.unpack_from('<II', data)
+
+        attribute_struct = AOVEXRHeader.ATTRIBUTES_STRUCTS.get(attribute_type)
+
+        if attribute_struct is None or attribute_struct.size != len(data):
+            return data
+
+        values = attribute_struct.unpack(data)
+
+        return values[0] if len(values) == 1 else values
+
+    def parse_channels(self, data: bytes) -> list:
+        """Parses a channel list."""
+        channels = []
+        offset = 0
+
+        while offset < len(data) and data[offset] != 0:
+            name_end = data.find(b'\0', offset)
+
+            if name_end < 0:
+                raise AOVEXRHeaderError(f'Corrupted EXR channel list: {self.file_path}')
+
+            name = data[offset:name_end].decode('utf-8', errors='replace')
+            pixel_type, linear, x_sampling, y_sampling = AOVEXRHeader.CHANNEL_STRUCT.unpack_from(data, name_end + 1)
+            offset = name_end + 1 + AOVEXRHeader.CHANNEL_STRUCT.size
+
+            channels.append(AOVEXRChannel(
+                name=name,
+                pixel_type=AOVEXRHeader.PIXEL_TYPES.get(pixel_type, 'unknown'),
+                linear=bool(linear),
+                x_sampling=x_sampling,
+                y_sampling=y_sampling))
+
+        return channels
+
+    @staticmethod
+    def parse_strings(data: bytes) -> list:
+        """Parses a string vector."""
+        strings = []
+        offset = 0
+
+        while offset < len(data):
+            size = AOVEXRHeader.INT_STRUCT.unpack_from(data, offset)[0]
+            offset += 4
+            strings.append(data[offset:offset + size].decode('utf-8', errors='replace'))
+            offset += size
+
+        return strings
+
+    def get_channel_index(self) -> AOVChannelIndex:
+        """Gets the channel index of the Nuke channels of every part, built on the first call and shared by every user
+        of the cached header.
+        """
+        if self.channel_index is None:
+            self.channel_index = AOVChannelIndex(channels=self.get_nuke_channels())
+
+        return self.channel_index
+
+    def get_channels(self) -> list:
+        """Gets the channels of every part."""
+        return [channel for part in self.parts for channel in part.channels]
+
+    def get_data_windows(self) -> list:
+        """Gets the (x min, y min, x max, y max) data window of every part."""
+        return [part.data_window for part in self.parts if part.data_window]
+
+    def get_display_window(self) -> tuple | None:
+        """Gets the (x min, y min, x max, y max) display window of the first part, the format of the file."""
+        part = self.get_part()
+
+        return part.display_window if part else None
+
+    def get_layers(self) -> list:
+        """Gets the sorted layers of every part."""
+        return sorted({layer for part in self.parts for layer in part.get_layers()})
+
+    def get_nuke_channels(self) -> list:
+        """Gets the names Nuke gives to the channels of every part."""
+        return [
+            channel for i, part in enumerate(self.parts)
+            for channel in part.get_nuke_channels(default_layer=self.get_part_default_layer(index=i))]
+
+    def get_part_default_layer(self, index: int) -> str:
+        """Gets the layer of the channels without layer of a part, the name of the part for every part of a multipart
+        file but the first one, whose channels without layer stay in rgba.
+        """
+        return self.parts[index].name if self.is_multipart() and index else ''
+
+    def get_part(self, name: str = '') -> AOVEXRPart | None:
+        """Gets a part by name, the first part without name."""
+        if not name:
+            return self.parts[0] if self.parts else None
+
+        return next((part for part in self.parts if part.name == name), None)
+
+    def is_deep(self) -> bool:
+        """Checks if the file has deep data."""
+        return bool(self.flags & AOVEXRHeader.DEEP_FLAG) or any(part.type.startswith('deep') for part in self.parts)
+
+    def is_multipart(self) -> bool:
+        """Checks if the file has several parts."""
+        return bool(self.flags & AOVEXRHeader.MULTIPART_FLAG)
+
+    def is_tiled(self) -> bool:
+        """Checks if every part is tiled."""
+        return bool(self.parts) and all(part.tiled for part in self.parts)
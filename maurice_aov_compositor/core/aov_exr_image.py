@@ -0,0 +1,413 @@
+"""
+========================================================================================================================
+Name: aov_exr_image.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import struct
+import zlib
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeader
+
+
+def check_numpy() -> None:
+    """Raises AOVEXRHeaderError if NumPy, needed to read and write the EXR pixels, is not installed."""
+    if np is None:
+        raise AOVEXRHeaderError('Reading and writing EXR pixels needs NumPy.')
+
+
+class AOVEXRScanlineCodec(object):
+    """AOV EXR scanline codec.
+
+    Decompresses and compresses the pixel data of the scanline chunks with the NONE, RLE, ZIPS and ZIP compressions,
+    the lossless compressions without a wavelet or block transform. RLE and ZIP store the bytes reordered, the even
+    bytes then the odd ones, and delta encoded, both are undone with vectorized NumPy operations.
+    """
+    SUPPORTED_COMPRESSIONS = ('none', 'rle', 'zips', 'zip')
+
+    ZLIB_LEVEL = 4
+
+    def __init__(self, compression: str):
+        """Initializes class attributes."""
+        if compression not in AOVEXRScanlineCodec.SUPPORTED_COMPRESSIONS:
+            raise AOVEXRHeaderError(f'Unsupported EXR compression: {compression.upper()}')
+
+        self.compression = compression
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses the pixel data of a chunk, the data is stored raw if it does not get smaller."""
+        if self.compression == 'none':
+            return data
+
+        pixels = np.frombuffer(data, dtype=np.uint8)
+        predicted = np.concatenate((pixels[0::2], pixels[1::2]))
+        predicted[1:] = np.diff(predicted) + np.uint8(128)
+
+        if self.compression == 'rle':
+            compressed_data = self.encode_rle(data=predicted.tobytes())
+        else:
+            compressed_data = zlib.compress(predicted.tobytes(), AOVEXRScanlineCodec.ZLIB_LEVEL)
+
+        return compressed_data if len(compressed_data) < len(data) else data
+
+    def decompress(self, data: bytes, size: int) -> bytes:
+        """Decompresses the pixel data of a chunk to its size, the data of that size was stored raw."""
+        if self.compression == 'none' or len(data) == size:
+            return data
+
+        try:
+            if self.compression == 'rle':
+                data = self.decode_rle(data=data)
+            else:
+                data = zlib.decompress(data)
+        except (zlib.error, IndexError) as error:
+            raise AOVEXRHeaderError(f'Corrupted {self.compression.upper()} chunk: {error}') from error
+
+        if len(data) != size:
+            raise AOVEXRHeaderError(f'Corrupted {self.compression.upper()} chunk: {len(data)} bytes, {size} expected')
+
+        predicted = np.frombuffer(data, dtype=np.uint8).copy()
+        predicted[1:] -= np.uint8(128)
+        reordered = np.cumsum(predicted, dtype=np.uint8)
+
+        pixels = np.empty_like(reordered)
+        half_size = (size + 1) // 2
+        pixels[0::2] = reordered[:half_size]
+        pixels[1::2] = reordered[half_size:]
+
+        return pixels.tobytes()
+
+    @staticmethod
+    def decode_rle(data: bytes) -> bytes:
+        """Decodes run length encoded bytes: a negative count is followed by as many literal bytes, a positive count by
+        a byte repeated count + 1 times.
+        """
+        decoded_data = bytearray()
+        i = 0
+
+        while i < len(data):
+            count = data[i]
+
+            if count > 127:
+                count = 256 - count
+                decoded_data += data[i + 1:i + 1 + count]
+                i += 1 + count
+            else:
+                decoded_data += data[i + 1:i + 2] * (count + 1)
+                i += 2
+
+        return bytes(decoded_data)
+
+    @staticmethod
+    def encode_rle(data: bytes) -> bytes:
+        """Encodes bytes as runs of at least three repeated bytes and literal sequences, up to 128 and 127 bytes."""
+        encoded_data = bytearray()
+        data_size = len(data)
+        i = 0
+
+        while i < data_size:
+            run_end = i + 1
+
+            while run_end < data_size and data[run_end] == data[i] and run_end - i - 1 < 127:
+                run_end += 1
+
+            if run_end - i >= 3:
+                encoded_data.append(run_end - i - 1)
+                encoded_data.append(data[i])
+            else:
+                while run_end < data_size and run_end - i < 127 and (
+                        run_end + 1 >= data_size or data[run_end] != data[run_end + 1]
+                        or run_end + 2 >= data_size or data[run_end + 1] != data[run_end + 2]):
+                    run_end += 1
+
+                encoded_data.append(256 - (run_end - i))
+                encoded_data += data[i:run_end]
+
+            i = run_end
+
+        return bytes(encoded_data)
+
+
+class AOVEXRScanlineReader(object):
+    """AOV EXR scanline reader.
+
+    Reads the pixels of a single part scanline EXR file block by block, a block of scanlines only decodes the chunks
+    that hold it, so a frame is never loaded whole. The channels of every scanline are returned as the fields of a
+    NumPy structured array, with their EXR pixel type.
+    """
+    DTYPES = {'uint': '<u4', 'half': '<f2', 'float': '<f4'}
+
+    CHUNK_STRUCT = struct.Struct('<ii')
+
+    def __init__(self, file_path: str):
+        """Initializes class attributes."""
+        self.file_path = file_path
+        self.header = None
+        self.part = None
+        self.codec = None
+        self.file = None
+        self.offsets = None
+        self.line_dtype = None
+        self.scanlines_per_chunk = 1
+        self.chunk_index = None
+        self.chunk = None
+
+    def __enter__(self) -> 'AOVEXRScanlineReader':
+        """Opens the file."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the file."""
+        if self.file is not None:
+            self.file.close()
+
+            self.file = None
+
+    def get_channels_names(self, layer: str) -> dict:
+        """Gets the EXR channel names of the Nuke channel suffixes of a layer, such as 'red' to 'R' for rgba."""
+        channels_names = {}
+
+        for channel in self.part.channels:
+            channel_layer, _, suffix = channel.get_nuke_name().partition('.')
+
+            if channel_layer == layer:
+                channels_names[suffix] = channel.name
+
+        return channels_names
+
+    def open(self) -> 'AOVEXRScanlineReader':
+        """Opens the file and reads its header and chunks offsets.
+
+        Raises AOVEXRHeaderError if the file cannot be read or is not a supported scanline file.
+        """
+        check_numpy()
+
+        self.header = AOVEXRHeader(file_path=self.file_path).read()
+
+        if self.header.is_multipart() or self.header.is_deep() or self.header.is_tiled():
+            raise AOVEXRHeaderError(f'Only single part scanline EXR files are supported: {self.file_path}')
+
+        self.part = self.header.get_part()
+        self.codec = AOVEXRScanlineCodec(compression=self.part.compression)
+
+        if any(channel.x_sampling != 1 or channel.y_sampling != 1 for channel in self.part.channels):
+            raise AOVEXRHeaderError(f'Subsampled channels are not supported: {self.file_path}')
+
+        width, height = self.part.get_data_window_size()
+        self.scanlines_per_chunk = self.part.get_scanlines_per_chunk()
+        self.line_dtype = np.dtype([
+            (channel.name, AOVEXRScanlineReader.DTYPES[channel.pixel_type], (width,))
+            for channel in self.part.channels])
+
+        chunks_count = (height + self.scanlines_per_chunk - 1) // self.scanlines_per_chunk
+
+        try:
+            self.file = open(self.file_path, 'rb')
+            self.file.seek(self.header.header_size)
+            self.offsets = np.frombuffer(self.file.read(chunks_count * 8), dtype='<u8')
+        except OSError as error:
+            self.close()
+
+            raise AOVEXRHeaderError(f'Cannot read EXR file: {error}') from error
+
+        if len(self.offsets) != chunks_count:
+            self.close()
+
+            raise AOVEXRHeaderError(f'Truncated EXR offsets table: {self.file_path}')
+
+        return self
+
+    def read_chunk(self, chunk_index: int) -> 'np.ndarray':
+        """Reads and decodes the scanlines of a chunk, the last chunk read is kept for the next block."""
+        if chunk_index == self.chunk_index:
+            return self.chunk
+
+        _, y_min, _, y_max = self.part.data_window
+        chunk_y = y_min + chunk_index * self.scanlines_per_chunk
+        lines_count = min(self.scanlines_per_chunk, y_max - chunk_y + 1)
+
+        self.file.seek(int(self.offsets[chunk_index]))
+        data_y, data_size = AOVEXRScanlineReader.CHUNK_STRUCT.unpack(self.file.read(8))
+
+        if data_y != chunk_y:
+            raise AOVEXRHeaderError(f'Corrupted EXR chunk at scanline {chunk_y}: {self.file_path}')
+
+        data = self.codec.decompress(data=self.file.read(data_size), size=lines_count * self.line_dtype.itemsize)
+
+        self.chunk_index = chunk_index
+        self.chunk = np.frombuffer(data, dtype=self.line_dtype, count=lines_count)
+
+        return self.chunk
+
+    def read_lines(self, y_start: int, y_end: int) -> tuple | None:
+        """Reads the scanlines from y start to y end, excluded, clipped to the data window, and returns their (first
+        scanline, lines), None if the data window has none of them.
+        """
+        _, y_min, _, y_max = self.part.data_window
+        y_start = max(y_start, y_min)
+        y_end = min(y_end, y_max + 1)
+
+        if y_start >= y_end:
+            return None
+
+        first_chunk_index = (y_start - y_min) // self.scanlines_per_chunk
+        last_chunk_index = (y_end - 1 - y_min) // self.scanlines_per_chunk
+        chunks = [self.read_chunk(chunk_index=i) for i in range(first_chunk_index, last_chunk_index + 1)]
+        lines = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        first_line = y_start - y_min - first_chunk_index * self.scanlines_per_chunk
+
+        return y_start, lines[first_line:first_line + y_end - y_start]
+
+
+class AOVEXRScanlineWriter(object):
+    """AOV EXR scanline writer.
+
+    Writes a single part scanline EXR file block by block: the scanlines are buffered until a chunk is complete, then
+    compressed and written, the chunks offsets table is written when the file is closed.
+    """
+    PIXEL_TYPES_CODES = {pixel_type: code for code, pixel_type in AOVEXRHeader.PIXEL_TYPES.items()}
+    COMPRESSIONS_CODES = {compression: code for code, compression in AOVEXRHeader.COMPRESSIONS.items()}
+
+    CHUNK_STRUCT = struct.Struct('<ii')
+
+    VERSION = 2
+
+    def __init__(self, file_path: str, channels_names: list, data_window: tuple, display_window: tuple,
+                 pixel_type: str = 'half', compression: str = 'zip'):
+        """Initializes class attributes."""
+        self.file_path = file_path
+        self.channels_names = sorted(channels_names)
+        self.data_window = tuple(data_window)
+        self.display_window = tuple(display_window)
+        self.pixel_type = pixel_type
+        self.compression = compression
+        self.codec = AOVEXRScanlineCodec(compression=compression)
+        self.scanlines_per_chunk = AOVEXRHeader.COMPRESSIONS_SCANLINES[compression]
+        self.file = None
+        self.offsets = []
+        self.offsets_position = 0
+        self.line_dtype = None
+        self.lines = []
+        self.y = data_window[1]
+
+    def __enter__(self) -> 'AOVEXRScanlineWriter':
+        """Opens the file."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the file, a file that failed is left incomplete."""
+        if exc_type is None:
+            self.close()
+        elif self.file is not None:
+            self.file.close()
+
+            self.file = None
+
+    def close(self) -> None:
+        """Writes the buffered scanlines and the chunks offsets table, and closes the file."""
+        if self.file is None:
+            return
+
+        self.write_chunks(flush=True)
+
+        y_max = self.data_window[3]
+
+        if self.y != y_max + 1:
+            raise AOVEXRHeaderError(f'{y_max + 1 - self.y} scanlines were not written: {self.file_path}')
+
+        self.file.seek(self.offsets_position)
+        self.file.write(np.array(self.offsets, dtype='<u8').tobytes())
+        self.file.close()
+
+        self.file = None
+
+    def get_header_data(self) -> bytes:
+        """Gets the header bytes of the file."""
+        channels_data = b''.join(
+            channel_name.encode('utf-8') + b'\0' + struct.pack(
+                '<iB3xii', AOVEXRScanlineWriter.PIXEL_TYPES_CODES[self.pixel_type], 0, 1, 1)
+            for channel_name in self.channels_names) + b'\0'
+
+        attributes = (
+            ('channels', 'chlist', channels_data),
+            ('compression', 'compression', bytes([AOVEXRScanlineWriter.COMPRESSIONS_CODES[self.compression]])),
+            ('dataWindow', 'box2i', struct.pack('<4i', *self.data_window)),
+            ('displayWindow', 'box2i', struct.pack('<4i', *self.display_window)),
+            ('lineOrder', 'lineOrder', b'\0'),
+            ('pixelAspectRatio', 'float', struct.pack('<f', 1.0)),
+            ('screenWindowCenter', 'v2f', struct.pack('<2f', 0.0, 0.0)),
+            ('screenWindowWidth', 'float', struct.pack('<f', 1.0)))
+
+        data = struct.pack('<ii', AOVEXRHeader.MAGIC, AOVEXRScanlineWriter.VERSION)
+
+        for name, attribute_type, value in attributes:
+            data += name.encode('utf-8') + b'\0' + attribute_type.encode('utf-8') + b'\0'
+            data += struct.pack('<i', len(value)) + value
+
+        return data + b'\0'
+
+    def open(self) -> 'AOVEXRScanlineWriter':
+        """Opens the file and writes its header, the chunks offsets table is reserved."""
+        check_numpy()
+
+        x_min, y_min, x_max, y_max = self.data_window
+        width = x_max - x_min + 1
+        height = y_max - y_min + 1
+        chunks_count = (height + self.scanlines_per_chunk - 1) // self.scanlines_per_chunk
+
+        self.line_dtype = np.dtype([
+            (channel_name, AOVEXRScanlineReader.DTYPES[self.pixel_type], (width,))
+            for channel_name in self.channels_names])
+
+        try:
+            self.file = open(self.file_path, 'wb')
+            self.file.write(self.get_header_data())
+            self.offsets_position = self.file.tell()
+            self.file.write(b'\0' * 8 * chunks_count)
+        except OSError as error:
+            raise AOVEXRHeaderError(f'Cannot write EXR file: {error}') from error
+
+        return self
+
+    def write_chunks(self, flush: bool = False) -> None:
+        """Writes the complete chunks of the buffered scanlines, and the last incomplete one if flushed."""
+        if not self.lines:
+            return
+
+        lines = self.lines[0] if len(self.lines) == 1 else np.concatenate(self.lines)
+        chunks_end = len(lines) if flush else len(lines) - len(lines) % self.scanlines_per_chunk
+
+        for i in range(0, chunks_end, self.scanlines_per_chunk):
+            data = self.codec.compress(data=lines[i:i + self.scanlines_per_chunk].tobytes())
+
+            self.offsets.append(self.file.tell())
+            self.file.write(AOVEXRScanlineWriter.CHUNK_STRUCT.pack(self.y, len(data)))
+            self.file.write(data)
+
+            self.y += min(self.scanlines_per_chunk, len(lines) - i)
+
+        self.lines = [lines[chunks_end:]] if chunks_end < len(lines) else []
+
+    def write_lines(self, channels: dict) -> None:
+        """Writes the next scanlines from the (lines, width) array of every channel name."""
+        lines_count = len(next(iter(channels.values())))
+        lines = np.empty(lines_count, dtype=self.line_dtype)
+
+        for channel_name in self.channels_names:
+            lines[channel_name] = channels[channel_name]
+
+        self.lines.append(lines)
+        self.write_chunks()
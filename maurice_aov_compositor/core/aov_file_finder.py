@@ -0,0 +1,245 @@
+"""
+========================================================================================================================
+Name: aov_file_finder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import re
+
+from maurice_aov_compositor.core.aov_directory_index import AOVDirectoryIndex
+from maurice_aov_compositor.core.aov_graph import AOVGraphCancelled
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVFileFinder(object):
+    """AOV file finder.
+
+    Finds the AOV files of a render on disk without importing nuke. The AOV files sit in the same folder and are named
+    after an AOVNamingTemplate, '<base name>.<AOV>.exr' or '<base name>.<AOV>.<frame>.exr' by default. Only the AOVs
+    of the AOVs settings are kept, looked up in a set. Every folder is listed once into an AOVDirectoryIndex that is
+    reused by the next queries until it is refreshed, and with an AOVIndexCache the indices are also reused across
+    sessions while their folder is unchanged.
+
+    The render layers, and sometimes every AOV, can be written to their own subfolders: the subfolders are searched
+    down to the maximum depth, one level at a time with the folders of a level listed concurrently by a thread pool,
+    and the files of a render found in several folders are merged by base name.
+    """
+    MAX_DEPTH = 2
+
+    FRAME_RANGE_PATTERN = re.compile(r' \d+-\d+$')
+
+    def __init__(self, aovs_settings: dict = None, index_cache: AOVIndexCache = None,
+                 naming_template: AOVNamingTemplate = None):
+        """Initializes class attributes."""
+        self.aovs_settings = aovs_settings or {}
+        self.aovs = set(self.aovs_settings.values())
+        self.index_cache = index_cache
+        self.naming_template = naming_template or AOVNamingTemplate()
+        self.max_depth = AOVFileFinder.MAX_DEPTH
+        self.max_workers = None
+        self.indices = {}
+
+    def find_files_paths(self, target_file_path: str, progress: callable = None) -> list:
+        """Finds the (file path, AOV, frame range) files of the render the target file belongs to.
+
+        The target file is a file of the render or one of its sequences, as a '####' pattern with or without range.
+        The render is searched in the folder of the target file and its subfolders, or from the parent folder when the
+        folder of the target file is named after its AOV. The progress is called with the (value, maximum, text) of
+        every listed folder and can raise AOVGraphCancelled.
+        """
+        target_file_path = self.FRAME_RANGE_PATTERN.sub('', target_file_path).replace('\\', '/')
+        folder_path = os.path.dirname(target_file_path)
+        parsed_file_name = self.naming_template.parse(file_name=os.path.basename(target_file_path))
+
+        if parsed_file_name is None:
+            return []
+
+        base_name, aov, _ = parsed_file_name
+        max_depth = self.max_depth
+
+        if os.path.basename(folder_path).lower() == aov.lower():
+            folder_path = os.path.dirname(folder_path)
+            max_depth = max(max_depth, 1)
+
+        return self.get_renders(folder_path=folder_path, max_depth=max_depth, progress=progress).get(base_name, [])
+
+    def get_index(self, folder_path: str, refresh: bool = False) -> AOVDirectoryIndex:
+        """Gets the index of a folder, it is built the first time or when refreshed."""
+        folder_path = folder_path.replace('\\', '/').rstrip('/')
+
+        if refresh or folder_path not in self.indices:
+            if self.index_cache is not None:
+                self.indices[folder_path] = self.index_cache.get_index(
+                    folder_path=folder_path,
+                    naming_template=self.naming_template,
+                    refresh=refresh)
+            else:
+                self.indices[folder_path] = AOVDirectoryIndex(
+                    folder_path=folder_path,
+                    naming_template=self.naming_template).build()
+
+        return self.indices[folder_path]
+
+    def get_indices(self, folder_path: str, max_depth: int = None, progress: callable = None) -> list:
+        """Gets the indices of a folder and of its subfolders down to the maximum depth, shallowest first.
+
+        The folders of every level are listed concurrently, the subfolders that cannot be listed are skipped. The
+        progress is called with the (value, maximum, text) of every listed folder of a level, the folders not listed
+        yet are cancelled if it raises AOVGraphCancelled.
+        """
+        max_depth = self.max_depth if max_depth is None else max_depth
+
+        if progress is not None:
+            progress(0, 1, f'Listing {folder_path}')
+
+        indices = [self.get_index(folder_path=folder_path)]
+        folders_paths = indices[0].get_folders_paths()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in range(max_depth):
+                if not folders_paths:
+                    break
+
+                futures = [executor.submit(self.get_index, folder_path) for folder_path in folders_paths]
+                folders_paths = []
+
+                try:
+                    for i, future in enumerate(futures):
+                        try:
+                            index = future.result()
+                        except OSError as error:
+                            logger.warning('Skipped subfolder: %s', error)
+
+                            continue
+
+                        indices.append(index)
+                        folders_paths.extend(index.get_folders_paths())
+
+                        if progress is not None:
+                            progress(i + 1, len(futures), f'Listing {index.folder_path}')
+                except AOVGraphCancelled:
+                    executor.shutdown(cancel_futures=True)
+
+                    raise
+
+        return indices
+
+    def get_folders_paths(self) -> list:
+        """Gets the sorted paths of the indexed folders."""
+        return sorted(self.indices)
+
+    def get_renders(self, folder_path: str, max_depth: int = None, progress: callable = None) -> dict:
+        """Gets the (file path, AOV, frame range) files of every render in the folder and its subfolders by base name.
+
+        An AOV found in several folders is taken from the shallowest one. The progress is called with the (value,
+        maximum, text) of every listed folder and can raise AOVGraphCancelled.
+        """
+        renders = {}
+
+        for index in self.get_indices(folder_path=folder_path, max_depth=max_depth, progress=progress):
+            for base_name in index.get_base_names():
+                render = renders.setdefault(base_name, {})
+
+                for file_path, aov, frame_range in index.get_files_paths(base_name=base_name, aovs=self.aovs):
+                    if aov in render:
+                        logger.warning('Skipped duplicate %s AOV of %s: %s.', aov, base_name, file_path)
+
+                        continue
+
+                    if frame_range:
+                        self.log_missing_frames(sequence=index.get_sequence(base_name=base_name, aov=aov))
+
+                    render[aov] = (file_path, aov, frame_range)
+
+        return {base_name: [render[aov] for aov in sorted(render)] for base_name, render in renders.items() if render}
+
+    def get_base_name(self, file_name: str) -> str:
+        """Gets the base name of an AOV file name."""
+        parsed_file_name = self.naming_template.parse(file_name=file_name)
+
+        return parsed_file_name[0] if parsed_file_name else ''
+
+    def get_network_id(self, files_paths: list) -> str:
+        """Gets the network ID of the (file path, AOV, frame range) files of a render, their common folder and base
+        name.
+        """
+        folder_path = os.path.commonpath([os.path.dirname(file_path) for file_path, _, _ in files_paths])
+        base_name = self.get_base_name(file_name=os.path.basename(files_paths[0][0]))
+
+        return f'{folder_path}/{base_name}'.replace('\\', '/')
+
+    @staticmethod
+    def log_missing_frames(sequence: AOVSequence) -> None:
+        """Logs the frames missing from a sequence."""
+        missing_frames = sequence.get_missing_frames()
+
+        if missing_frames:
+            logger.warning(
+                'Missing %d frames in %s: %s%s.',
+                len(missing_frames),
+                sequence.get_pattern(),
+                ', '.join(str(frame) for frame in missing_frames[:10]),
+                ', ...' if len(missing_frames) > 10 else '')
+
+    def refresh(self) -> None:
+        """Forgets the indices, the folders are listed again by the next queries."""
+        self.indices = {}
+
+    def refresh_folders(self, folders_paths: list) -> list:
+        """Lists the folders again and gets the paths of the AOV files and subfolders added since they were indexed.
+
+        The folders that cannot be listed anymore are forgotten.
+        """
+        added_paths = []
+
+        for folder_path in folders_paths:
+            folder_path = folder_path.replace('\\', '/').rstrip('/')
+            index = self.indices.get(folder_path)
+            names = set(index.get_all_files_names() + index.folders_names) if index is not None else set()
+
+            try:
+                index = self.get_index(folder_path=folder_path, refresh=True)
+            except OSError as error:
+                logger.warning('Cannot refresh folder: %s', error)
+                self.indices.pop(folder_path, None)
+
+                continue
+
+            added_paths.extend(
+                f'{folder_path}/{name}' for name in sorted(index.get_all_files_names() + index.folders_names)
+                if name not in names)
+
+        return added_paths
+
+    def set_index_cache(self, index_cache: AOVIndexCache | None) -> None:
+        """Sets the persistent index cache, None lists the folders once per finder."""
+        self.index_cache = index_cache
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets the maximum depth of the subfolders searched, 0 searches only the folder."""
+        self.max_depth = max_depth
+
+    def set_max_workers(self, max_workers: int | None) -> None:
+        """Sets the maximum number of threads listing the subfolders, None uses the thread pool default."""
+        self.max_workers = max_workers
+
+    def set_aovs_settings(self, aovs: dict) -> None:
+        """Sets AOVs settings."""
+        self.aovs_settings = aovs
+        self.aovs = set(aovs.values())
+
+    def set_naming_template(self, naming_template: AOVNamingTemplate) -> None:
+        """Sets the naming template, the folders are indexed again by the next queries."""
+        self.naming_template = naming_template
+        self.indices = {}
@@ -0,0 +1,164 @@
+"""
+========================================================================================================================
+Name: aov_folder_watcher.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import ctypes.util
+import logging
+import ctypes
+import struct
+import sys
+import os
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVFolderWatcher(object):
+    """AOV folder watcher.
+
+    Watches render folders while the render is still writing them, without blocking: every poll compares the
+    modification time of the folders, a single stat each, which changes when a file is added, removed or renamed. Where
+    inotify is available, on Linux, the events of the folders are also read so a change within the timestamp resolution
+    of a folder is not missed. Render farms writing to network storage do not send inotify events, so the modification
+    time is always compared.
+    """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_IGNORED = 0x00008000
+    IN_Q_OVERFLOW = 0x00004000
+
+    INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    INOTIFY_EVENT = struct.Struct('iIII')
+    INOTIFY_BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, use_inotify: bool = True):
+        """Initializes class attributes."""
+        self.folders_mtimes = {}
+        self.watch_descriptors = {}
+        self.inotify_fd = None
+        self.libc = None
+
+        if use_inotify:
+            self.init_inotify()
+
+    def __contains__(self, folder_path: str) -> bool:
+        """Checks if the folder is watched."""
+        return folder_path in self.folders_mtimes
+
+    def __len__(self) -> int:
+        """Gets the number of watched folders."""
+        return len(self.folders_mtimes)
+
+    def add_folder(self, folder_path: str) -> None:
+        """Watches a folder, the folders already watched are skipped."""
+        if folder_path in self.folders_mtimes:
+            return
+
+        try:
+            self.folders_mtimes[folder_path] = os.stat(folder_path).st_mtime_ns
+        except OSError as error:
+            logger.warning('Cannot watch folder: %s', error)
+
+            return
+
+        if self.inotify_fd is not None:
+            watch_descriptor = self.libc.inotify_add_watch(
+                self.inotify_fd, os.fsencode(folder_path), AOVFolderWatcher.INOTIFY_MASK)
+
+            if watch_descriptor >= 0:
+                self.watch_descriptors[watch_descriptor] = folder_path
+
+    def add_folders(self, folders_paths: list) -> None:
+        """Watches folders."""
+        for folder_path in folders_paths:
+            self.add_folder(folder_path=folder_path)
+
+    def close(self) -> None:
+        """Stops watching every folder."""
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+
+            self.inotify_fd = None
+
+        self.folders_mtimes = {}
+        self.watch_descriptors = {}
+
+    def init_inotify(self) -> None:
+        """Initializes a non-blocking inotify instance, the folders are only polled if inotify is unavailable."""
+        if not sys.platform.startswith('linux'):
+            return
+
+        try:
+            self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            inotify_fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as error:
+            logger.debug('inotify unavailable: %s', error)
+
+            return
+
+        if inotify_fd >= 0:
+            self.inotify_fd = inotify_fd
+
+    def poll(self) -> list:
+        """Gets the sorted folders that changed since the last poll, without blocking."""
+        changed_folders_paths = set(self.read_inotify_events())
+
+        for folder_path, mtime_ns in list(self.folders_mtimes.items()):
+            try:
+                folder_mtime_ns = os.stat(folder_path).st_mtime_ns
+            except OSError:
+                logger.info('Stopped watching removed folder: %s', folder_path)
+                self.remove_folder(folder_path=folder_path)
+
+                continue
+
+            if folder_mtime_ns != mtime_ns:
+                self.folders_mtimes[folder_path] = folder_mtime_ns
+                changed_folders_paths.add(folder_path)
+
+        return sorted(changed_folders_paths)
+
+    def read_inotify_events(self) -> list:
+        """Gets the folders of the pending inotify events, every folder if the events queue overflowed."""
+        if self.inotify_fd is None:
+            return []
+
+        folders_paths = []
+
+        while True:
+            try:
+                buffer = os.read(self.inotify_fd, AOVFolderWatcher.INOTIFY_BUFFER_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+
+            while offset < len(buffer):
+                watch_descriptor, mask, _, name_length = AOVFolderWatcher.INOTIFY_EVENT.unpack_from(buffer, offset)
+                offset += AOVFolderWatcher.INOTIFY_EVENT.size + name_length
+
+                if mask & AOVFolderWatcher.IN_Q_OVERFLOW:
+                    folders_paths.extend(self.folders_mtimes)
+                elif mask & AOVFolderWatcher.IN_IGNORED:
+                    self.watch_descriptors.pop(watch_descriptor, None)
+                elif watch_descriptor in self.watch_descriptors:
+                    folders_paths.append(self.watch_descriptors[watch_descriptor])
+
+        return folders_paths
+
+    def remove_folder(self, folder_path: str) -> None:
+        """Stops watching a folder."""
+        self.folders_mtimes.pop(folder_path, None)
+
+        for watch_descriptor, watched_folder_path in list(self.watch_descriptors.items()):
+            if watched_folder_path == folder_path:
+                self.libc.inotify_rm_watch(self.inotify_fd, watch_descriptor)
+                self.watch_descriptors.pop(watch_descriptor)
@@ -0,0 +1,160 @@
+"""
+========================================================================================================================
+Name: aov_graph.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import deque
+
+
+class AOVGraphError(Exception):
+    """AOV graph error."""
+
+
+class AOVGraphCancelled(AOVGraphError):
+    """AOV graph cancelled, raised by a progress callback to stop a build."""
+
+
+class AOVGraphNode(object):
+    """AOV graph node."""
+
+    def __init__(self, key: str, node_class: str, knobs: dict = None, inputs: list = None, column: float = 0,
+                 row: int = 0, external_name: str = ''):
+        """Initializes class attributes."""
+        self.key = key
+        self.node_class = node_class
+        self.knobs = dict(knobs) if knobs else {}
+        self.inputs = list(inputs) if inputs else []
+        self.column = column
+        self.row = row
+        self.x_pos = 0
+        self.y_pos = 0
+        self.external_name = external_name
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f'AOVGraphNode({self.key!r}, {self.node_class!r})'
+
+    def is_external(self) -> bool:
+        """Checks if the node references an existing Nuke node."""
+        return bool(self.external_name)
+
+    def set_input(self, index: int, key: str | None) -> None:
+        """Sets an input."""
+        while len(self.inputs) <= index:
+            self.inputs.append(None)
+
+        self.inputs[index] = key
+
+    def set_position(self, x_pos: float, y_pos: float) -> None:
+        """Sets the position."""
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+
+
+class AOVGraph(object):
+    """AOV graph.
+
+    In-memory description of a node network (nodes, knobs, inputs and positions) that does not depend on Nuke.
+    Inputs reference other nodes by key. The column and row of a node are layout hints, the positions are computed
+    from them by AOVGraphLayout and are relative to the graph origin.
+    """
+
+    def __init__(self, network_id: str = ''):
+        """Initializes class attributes."""
+        self.network_id = network_id
+        self.nodes = {}
+        self.output_key = ''
+
+    def __contains__(self, key: str) -> bool:
+        """Checks if the key is in the graph."""
+        return key in self.nodes
+
+    def __len__(self) -> int:
+        """Gets the number of nodes."""
+        return len(self.nodes)
+
+    def add_external_node(self, key: str, node_class: str, external_name: str, column: float = 0,
+                          row: int = 0) -> AOVGraphNode:
+        """Adds a node that references an existing Nuke node."""
+        return self.add_node(
+            key=key,
+            node_class=node_class,
+            column=column,
+            row=row,
+            external_name=external_name)
+
+    def add_node(self, key: str, node_class: str, knobs: dict = None, inputs: list = None, column: float = 0,
+                 row: int = 0, external_name: str = '') -> AOVGraphNode:
+        """Adds a node."""
+        if key in self.nodes:
+            raise AOVGraphError(f'Duplicated node key: {key}')
+
+        node = AOVGraphNode(
+            key=key,
+            node_class=node_class,
+            knobs=knobs,
+            inputs=inputs,
+            column=column,
+            row=row,
+            external_name=external_name)
+
+        self.nodes[key] = node
+
+        return node
+
+    def get_node(self, key: str) -> AOVGraphNode:
+        """Gets a node."""
+        if key not in self.nodes:
+            raise AOVGraphError(f'Unknown node key: {key}')
+
+        return self.nodes[key]
+
+    def get_nodes(self) -> list:
+        """Gets the nodes in insertion order."""
+        return list(self.nodes.values())
+
+    def get_node_count(self) -> int:
+        """Gets the number of nodes that have to be created."""
+        return sum(1 for node in self.nodes.values() if not node.is_external())
+
+    def has_external_nodes(self) -> bool:
+        """Checks if the graph references existing Nuke nodes."""
+        return any(graph_node.is_external() for graph_node in self.nodes.values())
+
+    def get_sorted_nodes(self) -> list:
+        """Gets the nodes sorted so every node comes after its inputs."""
+        pending_inputs = {}
+        outputs = {key: [] for key in self.nodes}
+
+        for key, node in self.nodes.items():
+            input_keys = {input_key for input_key in node.inputs if input_key is not None}
+
+            for input_key in input_keys:
+                if input_key not in self.nodes:
+                    raise AOVGraphError(f'Node {key} has an unknown input: {input_key}')
+
+                outputs[input_key].append(key)
+
+            pending_inputs[key] = len(input_keys)
+
+        ready = deque(key for key, count in pending_inputs.items() if not count)
+        sorted_nodes = []
+
+        while ready:
+            key = ready.popleft()
+            sorted_nodes.append(self.nodes[key])
+
+            for output_key in outputs[key]:
+                pending_inputs[output_key] -= 1
+
+                if not pending_inputs[output_key]:
+                    ready.append(output_key)
+
+        if len(sorted_nodes) != len(self.nodes):
+            raise AOVGraphError('The graph has a cycle.')
+
+        return sorted_nodes
@@ -0,0 +1,106 @@
+"""
+========================================================================================================================
+Name: aov_graph_diff.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+
+
+class AOVGraphDiff(object):
+    """AOV graph diff.
+
+    Compares the desired graph of a network with the graph of its nodes already in Nuke, matched by key. Nodes whose
+    class changed are removed and added again, the other nodes only get their changed knobs and inputs updated. Only
+    the knobs planned in the desired graph are compared, so the knobs edited by the artist are left alone.
+    """
+    FLOAT_DECIMALS = 6
+
+    def __init__(self, graph: AOVGraph, existing_graph: AOVGraph):
+        """Initializes class attributes."""
+        self.graph = graph
+        self.existing_graph = existing_graph
+
+        self.added_keys = []
+        self.removed_keys = []
+        self.changed_knobs = {}
+        self.rewired_keys = []
+
+        self.compare()
+
+    def __len__(self) -> int:
+        """Gets the number of changed nodes."""
+        return len(set(self.added_keys) | set(self.removed_keys) | set(self.changed_knobs) | set(self.rewired_keys))
+
+    def compare(self) -> None:
+        """Compares the graphs."""
+        for existing_node in self.existing_graph.get_nodes():
+            if existing_node.is_external():
+                continue
+
+            if existing_node.key not in self.graph or \
+                    self.graph.get_node(existing_node.key).node_class != existing_node.node_class:
+                self.removed_keys.append(existing_node.key)
+
+        for graph_node in self.graph.get_sorted_nodes():
+            if graph_node.is_external():
+                continue
+
+            if graph_node.key not in self.existing_graph or graph_node.key in self.removed_keys:
+                self.added_keys.append(graph_node.key)
+
+                continue
+
+            existing_node = self.existing_graph.get_node(graph_node.key)
+
+            knobs = {
+                knob_name: value for knob_name, value in graph_node.knobs.items()
+                if self.get_normalized_value(value=existing_node.knobs.get(knob_name)) !=
+                self.get_normalized_value(value=value)}
+
+            if knobs:
+                self.changed_knobs[graph_node.key] = knobs
+
+            if self.get_trimmed_inputs(inputs=existing_node.inputs) != \
+                    self.get_trimmed_inputs(inputs=graph_node.inputs):
+                self.rewired_keys.append(graph_node.key)
+
+    def get_unchanged_keys(self) -> list:
+        """Gets the keys of the nodes that exist in both graphs and do not change."""
+        return [
+            graph_node.key for graph_node in self.graph.get_nodes()
+            if not graph_node.is_external() and
+            graph_node.key in self.existing_graph and
+            graph_node.key not in self.removed_keys and
+            graph_node.key not in self.changed_knobs and
+            graph_node.key not in self.rewired_keys]
+
+    @classmethod
+    def get_normalized_value(cls, value: object) -> object:
+        """Gets a knob value comparable with the value Nuke returns for it: the numbers as rounded floats, the
+        sequences element by element and the other values as text. Nuke returns the integer and array knobs, such as
+        the first frame or the box of a Crop, as floats.
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.get_normalized_value(value=item) for item in value)
+
+        if isinstance(value, (int, float)):
+            return round(float(value), cls.FLOAT_DECIMALS)
+
+        return str(value)
+
+    @staticmethod
+    def get_trimmed_inputs(inputs: list) -> list:
+        """Gets the inputs without the trailing empty ones."""
+        inputs = list(inputs)
+
+        while inputs and inputs[-1] is None:
+            inputs.pop()
+
+        return inputs
@@ -0,0 +1,212 @@
+"""
+========================================================================================================================
+Name: aov_graph_layout.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+
+
+class AOVGraphLayout(object):
+    """AOV graph layout.
+
+    Computes the DAG positions of every node of an AOVGraph from the known node sizes, without querying Nuke:
+
+    - Grid: one column per AOV and one row per stage (read, dot, shuffle, merges).
+    - Tree: one row per depth in the graph, every node with several inputs centered over them.
+    - Compact: the grid layout with the columns and rows packed as tight as the node sizes allow.
+    """
+    GRID = 'grid'
+    TREE = 'tree'
+    COMPACT = 'compact'
+
+    STYLES = (GRID, TREE, COMPACT)
+
+    DEFAULT_NODE_WIDTH = 80
+    DEFAULT_NODE_HEIGHT = 18
+
+    NODE_WIDTHS = {'Dot': 12}
+    NODE_HEIGHTS = {'Dot': 12, 'Read': 78}
+
+    COLUMN_SPACING = 150
+    ROW_GAP = 32
+
+    COMPACT_COLUMN_GAP = 20
+    COMPACT_ROW_GAP = 12
+
+    NETWORK_GAP = 150
+
+    def __init__(self):
+        """Initializes class attributes."""
+        self.style = AOVGraphLayout.GRID
+
+    def apply(self, graph: AOVGraph) -> None:
+        """Computes and sets the positions of the graph nodes."""
+        if self.style == AOVGraphLayout.TREE:
+            self.apply_tree(graph=graph)
+        elif self.style == AOVGraphLayout.COMPACT:
+            self.apply_grid(
+                graph=graph,
+                column_spacing=self.DEFAULT_NODE_WIDTH + self.COMPACT_COLUMN_GAP,
+                row_gap=self.COMPACT_ROW_GAP)
+        else:
+            self.apply_grid(graph=graph, column_spacing=self.COLUMN_SPACING, row_gap=self.ROW_GAP)
+
+    def apply_grid(self, graph: AOVGraph, column_spacing: float, row_gap: float) -> None:
+        """Places the nodes by their column and row."""
+        rows_y_pos = self.get_rows_y_pos(
+            rows_heights=self.get_rows_heights(graph=graph, rows={node.key: node.row for node in graph.get_nodes()}),
+            row_gap=row_gap)
+
+        for graph_node in graph.get_nodes():
+            graph_node.set_position(
+                x_pos=self.get_centered_x_pos(
+                    x_pos=graph_node.column * column_spacing,
+                    node_class=graph_node.node_class),
+                y_pos=self.get_centered_y_pos(
+                    y_pos=rows_y_pos[graph_node.row],
+                    node_class=graph_node.node_class))
+
+    def apply_tree(self, graph: AOVGraph) -> None:
+        """Places the nodes by their depth and the nodes with several inputs centered over them."""
+        sorted_nodes = graph.get_sorted_nodes()
+        ranks = {}
+        columns = {}
+
+        for graph_node in sorted_nodes:
+            inputs_keys = [input_key for input_key in graph_node.inputs if input_key is not None]
+
+            ranks[graph_node.key] = max((ranks[input_key] + 1 for input_key in inputs_keys), default=0)
+
+            if len(inputs_keys) > 1:
+                columns[graph_node.key] = sum(columns[input_key] for input_key in inputs_keys) / len(inputs_keys)
+            else:
+                columns[graph_node.key] = graph_node.column
+
+        rows_y_pos = self.get_rows_y_pos(
+            rows_heights=self.get_rows_heights(graph=graph, rows=ranks),
+            row_gap=self.ROW_GAP)
+
+        for graph_node in sorted_nodes:
+            graph_node.set_position(
+                x_pos=self.get_centered_x_pos(
+                    x_pos=columns[graph_node.key] * self.COLUMN_SPACING,
+                    node_class=graph_node.node_class),
+                y_pos=self.get_centered_y_pos(
+                    y_pos=rows_y_pos[ranks[graph_node.key]],
+                    node_class=graph_node.node_class))
+
+    @classmethod
+    def get_bounding_box(cls, graph: AOVGraph) -> tuple:
+        """Gets the (x min, y min, x max, y max) box that contains every node of the graph."""
+        if not len(graph):
+            return 0, 0, 0, 0
+
+        nodes = graph.get_nodes()
+
+        return (
+            min(node.x_pos for node in nodes),
+            min(node.y_pos for node in nodes),
+            max(node.x_pos + cls.get_node_width(node_class=node.node_class) for node in nodes),
+            max(node.y_pos + cls.get_node_height(node_class=node.node_class) for node in nodes))
+
+    @classmethod
+    def get_side_by_side_origins(cls, graphs: list, origins: list) -> list:
+        """Gets the origins that place the graphs side by side from left to right without overlap.
+
+        The graphs with external nodes keep their origin, under the existing Read nodes they are wired to, as moving
+        them would leave long edges back to their Read nodes. Every other graph keeps the Y of its origin and the X of
+        its origin unless it would overlap the graph on its left or a graph with external nodes.
+        """
+        side_by_side_origins = list(origins)
+        bounding_boxes = [cls.get_bounding_box(graph=graph) for graph in graphs]
+        external_ranges = [
+            (origins[i][0] + bounding_boxes[i][0], origins[i][0] + bounding_boxes[i][2])
+            for i, graph in enumerate(graphs) if graph.has_external_nodes()]
+        x_min = None
+
+        for i in sorted(range(len(graphs)), key=lambda index: origins[index][0]):
+            if graphs[i].has_external_nodes():
+                continue
+
+            x_origin, y_origin = origins[i]
+            box_x_min, _, box_x_max, _ = bounding_boxes[i]
+
+            if x_min is not None:
+                x_origin = max(x_origin, x_min - box_x_min)
+
+            overlapped = True
+
+            while overlapped:
+                overlapped = False
+
+                for range_x_min, range_x_max in external_ranges:
+                    if (x_origin + box_x_min < range_x_max + cls.NETWORK_GAP
+                            and x_origin + box_x_max + cls.NETWORK_GAP > range_x_min):
+                        x_origin = range_x_max + cls.NETWORK_GAP - box_x_min
+                        overlapped = True
+
+            side_by_side_origins[i] = (x_origin, y_origin)
+            x_min = x_origin + box_x_max + cls.NETWORK_GAP
+
+        return side_by_side_origins
+
+    @classmethod
+    def get_centered_x_pos(cls, x_pos: float, node_class: str) -> int:
+        """Gets the X pos that centers the node in a column that starts at the X pos."""
+        return int(x_pos + (cls.DEFAULT_NODE_WIDTH - cls.get_node_width(node_class=node_class)) / 2)
+
+    @classmethod
+    def get_centered_y_pos(cls, y_pos: float, node_class: str) -> int:
+        """Gets the Y pos that centers the node in a row that starts at the Y pos."""
+        height = cls.get_node_height(node_class=node_class)
+
+        if height >= cls.DEFAULT_NODE_HEIGHT:
+            return int(y_pos)
+
+        return int(y_pos + (cls.DEFAULT_NODE_HEIGHT - height) / 2)
+
+    @classmethod
+    def get_node_height(cls, node_class: str) -> int:
+        """Gets the height of a node in the DAG."""
+        return cls.NODE_HEIGHTS.get(node_class, cls.DEFAULT_NODE_HEIGHT)
+
+    @classmethod
+    def get_node_width(cls, node_class: str) -> int:
+        """Gets the width of a node in the DAG."""
+        return cls.NODE_WIDTHS.get(node_class, cls.DEFAULT_NODE_WIDTH)
+
+    @classmethod
+    def get_rows_heights(cls, graph: AOVGraph, rows: dict) -> dict:
+        """Gets the height of every row from the tallest node in it."""
+        rows_heights = {}
+
+        for graph_node in graph.get_nodes():
+            row = rows[graph_node.key]
+            height = max(cls.get_node_height(node_class=graph_node.node_class), cls.DEFAULT_NODE_HEIGHT)
+            rows_heights[row] = max(rows_heights.get(row, 0), height)
+
+        return rows_heights
+
+    @staticmethod
+    def get_rows_y_pos(rows_heights: dict, row_gap: float) -> dict:
+        """Gets the Y pos of every row, rows without nodes take no space."""
+        rows_y_pos = {}
+        y_pos = 0
+
+        for row in sorted(rows_heights):
+            rows_y_pos[row] = y_pos
+            y_pos += rows_heights[row] + row_gap
+
+        return rows_y_pos
+
+    def set_style(self, style: str) -> None:
+        """Sets the layout style."""
+        if style not in AOVGraphLayout.STYLES:
+            raise AOVGraphError(f'Unknown layout style: {style}')
+
+        self.style = style
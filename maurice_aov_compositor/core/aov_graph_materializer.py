@@ -0,0 +1,398 @@
+"""
+========================================================================================================================
+Name: aov_graph_materializer.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import nuke
+
+import logging
+import time
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph import AOVGraphNode
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph_diff import AOVGraphDiff
+from maurice_aov_compositor.core.aov_graph_script import AOVGraphScriptWriter
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVGraphMaterializer(object):
+    """AOV graph materializer.
+
+    Turns AOVGraphs into Nuke nodes in a single pass. The interactive mode goes through nuke.createNode like a user
+    would, the fast mode uses the nuke.nodes constructors with every knob passed at creation time, which skips the
+    autoplace, the properties panel and the auto-connection to the selected node. The script mode serializes all the
+    graphs to Nuke script text and inserts them with a single read call.
+
+    Every created node is tagged with its graph key and network ID, so a network can later be updated in place: only
+    the nodes that changed are added, removed, edited or rewired, and the untouched nodes are not moved.
+    """
+    INTERACTIVE = 'interactive'
+    FAST = 'fast'
+    SCRIPT = 'script'
+
+    MODES = (INTERACTIVE, FAST, SCRIPT)
+
+    def __init__(self):
+        """Initializes class attributes."""
+        self.mode = AOVGraphMaterializer.INTERACTIVE
+        self.elapsed_time = 0.0
+
+    def benchmark(self, graph: AOVGraph) -> dict:
+        """Materializes the graph with every mode, deletes the nodes and returns the elapsed times by mode."""
+        current_mode = self.mode
+        elapsed_times = {}
+
+        try:
+            for mode in AOVGraphMaterializer.MODES:
+                self.set_mode(mode=mode)
+                nodes = self.materialize(graph=graph)
+                elapsed_times[mode] = self.elapsed_time
+
+                for key, node in nodes.items():
+                    if not graph.get_node(key).is_external():
+                        nuke.delete(node)
+        finally:
+            self.set_mode(mode=current_mode)
+
+        logger.info(
+            'Node creation: %.3fs interactive, %.3fs fast, %.3fs script (%d nodes).',
+            elapsed_times[AOVGraphMaterializer.INTERACTIVE],
+            elapsed_times[AOVGraphMaterializer.FAST],
+            elapsed_times[AOVGraphMaterializer.SCRIPT],
+            graph.get_node_count())
+
+        return elapsed_times
+
+    def materialize(self, graph: AOVGraph, origin: tuple = None) -> dict:
+        """Creates the Nuke nodes of the graph and returns them by key."""
+        return self.materialize_graphs(graphs=[graph], origins=[origin])[0]
+
+    def materialize_graphs(self, graphs: list, origins: list = None) -> list:
+        """Creates the Nuke nodes of the graphs in a single batch and returns them by key for every graph.
+
+        The origins are the DAG positions the graphs positions are relative to, a graph without origin is placed
+        relative to its external nodes.
+        """
+        start_time = time.perf_counter()
+
+        origins = [
+            origin if origin is not None else self.get_origin(graph=graph)
+            for graph, origin in zip(graphs, origins or [None] * len(graphs))]
+
+        if self.mode == AOVGraphMaterializer.SCRIPT:
+            graphs_nodes = self.materialize_script(graphs=graphs, origins=origins)
+        else:
+            graphs_nodes = [
+                self.materialize_nodes(graph=graph, x_origin=x_origin, y_origin=y_origin)
+                for graph, (x_origin, y_origin) in zip(graphs, origins)]
+
+        self.elapsed_time = time.perf_counter() - start_time
+
+        logger.info(
+            'Created %d nodes for %d networks in %.3fs (%s mode).',
+            sum(graph.get_node_count() for graph in graphs),
+            len(graphs),
+            self.elapsed_time,
+            self.mode)
+
+        return graphs_nodes
+
+    def materialize_nodes(self, graph: AOVGraph, x_origin: float, y_origin: float) -> dict:
+        """Creates the Nuke nodes of the graph one by one."""
+        nodes = {}
+
+        for graph_node in graph.get_sorted_nodes():
+            if graph_node.is_external():
+                nodes[graph_node.key] = self.get_external_node(graph_node=graph_node)
+
+                continue
+
+            x_pos = x_origin + graph_node.x_pos
+            y_pos = y_origin + graph_node.y_pos
+
+            if self.mode == AOVGraphMaterializer.FAST:
+                node = self.create_node_fast(graph_node=graph_node, x_pos=x_pos, y_pos=y_pos)
+            else:
+                node = self.create_node(graph_node=graph_node)
+                node.setXYpos(int(x_pos), int(y_pos))
+
+            self.tag_node(node=node, key=graph_node.key, network_id=graph.network_id)
+
+            for i, input_key in enumerate(graph_node.inputs):
+                if input_key is not None:
+                    node.setInput(i, nodes[input_key])
+
+            nodes[graph_node.key] = node
+
+        return nodes
+
+    def materialize_script(self, graphs: list, origins: list) -> list:
+        """Creates the Nuke nodes of the graphs by reading their script text in a single call."""
+        script_writer = AOVGraphScriptWriter()
+        script = ''.join(
+            script_writer.write(graph=graph, x_origin=x_origin, y_origin=y_origin)
+            for graph, (x_origin, y_origin) in zip(graphs, origins))
+
+        existing_nodes_names = {node.fullName() for node in nuke.allNodes()}
+
+        nuke.scriptReadText(script)
+
+        graphs_nodes = [{} for _ in graphs]
+        graphs_indices = {graph.network_id: i for i, graph in enumerate(graphs)}
+
+        for node in nuke.allNodes():
+            if node.fullName() in existing_nodes_names:
+                continue
+
+            node.setSelected(False)
+
+            key_knob = node.knob(AOVGraphScriptWriter.KEY_KNOB)
+            network_knob = node.knob(AOVGraphScriptWriter.NETWORK_KNOB)
+
+            if key_knob is None:
+                continue
+
+            i = graphs_indices.get(network_knob.value() if network_knob is not None else '', 0)
+
+            if key_knob.value() in graphs[i]:
+                graphs_nodes[i][key_knob.value()] = node
+
+        for graph, nodes in zip(graphs, graphs_nodes):
+            for graph_node in graph.get_nodes():
+                if graph_node.is_external():
+                    nodes[graph_node.key] = self.get_external_node(graph_node=graph_node)
+
+            for key, i, external_name in script_writer.get_external_inputs(graph=graph):
+                nodes[key].setInput(i, nodes[graph.get_node(key).inputs[i]])
+
+        return graphs_nodes
+
+    def update(self, graph: AOVGraph, origin: tuple = None) -> dict:
+        """Updates the existing nodes of the graph network, or creates them, and returns them by key."""
+        return self.update_graphs(graphs=[graph], origins=[origin])[0]
+
+    def update_graphs(self, graphs: list, origins: list = None) -> list:
+        """Updates the networks of the graphs that already exist in Nuke and creates the other ones in a single batch."""
+        origins = origins or [None] * len(graphs)
+        networks_nodes = self.get_networks_nodes()
+
+        graphs_nodes = [None] * len(graphs)
+        new_graphs_indices = []
+
+        for i, graph in enumerate(graphs):
+            existing_nodes = networks_nodes.get(graph.network_id) if graph.network_id else None
+
+            if existing_nodes:
+                graphs_nodes[i] = self.update_nodes(graph=graph, existing_nodes=existing_nodes, origin=origins[i])
+            else:
+                new_graphs_indices.append(i)
+
+        if new_graphs_indices:
+            new_graphs_nodes = self.materialize_graphs(
+                graphs=[graphs[i] for i in new_graphs_indices],
+                origins=[origins[i] for i in new_graphs_indices])
+
+            for i, nodes in zip(new_graphs_indices, new_graphs_nodes):
+                graphs_nodes[i] = nodes
+
+        return graphs_nodes
+
+    def update_nodes(self, graph: AOVGraph, existing_nodes: dict, origin: tuple = None) -> dict:
+        """Applies the differences between the graph and its existing nodes."""
+        start_time = time.perf_counter()
+
+        existing_graph = self.get_existing_graph(graph=graph, existing_nodes=existing_nodes)
+        graph_diff = AOVGraphDiff(graph=graph, existing_graph=existing_graph)
+
+        nodes = {key: node for key, node in existing_nodes.items() if key not in graph_diff.removed_keys}
+
+        for graph_node in graph.get_nodes():
+            if graph_node.is_external():
+                nodes[graph_node.key] = self.get_external_node(graph_node=graph_node)
+
+        for key in graph_diff.removed_keys:
+            nuke.delete(existing_nodes[key])
+
+        x_origin, y_origin = \
+            self.get_existing_origin(graph=graph, nodes=nodes) or origin or self.get_origin(graph=graph)
+
+        for key in graph_diff.added_keys:
+            graph_node = graph.get_node(key)
+            x_pos = x_origin + graph_node.x_pos
+            y_pos = y_origin + graph_node.y_pos
+
+            if self.mode == AOVGraphMaterializer.INTERACTIVE:
+                node = self.create_node(graph_node=graph_node)
+                node.setXYpos(int(x_pos), int(y_pos))
+            else:
+                node = self.create_node_fast(graph_node=graph_node, x_pos=x_pos, y_pos=y_pos)
+
+            self.tag_node(node=node, key=key, network_id=graph.network_id)
+
+            nodes[key] = node
+
+        for key, knobs in graph_diff.changed_knobs.items():
+            for knob_name, value in knobs.items():
+                nodes[key].knob(knob_name).setValue(value)
+
+        for key in graph_diff.added_keys + graph_diff.rewired_keys:
+            node = nodes[key]
+            inputs = graph.get_node(key).inputs
+
+            for i in range(max(len(inputs), node.inputs())):
+                input_key = inputs[i] if i < len(inputs) else None
+                node.setInput(i, nodes[input_key] if input_key is not None else None)
+
+        self.elapsed_time = time.perf_counter() - start_time
+
+        logger.info(
+            'Updated network %s in %.3fs: %d added, %d removed, %d edited, %d rewired, %d untouched nodes.',
+            graph.network_id,
+            self.elapsed_time,
+            len(graph_diff.added_keys),
+            len(graph_diff.removed_keys),
+            len(graph_diff.changed_knobs),
+            len(graph_diff.rewired_keys),
+            len(graph_diff.get_unchanged_keys()))
+
+        return nodes
+
+    @staticmethod
+    def create_node(graph_node: AOVGraphNode) -> nuke.Node:
+        """Creates a node through nuke.createNode."""
+        node = nuke.createNode(graph_node.node_class)
+
+        for knob_name, value in graph_node.knobs.items():
+            node.knob(knob_name).setValue(value)
+
+        node.setSelected(False)
+
+        return node
+
+    @staticmethod
+    def create_node_fast(graph_node: AOVGraphNode, x_pos: float, y_pos: float) -> nuke.Node:
+        """Creates a node through the nuke.nodes constructors with all the knobs set at creation time."""
+        node_constructor = getattr(nuke.nodes, graph_node.node_class)
+
+        return node_constructor(xpos=int(x_pos), ypos=int(y_pos), selected=False, **graph_node.knobs)
+
+    @staticmethod
+    def get_external_node(graph_node: AOVGraphNode) -> nuke.Node:
+        """Gets the existing Nuke node an external graph node references."""
+        node = nuke.toNode(graph_node.external_name)
+
+        if node is None:
+            raise AOVGraphError(f'Node not found: {graph_node.external_name}')
+
+        return node
+
+    @classmethod
+    def get_existing_graph(cls, graph: AOVGraph, existing_nodes: dict) -> AOVGraph:
+        """Gets the graph of the existing nodes of a network, with the knobs planned in the graph.
+
+        The nodes inserted by the artist between two nodes of the network are skipped when reading the inputs.
+        """
+        existing_graph = AOVGraph(network_id=graph.network_id)
+        nodes_keys = {node.fullName(): key for key, node in existing_nodes.items()}
+
+        for graph_node in graph.get_nodes():
+            if graph_node.is_external():
+                existing_graph.add_external_node(
+                    key=graph_node.key,
+                    node_class=graph_node.node_class,
+                    external_name=graph_node.external_name)
+
+                nodes_keys.setdefault(graph_node.external_name, graph_node.key)
+
+        for key, node in existing_nodes.items():
+            knobs = {}
+
+            if key in graph:
+                for knob_name in graph.get_node(key).knobs:
+                    knob = node.knob(knob_name)
+                    knobs[knob_name] = knob.value() if knob is not None else None
+
+            inputs = [cls.get_input_key(node=node.input(i), nodes_keys=nodes_keys) for i in range(node.inputs())]
+
+            existing_graph.add_node(key=key, node_class=node.Class(), knobs=knobs, inputs=inputs)
+
+        return existing_graph
+
+    @staticmethod
+    def get_existing_origin(graph: AOVGraph, nodes: dict) -> tuple | None:
+        """Gets the origin of the graph from the position of one of its existing nodes."""
+        for key, node in nodes.items():
+            if key in graph and not graph.get_node(key).is_external():
+                graph_node = graph.get_node(key)
+
+                return node.xpos() - graph_node.x_pos, node.ypos() - graph_node.y_pos
+
+        return None
+
+    @staticmethod
+    def get_input_key(node: nuke.Node | None, nodes_keys: dict) -> str | None:
+        """Gets the key of an input node, going up through the untagged nodes inserted by the artist."""
+        visited_nodes_names = set()
+
+        while node is not None and node.fullName() not in visited_nodes_names:
+            if node.fullName() in nodes_keys:
+                return nodes_keys[node.fullName()]
+
+            visited_nodes_names.add(node.fullName())
+            node = node.input(0)
+
+        return None
+
+    @staticmethod
+    def get_networks_nodes() -> dict:
+        """Gets the tagged nodes in Nuke by network ID and key."""
+        networks_nodes = {}
+
+        for node in nuke.allNodes():
+            key_knob = node.knob(AOVGraphScriptWriter.KEY_KNOB)
+            network_knob = node.knob(AOVGraphScriptWriter.NETWORK_KNOB)
+
+            if key_knob is not None and network_knob is not None:
+                networks_nodes.setdefault(network_knob.value(), {})[key_knob.value()] = node
+
+        return networks_nodes
+
+    @staticmethod
+    def get_origin(graph: AOVGraph) -> tuple:
+        """Gets the DAG position the graph positions are relative to."""
+        for graph_node in graph.get_nodes():
+            if graph_node.is_external():
+                node = nuke.toNode(graph_node.external_name)
+
+                if node is not None:
+                    return node.xpos() - graph_node.x_pos, node.ypos() - graph_node.y_pos
+
+        x_center, y_center = nuke.center()
+
+        return int(x_center), int(y_center)
+
+    @staticmethod
+    def tag_node(node: nuke.Node, key: str, network_id: str) -> None:
+        """Tags the node with its graph key and network ID in hidden knobs."""
+        for knob_name, value in ((AOVGraphScriptWriter.KEY_KNOB, key), (AOVGraphScriptWriter.NETWORK_KNOB, network_id)):
+            if not value:
+                continue
+
+            knob = nuke.String_Knob(knob_name)
+            knob.setFlag(nuke.INVISIBLE)
+            node.addKnob(knob)
+            knob.setValue(value)
+
+    def set_mode(self, mode: str) -> None:
+        """Sets the materialization mode."""
+        if mode not in AOVGraphMaterializer.MODES:
+            raise AOVGraphError(f'Unknown materialization mode: {mode}')
+
+        self.mode = mode
@@ -0,0 +1,144 @@
+"""
+========================================================================================================================
+Name: aov_graph_script.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import re
+
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph import AOVGraphNode
+
+
+class AOVGraphScriptWriter(object):
+    """AOV graph script writer.
+
+    Serializes an AOVGraph to Nuke script text without importing nuke. Inputs are wired through the script stack with
+    one TCL variable per node, inputs coming from external nodes are left empty and returned by get_external_inputs so
+    they can be connected after the script is read. The mask input of the merges is written apart, after the other
+    inputs, in the 'inputs 3+1' form of the Nuke scripts, so the A2 and next inputs are not read as the mask. Every node
+    is tagged with its graph key and network ID in hidden knobs so it can be found again once it is in Nuke.
+    """
+    KEY_KNOB = 'maurice_aov_key'
+    NETWORK_KNOB = 'maurice_aov_network'
+
+    MASK_INPUTS = {'Merge2': 2}
+
+    BARE_VALUE_PATTERN = re.compile(r'^[\w./:#%@+\-]+$')
+
+    def write(self, graph: AOVGraph, x_origin: float = 0, y_origin: float = 0) -> str:
+        """Writes the graph as Nuke script text."""
+        lines = []
+        variables = {}
+
+        for i, graph_node in enumerate(graph.get_sorted_nodes()):
+            if graph_node.is_external():
+                continue
+
+            inputs, mask_inputs = self.get_script_inputs(graph_node=graph_node)
+
+            for input_key in reversed(inputs + mask_inputs):
+                if input_key is None or input_key not in variables:
+                    lines.append('push 0')
+                else:
+                    lines.append(f'push ${variables[input_key]}')
+
+            lines.append(f'{graph_node.node_class} {{')
+            lines.append(f' inputs {len(inputs)}+{len(mask_inputs)}' if mask_inputs else f' inputs {len(inputs)}')
+
+            for knob_name, value in graph_node.knobs.items():
+                lines.append(f' {knob_name} {self.format_value(value=value)}')
+
+            lines.append(f' xpos {int(x_origin + graph_node.x_pos)}')
+            lines.append(f' ypos {int(y_origin + graph_node.y_pos)}')
+            lines.append(f' addUserKnob {{1 {self.KEY_KNOB} +INVISIBLE}}')
+            lines.append(f' {self.KEY_KNOB} {self.format_value(value=graph_node.key)}')
+
+            if graph.network_id:
+                lines.append(f' addUserKnob {{1 {self.NETWORK_KNOB} +INVISIBLE}}')
+                lines.append(f' {self.NETWORK_KNOB} {self.format_value(value=graph.network_id)}')
+
+            lines.append('}')
+
+            variables[graph_node.key] = f'Naov{i}'
+            lines.append(f'set {variables[graph_node.key]} [stack 0]')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_script_file(self, graphs: list, origins: list, file_path: str) -> None:
+        """Writes the graphs at their (X, Y) origins to a Nuke script file that can be opened on its own."""
+        script = ['Root {\n inputs 0\n}\n']
+        script.extend(
+            self.write(graph=graph, x_origin=x_origin, y_origin=y_origin)
+            for graph, (x_origin, y_origin) in zip(graphs, origins))
+
+        with open(file_path, 'w', encoding='utf-8') as script_file:
+            script_file.write(''.join(script))
+
+    @classmethod
+    def format_value(cls, value: any) -> str:
+        """Formats a knob value as a TCL word."""
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+
+        if isinstance(value, (int, float)):
+            return repr(value)
+
+        if isinstance(value, (list, tuple)):
+            return '{' + ' '.join(cls.format_value(value=item) for item in value) + '}'
+
+        value = str(value)
+
+        if cls.BARE_VALUE_PATTERN.match(value):
+            return value
+
+        for character, escaped_character in (('\\', '\\\\'), ('"', '\\"'), ('$', '\\$'), ('[', '\\['),
+                                             (']', '\\]'), ('\n', '\\n')):
+            value = value.replace(character, escaped_character)
+
+        return f'"{value}"'
+
+    @staticmethod
+    def get_external_inputs(graph: AOVGraph) -> list:
+        """Gets the (node key, input index, external node name) connections the script leaves empty."""
+        external_inputs = []
+
+        for graph_node in graph.get_nodes():
+            if graph_node.is_external():
+                continue
+
+            for i, input_key in enumerate(graph_node.inputs):
+                if input_key is not None and graph.get_node(input_key).is_external():
+                    external_inputs.append((graph_node.key, i, graph.get_node(input_key).external_name))
+
+        return external_inputs
+
+    @classmethod
+    def get_script_inputs(cls, graph_node: AOVGraphNode) -> tuple:
+        """Gets the (inputs, mask inputs) of a node in the order the script stack takes them, the mask input of the
+        nodes that have one is taken out of the inputs and written after them.
+        """
+        inputs = list(graph_node.inputs)
+        mask_inputs = []
+        mask_input_index = cls.MASK_INPUTS.get(graph_node.node_class)
+
+        if mask_input_index is not None and mask_input_index < len(inputs):
+            mask_input_key = inputs.pop(mask_input_index)
+
+            if mask_input_key is not None:
+                mask_inputs.append(mask_input_key)
+
+        return cls.get_trimmed_inputs(inputs=inputs), mask_inputs
+
+    @staticmethod
+    def get_trimmed_inputs(inputs: list) -> list:
+        """Gets the inputs without the trailing empty ones."""
+        inputs = list(inputs)
+
+        while inputs and inputs[-1] is None:
+            inputs.pop()
+
+        return inputs
@@ -0,0 +1,218 @@
+"""
+========================================================================================================================
+Name: aov_header_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import threading
+import logging
+import sqlite3
+import time
+import os
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeader
+from maurice_aov_compositor.utils.maurice_paths import get_data_folder_path
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVHeaderCache(object):
+    """AOV header cache.
+
+    Bounded in-memory LRU cache of the parsed AOVEXRHeader of the EXR files, so toggling between modes or renderers does
+    not parse the same headers again. A header is valid while the size and modification time of its file, read with a
+    single stat, are unchanged. The optional persistent tier stores the header bytes in SQLite, they are parsed again
+    without opening the file when a header is not in memory. The hits, misses and evictions are counted.
+
+    The cache is shared by the threads probing the files.
+    """
+    FILE_NAME = 'exr_header_cache.db'
+
+    SCHEMA_VERSION = 1
+
+    MAX_ENTRIES = 1024
+    MAX_PERSISTENT_ENTRIES = 100000
+    TIMEOUT = 30.0
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, persistent: bool = False, file_path: str = ''):
+        """Initializes class attributes."""
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self.file_path = file_path or os.path.join(get_data_folder_path(), AOVHeaderCache.FILE_NAME)
+        self.headers = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Gets the number of headers in memory."""
+        return len(self.headers)
+
+    def clear(self) -> None:
+        """Removes every header, from memory and from the persistent tier, and resets the statistics."""
+        with self.lock:
+            self.headers.clear()
+            self.hits = self.persistent_hits = self.misses = self.evictions = 0
+
+        if self.persistent and os.path.isfile(self.file_path):
+            with self.connect() as connection:
+                connection.execute('DELETE FROM headers')
+
+    @contextmanager
+    def connect(self) -> sqlite3.Connection:
+        """Connects to the persistent tier in a transaction, the database is created, or reset from an older schema, if
+        needed.
+        """
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        connection = sqlite3.connect(self.file_path, timeout=self.TIMEOUT)
+
+        try:
+            with connection:
+                if connection.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                    connection.execute('DROP TABLE IF EXISTS headers')
+                    connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS headers ('
+                    'file_path TEXT PRIMARY KEY, '
+                    'size INTEGER NOT NULL, '
+                    'mtime_ns INTEGER NOT NULL, '
+                    'data BLOB NOT NULL, '
+                    'accessed_time REAL NOT NULL)')
+
+                yield connection
+        finally:
+            connection.close()
+
+    def get_header(self, file_path: str) -> AOVEXRHeader:
+        """Gets the header of a file from memory, from the persistent tier, or reads it and caches it.
+
+        Raises AOVEXRHeaderError if the file cannot be read.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return AOVEXRHeader(file_path=file_path).read()
+
+        key = (file_stat.st_size, file_stat.st_mtime_ns)
+
+        with self.lock:
+            entry = self.headers.get(file_path)
+
+            if entry is not None and entry[0] == key:
+                self.headers.move_to_end(file_path)
+                self.hits += 1
+
+                return entry[1]
+
+        header = self.get_persistent_header(file_path=file_path, size=key[0], mtime_ns=key[1])
+
+        if header is None:
+            header = AOVEXRHeader(file_path=file_path).read()
+            self.set_persistent_header(header=header, size=key[0], mtime_ns=key[1])
+
+        with self.lock:
+            self.headers[file_path] = (key, header)
+            self.headers.move_to_end(file_path)
+
+            while len(self.headers) > self.max_entries:
+                self.headers.popitem(last=False)
+                self.evictions += 1
+
+        return header
+
+    def get_persistent_header(self, file_path: str, size: int, mtime_ns: int) -> AOVEXRHeader | None:
+        """Gets the header of a file from the persistent tier, None if it is not there, is stale or is disabled."""
+        header = None
+
+        if self.persistent:
+            try:
+                with self.connect() as connection:
+                    row = connection.execute(
+                        'SELECT data FROM headers WHERE file_path = ? AND size = ? AND mtime_ns = ?',
+                        (file_path, size, mtime_ns)).fetchone()
+
+                    if row is not None:
+                        connection.execute(
+                            'UPDATE headers SET accessed_time = ? WHERE file_path = ?', (time.time(), file_path))
+            except sqlite3.Error as error:
+                logger.warning('EXR header cache unavailable: %s', error)
+
+                row = None
+
+            if row is not None:
+                header = AOVEXRHeader(file_path=file_path).load(data=row[0])
+
+        with self.lock:
+            if header is None:
+                self.misses += 1
+            else:
+                self.persistent_hits += 1
+
+        return header
+
+    def get_stats(self) -> dict:
+        """Gets the hits, persistent hits, misses, evictions, entries and hit rate of the cache."""
+        with self.lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'persistent_hits': self.persistent_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.headers),
+                'hit_rate': (self.hits + self.persistent_hits) / lookups if lookups else 0.0}
+
+    def log_stats(self) -> None:
+        """Logs the statistics of the cache."""
+        stats = self.get_stats()
+
+        logger.info(
+            'EXR header cache: %d hits, %d persistent hits, %d misses, %d evictions, %d entries, %.0f%% hit rate.',
+            stats['hits'],
+            stats['persistent_hits'],
+            stats['misses'],
+            stats['evictions'],
+            stats['entries'],
+            stats['hit_rate'] * 100)
+
+    def set_persistent_header(self, header: AOVEXRHeader, size: int, mtime_ns: int) -> None:
+        """Stores the header bytes of a file in the persistent tier, the least recently used ones are evicted."""
+        if not self.persistent:
+            return
+
+        try:
+            with self.connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO headers VALUES (?, ?, ?, ?, ?)',
+                    (header.file_path, size, mtime_ns, header.data, time.time()))
+                connection.execute(
+                    'DELETE FROM headers WHERE file_path IN ('
+                    'SELECT file_path FROM headers ORDER BY accessed_time DESC LIMIT -1 OFFSET ?)',
+                    (self.MAX_PERSISTENT_ENTRIES,))
+        except sqlite3.Error as error:
+            logger.warning('EXR header cache unavailable: %s', error)
+
+    def set_max_entries(self, max_entries: int) -> None:
+        """Sets the maximum number of headers in memory."""
+        with self.lock:
+            self.max_entries = max_entries
+
+            while len(self.headers) > self.max_entries:
+                self.headers.popitem(last=False)
+                self.evictions += 1
+
+    def set_persistent(self, persistent: bool) -> None:
+        """Sets if the headers are also stored in the persistent tier."""
+        self.persistent = persistent
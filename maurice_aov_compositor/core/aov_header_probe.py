@@ -0,0 +1,159 @@
+"""
+========================================================================================================================
+Name: aov_header_probe.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_graph import AOVGraphCancelled
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVHeaderProbeReport(object):
+    """AOV header probe report.
+
+    The headers of the AOV files of a render by AOV, the files that could not be read and the inconsistencies between
+    the AOVs: resolution, pixel type and missing color channels.
+    """
+
+    def __init__(self):
+        """Initializes class attributes."""
+        self.headers = {}
+        self.errors = {}
+        self.mismatches = []
+
+    def add_mismatch(self, name: str, aovs_values: dict) -> None:
+        """Adds a mismatch if the AOVs have more than one value, the AOVs are grouped by value."""
+        values_aovs = {}
+
+        for aov, value in aovs_values.items():
+            values_aovs.setdefault(value, []).append(aov)
+
+        if len(values_aovs) > 1:
+            self.mismatches.append(f'{name} differ: ' + '; '.join(
+                f'{value}: {", ".join(sorted(aovs))}' for value, aovs in sorted(values_aovs.items())))
+
+    def get_data_windows(self) -> list:
+        """Gets the data windows of every probed AOV file."""
+        return [data_window for header in self.headers.values() for data_window in header.get_data_windows()]
+
+    def get_display_window(self) -> tuple | None:
+        """Gets the display window of the first probed AOV file, None if no file was read."""
+        return next((header.get_display_window() for header in self.headers.values()), None)
+
+    def get_summary(self) -> str:
+        """Gets the mismatches and errors as a single summary, empty if there are none."""
+        lines = list(self.mismatches)
+        lines.extend(f'Cannot read {aov}: {error}' for aov, error in sorted(self.errors.items()))
+
+        return '\n'.join(lines)
+
+    def is_consistent(self) -> bool:
+        """Checks if the AOVs are consistent and every file was read."""
+        return not self.mismatches and not self.errors
+
+
+class AOVHeaderProbe(object):
+    """AOV header probe.
+
+    Reads the headers of the AOV files of a render concurrently with a thread pool, before any node is created, and
+    checks that the AOVs have the same resolution, the same pixel type and their color channels. Reading headers is
+    bound by the storage latency, so probing many files over the network takes about as long as the slowest read. The
+    sequences are probed on their first frame.
+    """
+    MAX_WORKERS = 64
+
+    def __init__(self, header_cache: AOVHeaderCache = None, max_workers: int = None):
+        """Initializes class attributes."""
+        self.header_cache = header_cache if header_cache is not None else AOVHeaderCache()
+        self.max_workers = max_workers
+
+    def probe(self, files_paths: list, progress: callable = None) -> AOVHeaderProbeReport:
+        """Probes the (file path, AOV, frame range) files of a render.
+
+        The progress is called with the (value, maximum, text) of every probed file, the files not probed yet are
+        cancelled if it raises AOVGraphCancelled.
+        """
+        report = AOVHeaderProbeReport()
+
+        if not files_paths:
+            return report
+
+        max_workers = self.max_workers or min(len(files_paths), AOVHeaderProbe.MAX_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                aov: executor.submit(self.header_cache.get_header, self.get_probe_file_path(
+                    file_path=file_path,
+                    frame_range=frame_range))
+                for file_path, aov, frame_range in files_paths}
+
+            try:
+                for i, (aov, future) in enumerate(futures.items()):
+                    try:
+                        report.headers[aov] = future.result()
+                    except AOVEXRHeaderError as error:
+                        report.errors[aov] = str(error)
+
+                    if progress is not None:
+                        progress(i + 1, len(futures), f'Probing {aov}')
+            except AOVGraphCancelled:
+                executor.shutdown(cancel_futures=True)
+
+                raise
+
+        self.check(report=report)
+
+        if not report.is_consistent():
+            logger.warning('Inconsistent AOV files of %s:\n%s', files_paths[0][0], report.get_summary())
+
+        return report
+
+    def check(self, report: AOVHeaderProbeReport) -> None:
+        """Checks the consistency of the probed headers."""
+        resolutions = {}
+        pixel_types = {}
+        missing_channels = {}
+
+        for aov, header in report.headers.items():
+            part = header.get_part()
+            width, height = part.get_display_window_size()
+            resolutions[aov] = f'{width}x{height}'
+            pixel_types[aov] = '/'.join(sorted({channel.pixel_type for channel in part.channels}))
+
+            missing_color_channels = part.get_channel_index().get_missing_color_channels(layer='rgba')
+
+            if missing_color_channels:
+                missing_channels[aov] = ', '.join(missing_color_channels)
+
+        report.add_mismatch(name='Resolutions', aovs_values=resolutions)
+        report.add_mismatch(name='Pixel types', aovs_values=pixel_types)
+
+        for aov, channels in sorted(missing_channels.items()):
+            report.mismatches.append(f'Missing {channels} channels: {aov}')
+
+    @staticmethod
+    def get_probe_file_path(file_path: str, frame_range: tuple | None) -> str:
+        """Gets the file to probe, the first frame of a sequence."""
+        if not frame_range:
+            return file_path
+
+        return AOVSequence.get_frame_file_path(pattern=file_path, frame=frame_range[0])
+
+    def set_header_cache(self, header_cache: AOVHeaderCache) -> None:
+        """Sets the EXR header cache."""
+        self.header_cache = header_cache
+
+    def set_max_workers(self, max_workers: int | None) -> None:
+        """Sets the maximum number of threads reading the headers, None uses one per file up to the maximum."""
+        self.max_workers = max_workers
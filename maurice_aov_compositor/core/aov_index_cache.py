@@ -0,0 +1,183 @@
+"""
+========================================================================================================================
+Name: aov_index_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from contextlib import contextmanager
+import logging
+import sqlite3
+import json
+import time
+import os
+
+from maurice_aov_compositor.core.aov_directory_index import AOVDirectoryIndex
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.utils.maurice_paths import get_data_folder_path
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVIndexCache(object):
+    """AOV index cache.
+
+    Persistent SQLite cache of the AOVDirectoryIndex of the render folders, so a build on a render that was already
+    listed does not list it again. An index is valid while the modification time and size of its folder, read with a
+    single stat, are unchanged: adding, removing or renaming a file updates both. The indices are stored by folder and
+    naming template. When the stored file names take more than the maximum size, the least recently used indices are
+    evicted.
+
+    The file systems with coarse timestamps, such as NFS and SMB, can give a file written in the same tick as the
+    listing the modification time the folder already had, so the index of a folder modified less than a few seconds
+    before its listing is not stored: the folder is listed again on the next build.
+    """
+    FILE_NAME = 'directory_index_cache.db'
+
+    SCHEMA_VERSION = 3
+
+    MAX_SIZE = 64 * 1024 * 1024
+    TIMEOUT = 30.0
+
+    MIN_FOLDER_AGE = 5.0
+
+    def __init__(self, file_path: str = ''):
+        """Initializes class attributes."""
+        self.file_path = file_path or os.path.join(get_data_folder_path(), AOVIndexCache.FILE_NAME)
+        self.max_size = AOVIndexCache.MAX_SIZE
+
+    def clear(self) -> None:
+        """Removes every index."""
+        with self.connect() as connection:
+            connection.execute('DELETE FROM indices')
+
+        logger.info('Cleared the directory index cache.')
+
+    @contextmanager
+    def connect(self) -> sqlite3.Connection:
+        """Connects to the database in a transaction, the database is created, or reset from an older schema, if
+        needed.
+        """
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        connection = sqlite3.connect(self.file_path, timeout=self.TIMEOUT)
+
+        try:
+            with connection:
+                if connection.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                    connection.execute('DROP TABLE IF EXISTS indices')
+                    connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS indices ('
+                    'folder_path TEXT NOT NULL, '
+                    'naming_template TEXT NOT NULL, '
+                    'mtime_ns INTEGER NOT NULL, '
+                    'size INTEGER NOT NULL, '
+                    'entries_count INTEGER NOT NULL, '
+                    'files_names TEXT NOT NULL, '
+                    'folders_names TEXT NOT NULL, '
+                    'accessed_time REAL NOT NULL, '
+                    'PRIMARY KEY (folder_path, naming_template))')
+
+                yield connection
+        finally:
+            connection.close()
+
+    def evict(self, connection: sqlite3.Connection) -> None:
+        """Removes the least recently used indices until the cache fits in its maximum size."""
+        size = connection.execute('SELECT COALESCE(SUM(LENGTH(files_names)), 0) FROM indices').fetchone()[0]
+
+        if size <= self.max_size:
+            return
+
+        rows = connection.execute(
+            'SELECT folder_path, naming_template, LENGTH(files_names) FROM indices ORDER BY accessed_time')
+        evicted_keys = []
+
+        for folder_path, naming_template, files_names_size in rows.fetchall():
+            if size <= self.max_size:
+                break
+
+            evicted_keys.append((folder_path, naming_template))
+            size -= files_names_size
+
+        connection.executemany('DELETE FROM indices WHERE folder_path = ? AND naming_template = ?', evicted_keys)
+
+        logger.info('Evicted %d directory indices from the cache.', len(evicted_keys))
+
+    def get(self, folder_path: str, naming_template: AOVNamingTemplate) -> AOVDirectoryIndex | None:
+        """Gets the cached index of a folder, None if it is not cached or the folder changed."""
+        folder_stat = os.stat(folder_path)
+        key = (folder_path, naming_template.template)
+
+        with self.connect() as connection:
+            row = connection.execute(
+                'SELECT mtime_ns, size, entries_count, files_names, folders_names FROM indices '
+                'WHERE folder_path = ? AND naming_template = ?',
+                key).fetchone()
+
+            if row is None:
+                return None
+
+            mtime_ns, size, entries_count, files_names, folders_names = row
+
+            if mtime_ns != folder_stat.st_mtime_ns or size != folder_stat.st_size:
+                connection.execute('DELETE FROM indices WHERE folder_path = ? AND naming_template = ?', key)
+
+                return None
+
+            connection.execute(
+                'UPDATE indices SET accessed_time = ? WHERE folder_path = ? AND naming_template = ?',
+                (time.time(), *key))
+
+        return AOVDirectoryIndex(folder_path=folder_path, naming_template=naming_template).load(
+            files_names=json.loads(files_names),
+            entries_count=entries_count,
+            folders_names=json.loads(folders_names))
+
+    def get_index(self, folder_path: str, naming_template: AOVNamingTemplate,
+                  refresh: bool = False) -> AOVDirectoryIndex:
+        """Gets the index of a folder from the cache, or lists the folder and caches its index."""
+        try:
+            index = None if refresh else self.get(folder_path=folder_path, naming_template=naming_template)
+        except sqlite3.Error as error:
+            logger.warning('Directory index cache unavailable: %s', error)
+
+            return AOVDirectoryIndex(folder_path=folder_path, naming_template=naming_template).build()
+
+        if index is not None:
+            return index
+
+        folder_stat = os.stat(folder_path)
+        listing_time = time.time()
+        index = AOVDirectoryIndex(folder_path=folder_path, naming_template=naming_template).build()
+
+        if listing_time - folder_stat.st_mtime < self.MIN_FOLDER_AGE:
+            logger.debug('Not caching the index of %s, modified during the last seconds.', folder_path)
+
+            return index
+
+        try:
+            self.set(index=index, mtime_ns=folder_stat.st_mtime_ns, size=folder_stat.st_size)
+        except sqlite3.Error as error:
+            logger.warning('Directory index cache unavailable: %s', error)
+
+        return index
+
+    def set(self, index: AOVDirectoryIndex, mtime_ns: int, size: int) -> None:
+        """Sets the index of a folder with the modification time and size of the folder before it was listed."""
+        with self.connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO indices VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (index.folder_path, index.naming_template.template, mtime_ns, size, index.entries_count,
+                 json.dumps(index.get_all_files_names()), json.dumps(index.folders_names), time.time()))
+
+            self.evict(connection=connection)
+
+    def set_max_size(self, max_size: int) -> None:
+        """Sets the maximum size in bytes of the stored file names."""
+        self.max_size = max_size
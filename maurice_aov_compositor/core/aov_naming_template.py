@@ -0,0 +1,114 @@
+"""
+========================================================================================================================
+Name: aov_naming_template.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import re
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+
+
+class AOVNamingTemplate(object):
+    """AOV naming template.
+
+    Describes the names of the AOV files, such as '{shot}_{layer}.{aov}.{frame}.exr', and compiles it once into a
+    regular expression so every file name is parsed with a single match. The fields are written between braces, the
+    {aov} field is required, {frame} matches frame numbers and '####' or '%04d' patterns, and any other field matches
+    any text. The parts between brackets are optional. The base name of a file is the part of its name before the AOV.
+    """
+    DEFAULT = '{base}.{aov}[.{frame}].exr'
+
+    AOV = 'aov'
+    FRAME = 'frame'
+
+    FIELDS_PATTERNS = {AOV: r'[^./\\]+', FRAME: r'\d+|#+|%0?\d*d'}
+    FIELD_PATTERN = r'.+?'
+
+    TOKEN_PATTERN = re.compile(r'\{(\w+)\}|\[|\]|[^{}\[\]]+')
+
+    def __init__(self, template: str = DEFAULT):
+        """Initializes class attributes."""
+        self.template = template
+        self.pattern = self.compile(template=template)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f'AOVNamingTemplate({self.template!r})'
+
+    @classmethod
+    def compile(cls, template: str) -> re.Pattern:
+        """Compiles the template into a regular expression."""
+        pattern = []
+        fields = set()
+        optional_depth = 0
+        position = 0
+
+        for match in cls.TOKEN_PATTERN.finditer(template):
+            if match.start() != position:
+                break
+
+            position = match.end()
+            token = match.group()
+
+            if match.group(1):
+                field = match.group(1)
+
+                if field in fields:
+                    raise AOVGraphError(f'Repeated field in naming template: {template}')
+
+                fields.add(field)
+                pattern.append(f'(?P<{field}>{cls.FIELDS_PATTERNS.get(field, cls.FIELD_PATTERN)})')
+            elif token == '[':
+                optional_depth += 1
+                pattern.append('(?:')
+            elif token == ']':
+                optional_depth -= 1
+
+                if optional_depth < 0:
+                    break
+
+                pattern.append(')?')
+            else:
+                pattern.append(re.escape(token))
+
+        if position != len(template) or optional_depth != 0:
+            raise AOVGraphError(f'Invalid naming template: {template}')
+
+        if cls.AOV not in fields:
+            raise AOVGraphError(f'Naming template without {{{cls.AOV}}} field: {template}')
+
+        return re.compile(''.join(pattern), re.IGNORECASE)
+
+    def get_frame_span(self, file_name: str) -> tuple | None:
+        """Gets the (start, end) of the frame in the file name, None if it has no frame."""
+        if self.FRAME not in self.pattern.groupindex:
+            return None
+
+        match = self.pattern.fullmatch(file_name)
+
+        if match is None or match.group(self.FRAME) is None:
+            return None
+
+        return match.span(self.FRAME)
+
+    def parse(self, file_name: str) -> tuple | None:
+        """Parses a file name into its (base name, AOV, frame), None if it does not follow the template.
+
+        The frame is None for the files without frame and for the '####' or '%04d' sequence patterns.
+        """
+        match = self.pattern.fullmatch(file_name)
+
+        if match is None:
+            return None
+
+        groups = match.groupdict()
+        frame = groups.get(self.FRAME)
+
+        return (
+            file_name[:match.start(self.AOV)].rstrip('._- '),
+            groups[self.AOV],
+            int(frame) if frame and frame.isdigit() else None)
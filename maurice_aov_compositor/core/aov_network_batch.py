@@ -0,0 +1,268 @@
+"""
+========================================================================================================================
+Name: aov_network_batch.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+import logging
+import os
+
+from maurice_aov_compositor.core.aov_settings_redshift import AOVSettingsRedshift
+from maurice_aov_compositor.core.aov_settings_arnold import AOVSettingsArnold
+from maurice_aov_compositor.core.aov_settings_v_ray import AOVSettingsVRay
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph_layout import AOVGraphLayout
+from maurice_aov_compositor.core.aov_graph_script import AOVGraphScriptWriter
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_header_probe import AOVHeaderProbe
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVNetworkBatch(object):
+    """AOV network batch.
+
+    Builds the AOV networks of a shot list as Nuke script files without Nuke or Qt. Every input path, a render folder
+    or one of its AOV files, is a shot and gets its own script with the networks of its renders side by side. An EXR
+    file with its AOVs as layers gets a single file network, its layers are read from its header. The shots are built
+    in parallel by a pool of processes.
+    """
+    ARNOLD = 'arnold'
+    REDSHIFT = 'redshift'
+    V_RAY = 'v-ray'
+
+    PRESETS = {ARNOLD: AOVSettingsArnold, REDSHIFT: AOVSettingsRedshift, V_RAY: AOVSettingsVRay}
+
+    STANDARD = 'standard'
+    ADVANCED = 'advanced'
+
+    COMPOSITING_OPERATIONS = (STANDARD, ADVANCED)
+
+    SCRIPT_SUFFIX = '_aov_network.nk'
+
+    def __init__(self):
+        """Initializes class attributes."""
+        self.preset = AOVNetworkBatch.ARNOLD
+        self.compositing_operation = AOVNetworkBatch.STANDARD
+        self.topology = AOVNetworkPlanner.LINEAR
+        self.layout_style = AOVGraphLayout.GRID
+        self.layer_native = False
+        self.crop_overscan = False
+        self.output_folder_path = ''
+        self.max_workers = None
+        self.use_index_cache = True
+        self.naming_template = AOVNamingTemplate.DEFAULT
+        self.max_depth = AOVFileFinder.MAX_DEPTH
+        self.strict = False
+
+    def build_script(self, path: str) -> tuple:
+        """Builds the script of a shot and returns its (script path, networks count, nodes count).
+
+        The path is made absolute first, so the Read nodes of the script find their files from any folder.
+        """
+        path = os.path.abspath(path)
+        aovs_settings = self.get_aovs_settings()
+
+        file_finder = AOVFileFinder(
+            aovs_settings=aovs_settings,
+            index_cache=AOVIndexCache() if self.use_index_cache else None,
+            naming_template=AOVNamingTemplate(template=self.naming_template))
+        file_finder.set_max_depth(max_depth=self.max_depth)
+
+        planner = AOVNetworkPlanner()
+        planner.set_aovs_settings(aovs=aovs_settings)
+        planner.set_topology(topology=self.topology)
+        planner.set_layer_native(layer_native=self.layer_native)
+        planner.set_crop_overscan(crop_overscan=self.crop_overscan)
+
+        layout = AOVGraphLayout()
+        layout.set_style(style=self.layout_style)
+
+        if os.path.isdir(path):
+            renders = file_finder.get_renders(folder_path=path.replace('\\', '/').rstrip('/'))
+        else:
+            files_paths = file_finder.find_files_paths(target_file_path=path.replace('\\', '/'))
+            renders = {file_finder.get_base_name(file_name=os.path.basename(path)): files_paths} if files_paths else {}
+
+        header_probe = AOVHeaderProbe(header_cache=AOVHeaderCache(persistent=self.use_index_cache))
+        graphs = []
+
+        for base_name in sorted(renders):
+            files_paths = renders[base_name]
+            probe_report = header_probe.probe(files_paths=files_paths)
+
+            if self.strict and not probe_report.is_consistent():
+                raise AOVGraphError(f'Inconsistent AOV files of {base_name}:\n{probe_report.get_summary()}')
+
+            graph = planner.plan_standard_network_from_multi_files(
+                files_paths=files_paths,
+                network_id=file_finder.get_network_id(files_paths=files_paths),
+                data_windows=probe_report.get_data_windows(),
+                display_window=probe_report.get_display_window())
+
+            layout.apply(graph=graph)
+            graphs.append(graph)
+
+        if not graphs and os.path.isfile(path):
+            graph = self.plan_single_file_network(file_path=path.replace('\\', '/'), planner=planner)
+
+            if graph is not None:
+                layout.apply(graph=graph)
+                graphs.append(graph)
+
+        if not graphs:
+            raise AOVGraphError(f'No AOV files found: {path}')
+
+        script_path = self.get_script_path(path=path)
+
+        AOVGraphScriptWriter().write_script_file(
+            graphs=graphs,
+            origins=layout.get_side_by_side_origins(graphs=graphs, origins=[(0, 0)] * len(graphs)),
+            file_path=script_path)
+
+        return script_path, len(graphs), sum(graph.get_node_count() for graph in graphs)
+
+    def get_aovs_settings(self) -> dict:
+        """Gets the AOVs settings of the preset and compositing operation."""
+        aov_settings = AOVNetworkBatch.PRESETS[self.preset]()
+
+        if self.compositing_operation == AOVNetworkBatch.ADVANCED:
+            aovs = aov_settings.get_advanced()
+        else:
+            aovs = aov_settings.get_standard()
+
+        return {key: value[1] for key, value in aovs.items()}
+
+    def get_script_path(self, path: str) -> str:
+        """Gets the path of the script of a shot."""
+        if os.path.isdir(path):
+            folder_path = os.path.abspath(path)
+            script_name = os.path.basename(folder_path)
+        else:
+            folder_path = os.path.dirname(os.path.abspath(path))
+            naming_template = AOVNamingTemplate(template=self.naming_template)
+            parsed_file_name = naming_template.parse(file_name=os.path.basename(path))
+            script_name = parsed_file_name[0] if parsed_file_name else Path(path).stem
+
+        return os.path.join(self.output_folder_path or folder_path, f'{script_name}{self.SCRIPT_SUFFIX}')
+
+    def plan_single_file_network(self, file_path: str, planner: AOVNetworkPlanner) -> AOVGraph | None:
+        """Plans the network of a single EXR file with its AOVs as layers or parts, None if it has none of the AOVs.
+
+        The layers are read from the EXR header, without Nuke, the parts of a multipart file are read by a single Read
+        node.
+        """
+        header = AOVHeaderCache(persistent=self.use_index_cache).get_header(file_path=file_path)
+        channel_index = header.get_channel_index()
+
+        if not planner.get_aovs(channel_index=channel_index):
+            return None
+
+        return planner.plan_standard_network_from_single_file(
+            channel_index=channel_index,
+            read_node_name=os.path.basename(file_path),
+            network_id=file_path,
+            read_file_path=file_path,
+            data_windows=header.get_data_windows(),
+            display_window=header.get_display_window())
+
+    def run(self, paths: list) -> dict:
+        """Builds the scripts of the shots and returns the build_script result, or the error, by path."""
+        results = {}
+
+        if self.output_folder_path:
+            os.makedirs(self.output_folder_path, exist_ok=True)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.build_script, path): path for path in paths}
+
+            for future in as_completed(futures):
+                path = futures[future]
+
+                try:
+                    results[path] = future.result()
+                except Exception as error:
+                    logger.error('Failed to build %s: %s', path, error)
+
+                    results[path] = error
+                else:
+                    logger.info('Built %s: %d networks, %d nodes.', *results[path])
+
+        return results
+
+    def set_compositing_operation(self, compositing_operation: str) -> None:
+        """Sets the compositing operation."""
+        if compositing_operation not in AOVNetworkBatch.COMPOSITING_OPERATIONS:
+            raise AOVGraphError(f'Unknown compositing operation: {compositing_operation}')
+
+        self.compositing_operation = compositing_operation
+
+    def set_crop_overscan(self, crop_overscan: bool) -> None:
+        """Sets the crop overscan mode, which crops the data windows that overflow the format."""
+        self.crop_overscan = crop_overscan
+
+    def set_layer_native(self, layer_native: bool) -> None:
+        """Sets the layer native mode."""
+        self.layer_native = layer_native
+
+    def set_strict(self, strict: bool) -> None:
+        """Sets the strict mode, which fails the shots whose AOV files are inconsistent instead of logging them."""
+        self.strict = strict
+
+    def set_use_index_cache(self, use_index_cache: bool) -> None:
+        """Sets if the render folders indices and the EXR headers are read from and stored in the persistent caches."""
+        self.use_index_cache = use_index_cache
+
+    def set_layout_style(self, style: str) -> None:
+        """Sets the layout style."""
+        if style not in AOVGraphLayout.STYLES:
+            raise AOVGraphError(f'Unknown layout style: {style}')
+
+        self.layout_style = style
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets the maximum depth of the render layers subfolders searched, 0 searches only the shot folder."""
+        if max_depth < 0:
+            raise AOVGraphError(f'Invalid subfolders depth: {max_depth}')
+
+        self.max_depth = max_depth
+
+    def set_max_workers(self, max_workers: int | None) -> None:
+        """Sets the maximum number of processes, None uses one per CPU."""
+        self.max_workers = max_workers
+
+    def set_naming_template(self, naming_template: str) -> None:
+        """Sets the naming template of the AOV files, see AOVNamingTemplate."""
+        AOVNamingTemplate.compile(template=naming_template)
+
+        self.naming_template = naming_template
+
+    def set_output_folder_path(self, output_folder_path: str) -> None:
+        """Sets the folder the scripts are written to, by default the folder of every shot."""
+        self.output_folder_path = output_folder_path
+
+    def set_preset(self, preset: str) -> None:
+        """Sets the renderer preset."""
+        if preset not in AOVNetworkBatch.PRESETS:
+            raise AOVGraphError(f'Unknown renderer preset: {preset}')
+
+        self.preset = preset
+
+    def set_topology(self, topology: str) -> None:
+        """Sets the merge topology."""
+        if topology not in AOVNetworkPlanner.TOPOLOGIES:
+            raise AOVGraphError(f'Unknown merge topology: {topology}')
+
+        self.topology = topology
@@ -0,0 +1,506 @@
+"""
+========================================================================================================================
+Name: aov_network_planner.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import logging
+
+from maurice_aov_compositor.core.aov_channel_index import AOVChannelIndex
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVNetworkPlanner(object):
+    """AOV network planner.
+
+    Plans the AOV networks as an AOVGraph without creating any Nuke node. Every AOV gets a branch that ends in a
+    Shuffle node, the branches are then added together with one of the merge topologies:
+
+    - Linear: a chain of plus merges, one per AOV.
+    - Tree: a balanced binary tree of plus merges, log2(N) merges deep.
+    - Wide: a single plus merge that takes every AOV branch as an A input.
+
+    The multipart files are read by a single Read node, as Nuke reads every part of a file into the channels of one
+    Read node and has no knob to read only some of its parts.
+
+    In layer native mode the per-AOV Dot and Shuffle nodes are skipped: the merges read the AOV layers straight from
+    the Read node through their A and B channels into rgba, as the Shuffle nodes do, and separate files are merged
+    straight from their Read nodes.
+
+    Every merge keeps the union of the bounding boxes of its inputs, the Merge2 default, set explicitly so a studio
+    default does not change it: Nuke only processes the union of the data windows of the AOVs. In crop overscan mode,
+    when the data windows, read from the EXR headers, overflow the display window, a Crop to the format is added
+    before the output so the overscan is not processed downstream. It is off by default, as lens distortions,
+    reformats and transforms downstream need the overscan.
+
+    Every network ends in an output Dot with a fixed key, so the nodes connected downstream of it survive the
+    incremental updates of the network.
+
+    The planner only sets the column and row of the nodes, the positions are computed by AOVGraphLayout.
+    """
+    LINEAR = 'linear'
+    TREE = 'tree'
+    WIDE = 'wide'
+
+    TOPOLOGIES = (LINEAR, TREE, WIDE)
+
+    READ_ROW = 0
+    DOT_ROW = 1
+    SHUFFLE_ROW = 2
+    MERGE_ROW = 3
+
+    MERGE_MASK_INPUT = 2
+
+    MERGE_KNOBS = {'operation': 'plus', 'bbox': 'union'}
+
+    CROP_KEY = 'crop/overscan'
+    OUTPUT_KEY = 'dot/output'
+
+    def __init__(self):
+        """Initializes class attributes."""
+        self.aovs_settings = {}
+        self.aovs = set()
+        self.topology = AOVNetworkPlanner.LINEAR
+        self.layer_native = False
+        self.crop_overscan = False
+        self.nodes_saved = 0
+
+    def plan_standard_network_from_multi_files(self, files_paths: list, network_id: str = '', data_windows: list = None,
+                                               display_window: tuple = None) -> AOVGraph:
+        """Plans a standard network from the (file path, AOV, frame range) files, one Read per AOV file or sequence.
+
+        The data windows and display window of the AOV files, read from their headers, crop the overscan if given.
+        """
+        graph = AOVGraph(network_id=network_id)
+        branches = []
+
+        self.nodes_saved = 0
+
+        for i, file_path in enumerate(files_paths):
+            file_path, aov, frame_range = file_path
+
+            read_key = f'read/{aov}'
+            graph.add_node(
+                key=read_key,
+                node_class='Read',
+                knobs=self.get_read_knobs(file_path=file_path, frame_range=frame_range),
+                column=i,
+                row=AOVNetworkPlanner.READ_ROW)
+
+            if self.layer_native:
+                branches.append((aov, read_key))
+                self.nodes_saved += 1
+
+                continue
+
+            shuffle_key = f'shuffle/{aov}'
+            graph.add_node(
+                key=shuffle_key,
+                node_class='Shuffle2',
+                knobs={'in1': 'rgba', 'label': aov},
+                inputs=[read_key],
+                column=i,
+                row=AOVNetworkPlanner.SHUFFLE_ROW)
+
+            branches.append((aov, shuffle_key))
+
+        graph.output_key = self.add_output_node(
+            graph=graph,
+            input_key=self.add_crop_node(
+                graph=graph,
+                input_key=self.add_merge_network(graph=graph, branches=branches),
+                data_windows=data_windows,
+                display_window=display_window))
+
+        if self.nodes_saved:
+            logger.info('Layer native network saved %d nodes.', self.nodes_saved)
+
+        return graph
+
+    def plan_standard_network_from_single_file(self, channel_index: AOVChannelIndex, read_node_name: str,
+                                               network_id: str = '', read_file_path: str = '',
+                                               data_windows: list = None, display_window: tuple = None) -> AOVGraph:
+        """Plans a standard network from a single file read by an existing Read node, or by a new Read node of the
+        read file path. The data windows and display window of the file crop the overscan if given.
+        """
+        self.nodes_saved = 0
+
+        if self.layer_native:
+            if self.topology == AOVNetworkPlanner.WIDE:
+                logger.info('The wide merge topology needs shuffled AOVs, the layer native mode is skipped.')
+            else:
+                return self.plan_layer_native_network_from_single_file(
+                    channel_index=channel_index,
+                    read_node_name=read_node_name,
+                    network_id=network_id,
+                    read_file_path=read_file_path,
+                    data_windows=data_windows,
+                    display_window=display_window)
+
+        return self.plan_shuffle_network_from_single_file(
+            channel_index=channel_index,
+            read_node_name=read_node_name,
+            network_id=network_id,
+            read_file_path=read_file_path,
+            data_windows=data_windows,
+            display_window=display_window)
+
+    def plan_shuffle_network_from_single_file(self, channel_index: AOVChannelIndex, read_node_name: str,
+                                              network_id: str = '', read_file_path: str = '',
+                                              data_windows: list = None, display_window: tuple = None) -> AOVGraph:
+        """Plans a network that shuffles every AOV layer out of the Read node before merging it."""
+        graph = AOVGraph(network_id=network_id)
+        self.add_single_file_read_node(graph=graph, read_node_name=read_node_name, read_file_path=read_file_path)
+
+        last_dot_key = 'read'
+        branches = []
+
+        for i, aov in enumerate(self.get_aovs(channel_index=channel_index)):
+            dot_key = f'dot/{aov}'
+            graph.add_node(
+                key=dot_key,
+                node_class='Dot',
+                inputs=[last_dot_key],
+                column=i,
+                row=AOVNetworkPlanner.DOT_ROW)
+
+            shuffle_key = f'shuffle/{aov}'
+            graph.add_node(
+                key=shuffle_key,
+                node_class='Shuffle2',
+                knobs={'in1': aov, 'label': aov},
+                inputs=[dot_key],
+                column=i,
+                row=AOVNetworkPlanner.SHUFFLE_ROW)
+
+            last_dot_key = dot_key
+            branches.append((aov, shuffle_key))
+
+        graph.output_key = self.add_output_node(
+            graph=graph,
+            input_key=self.add_crop_node(
+                graph=graph,
+                input_key=self.add_merge_network(graph=graph, branches=branches),
+                data_windows=data_windows,
+                display_window=display_window))
+
+        return graph
+
+    def plan_layer_native_network_from_single_file(self, channel_index: AOVChannelIndex, read_node_name: str,
+                                                   network_id: str = '', read_file_path: str = '',
+                                                   data_windows: list = None, display_window: tuple = None) -> AOVGraph:
+        """Plans a network whose merges read the AOV layers straight from the Read node."""
+        graph = AOVGraph(network_id=network_id)
+        self.add_single_file_read_node(graph=graph, read_node_name=read_node_name, read_file_path=read_file_path)
+
+        aovs = self.get_aovs(channel_index=channel_index)
+        output_key = None
+
+        if len(aovs) == 1:
+            output_key = graph.add_node(
+                key=f'shuffle/{aovs[0]}',
+                node_class='Shuffle2',
+                knobs={'in1': aovs[0], 'label': aovs[0]},
+                inputs=['read'],
+                column=0,
+                row=AOVNetworkPlanner.SHUFFLE_ROW).key
+        elif aovs:
+            operands = [('read', aov, i) for i, aov in enumerate(aovs)]
+
+            if self.topology == AOVNetworkPlanner.TREE:
+                output_key = self.add_tree_layer_merge_network(graph=graph, operands=operands)
+            else:
+                output_key = self.add_linear_layer_merge_network(graph=graph, operands=operands)
+
+        graph.output_key = self.add_output_node(
+            graph=graph,
+            input_key=self.add_crop_node(
+                graph=graph,
+                input_key=output_key,
+                data_windows=data_windows,
+                display_window=display_window))
+
+        self.nodes_saved = self.get_layer_native_nodes_saved(aovs_count=len(aovs))
+
+        logger.info('Layer native network saved %d nodes.', self.nodes_saved)
+
+        return graph
+
+    @staticmethod
+    def add_single_file_read_node(graph: AOVGraph, read_node_name: str, read_file_path: str = '') -> None:
+        """Adds the Read node of a single file, a reference to the existing Read node or a new Read node of the file."""
+        if read_file_path:
+            graph.add_node(
+                key='read',
+                node_class='Read',
+                knobs={'file': read_file_path},
+                row=AOVNetworkPlanner.READ_ROW)
+        else:
+            graph.add_external_node(key='read', node_class='Read', external_name=read_node_name)
+
+    @staticmethod
+    def add_layer_merge_node(graph: AOVGraph, key: str, operand_b: tuple, operand_a: tuple, column: float,
+                             row: int) -> tuple:
+        """Adds a merge of two (node key, channels, column) operands and returns the result as an operand."""
+        input_b_key, b_channels, _ = operand_b
+        input_a_key, a_channels, _ = operand_a
+
+        knobs = dict(AOVNetworkPlanner.MERGE_KNOBS, Achannels=a_channels, Bchannels=b_channels, output='rgba')
+
+        if a_channels != 'rgba':
+            knobs['label'] = a_channels
+
+        graph.add_node(
+            key=key,
+            node_class='Merge2',
+            knobs=knobs,
+            inputs=[input_b_key, input_a_key],
+            column=column,
+            row=row)
+
+        return key, 'rgba', column
+
+    def add_linear_layer_merge_network(self, graph: AOVGraph, operands: list) -> str:
+        """Adds a chain of layer merges, one per operand after the first one."""
+        last_operand = operands[0]
+
+        for operand in operands[1:]:
+            _, aov, column = operand
+
+            last_operand = self.add_layer_merge_node(
+                graph=graph,
+                key=f'merge/{aov}',
+                operand_b=last_operand,
+                operand_a=operand,
+                column=column,
+                row=AOVNetworkPlanner.MERGE_ROW)
+
+        return last_operand[0]
+
+    def add_tree_layer_merge_network(self, graph: AOVGraph, operands: list) -> str:
+        """Adds a balanced binary tree of layer merges."""
+        level = 0
+
+        while len(operands) > 1:
+            next_operands = []
+
+            for i in range(0, len(operands) - 1, 2):
+                next_operands.append(self.add_layer_merge_node(
+                    graph=graph,
+                    key=f'merge/tree/{level}/{i // 2}',
+                    operand_b=operands[i],
+                    operand_a=operands[i + 1],
+                    column=(operands[i][2] + operands[i + 1][2]) / 2,
+                    row=AOVNetworkPlanner.MERGE_ROW + level))
+
+            if len(operands) % 2:
+                next_operands.append(operands[-1])
+
+            operands = next_operands
+            level += 1
+
+        return operands[0][0]
+
+    def add_crop_node(self, graph: AOVGraph, input_key: str | None, data_windows: list | None,
+                      display_window: tuple | None) -> str | None:
+        """Adds a Crop to the display window under the input node in crop overscan mode, when the union of the (x min,
+        y min, x max, y max) data windows overflows the display window, and returns the key of the node the output goes
+        under. The crop box keeps the origin of the display window.
+        """
+        if input_key is None or not data_windows or not display_window:
+            return input_key
+
+        x_min, y_min, x_max, y_max = AOVNetworkPlanner.get_data_windows_union(data_windows=data_windows)
+        display_x_min, display_y_min, display_x_max, display_y_max = display_window
+        width = display_x_max - display_x_min + 1
+        height = display_y_max - display_y_min + 1
+
+        logger.info(
+            'The union of the data windows is %.0f%% of the format.',
+            100.0 * max(x_max - x_min + 1, 0) * max(y_max - y_min + 1, 0) / (width * height))
+
+        if not self.crop_overscan or (x_min >= display_x_min and y_min >= display_y_min and x_max <= display_x_max
+                                      and y_max <= display_y_max):
+            return input_key
+
+        input_node = graph.get_node(input_key)
+        graph.add_node(
+            key=AOVNetworkPlanner.CROP_KEY,
+            node_class='Crop',
+            knobs={'box': [display_x_min, display_y_min, display_x_max + 1, display_y_max + 1], 'label': 'overscan'},
+            inputs=[input_key],
+            column=input_node.column,
+            row=max(graph_node.row for graph_node in graph.get_nodes()) + 1)
+
+        return AOVNetworkPlanner.CROP_KEY
+
+    @staticmethod
+    def add_output_node(graph: AOVGraph, input_key: str | None) -> str:
+        """Adds the output Dot of the network under the input node and returns its key."""
+        if input_key is None:
+            return ''
+
+        input_node = graph.get_node(input_key)
+        graph.add_node(
+            key=AOVNetworkPlanner.OUTPUT_KEY,
+            node_class='Dot',
+            inputs=[input_key],
+            column=input_node.column,
+            row=max(graph_node.row for graph_node in graph.get_nodes()) + 1)
+
+        return AOVNetworkPlanner.OUTPUT_KEY
+
+    def add_merge_network(self, graph: AOVGraph, branches: list) -> str | None:
+        """Adds the merges that add the (AOV, node key) branches together and returns the output key."""
+        if not branches:
+            return None
+
+        if len(branches) == 1 or self.topology == AOVNetworkPlanner.LINEAR:
+            return self.add_linear_merge_network(graph=graph, branches=branches)
+        elif self.topology == AOVNetworkPlanner.TREE:
+            return self.add_tree_merge_network(graph=graph, branches=branches)
+        elif self.topology == AOVNetworkPlanner.WIDE:
+            return self.add_wide_merge_network(graph=graph, branches=branches)
+
+    @staticmethod
+    def add_linear_merge_network(graph: AOVGraph, branches: list) -> str:
+        """Adds a chain of merges, one per branch."""
+        last_merge_key = None
+
+        for i, branch in enumerate(branches):
+            aov, branch_key = branch
+            branch_node = graph.get_node(branch_key)
+
+            if i > 0:
+                merge_key = f'merge/{aov}'
+                graph.add_node(
+                    key=merge_key,
+                    node_class='Merge2',
+                    knobs=dict(AOVNetworkPlanner.MERGE_KNOBS),
+                    inputs=[branch_key, last_merge_key],
+                    column=branch_node.column,
+                    row=AOVNetworkPlanner.MERGE_ROW)
+            else:
+                merge_key = 'dot/base'
+                graph.add_node(
+                    key=merge_key,
+                    node_class='Dot',
+                    inputs=[branch_key],
+                    column=branch_node.column,
+                    row=AOVNetworkPlanner.MERGE_ROW)
+
+            last_merge_key = merge_key
+
+        return last_merge_key
+
+    @staticmethod
+    def add_tree_merge_network(graph: AOVGraph, branches: list) -> str:
+        """Adds a balanced binary tree of merges."""
+        level_keys = [branch_key for _, branch_key in branches]
+        level = 0
+
+        while len(level_keys) > 1:
+            next_level_keys = []
+
+            for i in range(0, len(level_keys) - 1, 2):
+                input_b_node = graph.get_node(level_keys[i])
+                input_a_node = graph.get_node(level_keys[i + 1])
+
+                merge_key = f'merge/tree/{level}/{i // 2}'
+                graph.add_node(
+                    key=merge_key,
+                    node_class='Merge2',
+                    knobs=dict(AOVNetworkPlanner.MERGE_KNOBS),
+                    inputs=[input_b_node.key, input_a_node.key],
+                    column=(input_b_node.column + input_a_node.column) / 2,
+                    row=AOVNetworkPlanner.MERGE_ROW + level)
+
+                next_level_keys.append(merge_key)
+
+            if len(level_keys) % 2:
+                next_level_keys.append(level_keys[-1])
+
+            level_keys = next_level_keys
+            level += 1
+
+        return level_keys[0]
+
+    def add_wide_merge_network(self, graph: AOVGraph, branches: list) -> str:
+        """Adds a single merge that takes the first branch as B and every other branch as an A input."""
+        branches_keys = [branch_key for _, branch_key in branches]
+        branches_columns = [graph.get_node(branch_key).column for branch_key in branches_keys]
+
+        merge_node = graph.add_node(
+            key='merge/wide',
+            node_class='Merge2',
+            knobs=dict(AOVNetworkPlanner.MERGE_KNOBS),
+            column=sum(branches_columns) / len(branches_columns),
+            row=AOVNetworkPlanner.MERGE_ROW)
+
+        merge_node.set_input(0, branches_keys[0])
+        merge_node.set_input(1, branches_keys[1])
+
+        for i, branch_key in enumerate(branches_keys[2:]):
+            merge_node.set_input(self.MERGE_MASK_INPUT + 1 + i, branch_key)
+
+        return merge_node.key
+
+    @staticmethod
+    def get_data_windows_union(data_windows: list) -> tuple:
+        """Gets the (x min, y min, x max, y max) union of the data windows."""
+        return (
+            min(data_window[0] for data_window in data_windows),
+            min(data_window[1] for data_window in data_windows),
+            max(data_window[2] for data_window in data_windows),
+            max(data_window[3] for data_window in data_windows))
+
+    def get_aovs(self, channel_index: AOVChannelIndex) -> list:
+        """Gets the sorted AOVs of the AOVs settings found in the channel index."""
+        return channel_index.get_aovs(aovs=self.aovs)
+
+    def get_layer_native_nodes_saved(self, aovs_count: int) -> int:
+        """Gets the number of nodes the layer native network of a single file saves over its shuffle network: the Dot
+        and Shuffle of every AOV, and the base Dot of the linear merges, a single AOV keeps its Shuffle.
+        """
+        if aovs_count < 2:
+            return 2 * aovs_count
+
+        return 2 * aovs_count + (1 if self.topology == AOVNetworkPlanner.LINEAR else 0)
+
+    @staticmethod
+    def get_read_knobs(file_path: str, frame_range: tuple | None) -> dict:
+        """Gets the knobs of a Read node of a file, or of a sequence and its (first frame, last frame) range."""
+        knobs = {'file': file_path}
+
+        if frame_range:
+            first_frame, last_frame = frame_range
+            knobs.update({'first': first_frame, 'last': last_frame, 'origfirst': first_frame, 'origlast': last_frame})
+
+        return knobs
+
+    def set_aovs_settings(self, aovs: dict) -> None:
+        """Sets AOVs settings."""
+        self.aovs_settings = aovs
+        self.aovs = set(aovs.values())
+
+    def set_crop_overscan(self, crop_overscan: bool) -> None:
+        """Sets the crop overscan mode, which crops the data windows that overflow the format."""
+        self.crop_overscan = crop_overscan
+
+    def set_layer_native(self, layer_native: bool) -> None:
+        """Sets the layer native mode."""
+        self.layer_native = layer_native
+
+    def set_topology(self, topology: str) -> None:
+        """Sets the merge topology."""
+        if topology not in AOVNetworkPlanner.TOPOLOGIES:
+            raise AOVGraphError(f'Unknown merge topology: {topology}')
+
+        self.topology = topology
@@ -0,0 +1,71 @@
+"""
+========================================================================================================================
+Name: aov_network_transaction.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import nuke
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVNetworkTransaction(object):
+    """AOV network transaction.
+
+    Context manager that runs a network build as a single Nuke undo entry. If the build raises, the undo entry is
+    cancelled, which reverts the changes made so far, and any node created inside the transaction that is still in
+    the script is deleted, so a failed build never leaves a half built network behind.
+    """
+
+    def __init__(self, name: str = 'Create AOV Network'):
+        """Initializes class attributes."""
+        self.name = name
+        self.undo = None
+        self.existing_nodes_names = set()
+
+    def __enter__(self) -> 'AOVNetworkTransaction':
+        """Begins the undo entry."""
+        self.existing_nodes_names = {node.fullName() for node in nuke.allNodes()}
+
+        self.undo = nuke.Undo()
+        self.undo.begin(self.name)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """Ends the undo entry, or cancels it and deletes the created nodes if the build raised."""
+        if exc_type is None:
+            self.undo.end()
+
+            return False
+
+        self.undo.cancel()
+        self.rollback()
+
+        logger.error('%s failed, the partially created nodes were removed: %s', self.name, exc_value)
+
+        return False
+
+    def get_created_nodes(self) -> list:
+        """Gets the nodes created since the transaction began."""
+        return [node for node in nuke.allNodes() if node.fullName() not in self.existing_nodes_names]
+
+    def rollback(self) -> None:
+        """Deletes the nodes created since the transaction began."""
+        undo_disabled = nuke.Undo.disabled()
+
+        if not undo_disabled:
+            nuke.Undo.disable()
+
+        try:
+            for node in self.get_created_nodes():
+                nuke.delete(node)
+        finally:
+            if not undo_disabled:
+                nuke.Undo.enable()
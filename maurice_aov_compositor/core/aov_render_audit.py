@@ -0,0 +1,235 @@
+"""
+========================================================================================================================
+Name: aov_render_audit.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import logging
+import json
+import os
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeader
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRPart
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_header_probe import AOVHeaderProbe
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVRenderAudit(object):
+    """AOV render audit.
+
+    Audits the AOV files of renders for what slows the comp down, from their headers only, without Nuke: the
+    compression of every AOV, the tiled layout, the full float channels the network reads, the channels it never reads
+    and the data windows larger than the format. Nuke reads EXR files scanline by scanline, so uncompressed files, tiled
+    files and compressions that decode many scanlines at a time cost more per frame. The sequences are audited on their
+    first frame, the report is a JSON serializable dict that tells which AOVs to render differently.
+    """
+    WARNING = 'warning'
+    INFO = 'info'
+
+    RECOMMENDED_COMPRESSIONS = ('zips', 'zip', 'dwaa')
+
+    USED_LAYER = 'rgba'
+
+    MAX_LISTED_CHANNELS = 8
+
+    def __init__(self, aovs_settings: dict = None, header_cache: AOVHeaderCache = None,
+                 index_cache: AOVIndexCache = None, naming_template: AOVNamingTemplate = None):
+        """Initializes class attributes."""
+        self.aovs = set((aovs_settings or {}).values())
+        self.header_cache = header_cache if header_cache is not None else AOVHeaderCache()
+        self.header_probe = AOVHeaderProbe(header_cache=self.header_cache)
+        self.file_finder = AOVFileFinder(
+            aovs_settings=aovs_settings,
+            index_cache=index_cache,
+            naming_template=naming_template)
+
+    def audit(self, path: str) -> dict:
+        """Audits the renders of a render folder, the render of one of its AOV files or a single file with its AOVs as
+        layers.
+
+        Raises AOVGraphError if no AOV file is found.
+        """
+        path = path.replace('\\', '/')
+
+        if os.path.isdir(path):
+            renders = self.file_finder.get_renders(folder_path=path.rstrip('/'))
+        else:
+            files_paths = self.file_finder.find_files_paths(target_file_path=path)
+            base_name = self.file_finder.get_base_name(file_name=os.path.basename(path))
+            renders = {base_name: files_paths} if files_paths else {}
+
+        report = {'path': path, 'renders': []}
+
+        for base_name in sorted(renders):
+            probe_report = self.header_probe.probe(files_paths=renders[base_name])
+            files = []
+
+            for _, aov, _ in renders[base_name]:
+                if aov in probe_report.headers:
+                    files.extend(self.audit_header(
+                        header=probe_report.headers[aov],
+                        aov=aov,
+                        used_layers={AOVRenderAudit.USED_LAYER}))
+
+            report['renders'].append({'name': base_name, 'files': files, 'errors': probe_report.errors})
+
+        if not report['renders'] and os.path.isfile(path):
+            header = self.header_cache.get_header(file_path=path)
+            aovs = header.get_channel_index().get_aovs(aovs=self.aovs)
+
+            if aovs:
+                report['renders'].append({
+                    'name': os.path.basename(path),
+                    'files': self.audit_header(header=header, aov='', used_layers={AOVRenderAudit.USED_LAYER, *aovs}),
+                    'errors': {}})
+
+        if not report['renders']:
+            raise AOVGraphError(f'No AOV files found: {path}')
+
+        report['summary'] = self.get_summary(report=report)
+
+        return report
+
+    def audit_header(self, header: AOVEXRHeader, aov: str, used_layers: set) -> list:
+        """Audits every part of the header of an AOV file, the channels of the used layers are read by the network."""
+        files = []
+
+        for i, part in enumerate(header.parts):
+            nuke_channels = part.get_nuke_channels(default_layer=header.get_part_default_layer(index=i))
+            pixel_types = {}
+            float_channels = []
+            unused_channels = []
+
+            for channel, nuke_channel in zip(part.channels, nuke_channels):
+                pixel_types[channel.pixel_type] = pixel_types.get(channel.pixel_type, 0) + 1
+
+                if nuke_channel.partition('.')[0] not in used_layers:
+                    unused_channels.append(nuke_channel)
+                elif channel.pixel_type == 'float':
+                    float_channels.append(nuke_channel)
+
+            file = {
+                'aov': aov,
+                'file_path': header.file_path,
+                'part': part.name,
+                'type': part.type,
+                'compression': part.compression,
+                'scanlines_per_chunk': part.get_scanlines_per_chunk(),
+                'tiled': part.tiled,
+                'pixel_types': pixel_types,
+                'float_channels': float_channels,
+                'unused_channels': unused_channels,
+                'data_window': list(part.data_window) if part.data_window else None,
+                'display_window': list(part.display_window) if part.display_window else None,
+                'data_window_ratio': self.get_data_window_ratio(part=part)}
+            file['findings'] = self.get_findings(file=file)
+
+            files.append(file)
+
+        return files
+
+    @staticmethod
+    def get_data_window_ratio(part: AOVEXRPart) -> float | None:
+        """Gets the area of the data window of a part over the area of its display window."""
+        if not part.data_window or not part.display_window:
+            return None
+
+        data_width, data_height = part.get_data_window_size()
+        display_width, display_height = part.get_display_window_size()
+
+        return round(max(data_width, 0) * max(data_height, 0) / (display_width * display_height), 3)
+
+    @classmethod
+    def get_findings(cls, file: dict) -> list:
+        """Gets the (severity, message) findings of an audited file part."""
+        findings = []
+        compression = file['compression']
+
+        if compression == 'none':
+            findings.append({'severity': cls.WARNING, 'message': 'Uncompressed, every frame reads the raw pixels.'})
+        elif compression not in cls.RECOMMENDED_COMPRESSIONS:
+            if file['scanlines_per_chunk']:
+                message = f'{compression.upper()} decodes {file["scanlines_per_chunk"]} scanlines at a time'
+            else:
+                message = f'{compression.upper()} compression may not be supported by Nuke'
+
+            findings.append({'severity': cls.INFO, 'message': f'{message}, ZIPS, ZIP or DWAA decode faster.'})
+
+        if file['tiled']:
+            findings.append({
+                'severity': cls.WARNING,
+                'message': 'Tiled, Nuke reads scanlines and decodes whole rows of tiles.'})
+
+        if file['float_channels']:
+            findings.append({
+                'severity': cls.WARNING,
+                'message': f'Full float channels read by the network: {cls.get_channels_text(file["float_channels"])}, '
+                           f'half float is enough for color AOVs.'})
+
+        if file['unused_channels']:
+            findings.append({
+                'severity': cls.INFO,
+                'message': f'Channels not read by the network: {cls.get_channels_text(file["unused_channels"])}.'})
+
+        if file['data_window_ratio'] and file['data_window_ratio'] > 1:
+            findings.append({
+                'severity': cls.WARNING,
+                'message': f'Data window is {file["data_window_ratio"]:.0%} of the format, the overscan is read on '
+                           f'every frame.'})
+
+        return findings
+
+    @classmethod
+    def get_channels_text(cls, channels: list) -> str:
+        """Gets the channels as text, the channels after the maximum listed are counted."""
+        text = ', '.join(channels[:cls.MAX_LISTED_CHANNELS])
+
+        if len(channels) > cls.MAX_LISTED_CHANNELS:
+            text += f' and {len(channels) - cls.MAX_LISTED_CHANNELS} more'
+
+        return text
+
+    @classmethod
+    def get_summary(cls, report: dict) -> dict:
+        """Gets the number of audited files, warnings, infos and errors of a report, and the AOVs with warnings."""
+        summary = {'files': 0, 'warnings': 0, 'infos': 0, 'errors': 0, 'aovs_to_change': []}
+        aovs_to_change = set()
+
+        for render in report['renders']:
+            summary['errors'] += len(render['errors'])
+
+            for file in render['files']:
+                summary['files'] += 1
+
+                for finding in file['findings']:
+                    if finding['severity'] == cls.WARNING:
+                        summary['warnings'] += 1
+                        aovs_to_change.add(file['aov'] or file['part'] or os.path.basename(file['file_path']))
+                    else:
+                        summary['infos'] += 1
+
+        summary['aovs_to_change'] = sorted(aovs_to_change)
+
+        return summary
+
+    @staticmethod
+    def write_json(reports: list, file_path: str) -> None:
+        """Writes the reports to a JSON file."""
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(reports, file, indent=2)
+
+        logger.info('Audit report written to %s.', file_path)
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets the maximum depth of the render layers subfolders searched."""
+        self.file_finder.set_max_depth(max_depth=max_depth)
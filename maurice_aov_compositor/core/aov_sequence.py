@@ -0,0 +1,103 @@
+"""
+========================================================================================================================
+Name: aov_sequence.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import re
+
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+
+
+class AOVSequence(object):
+    """AOV sequence.
+
+    The frames of an AOV collapsed into a single file pattern, such as '<base name>.<AOV>.%04d.exr', with its frame
+    range and the frames missing from it.
+    """
+    FRAME_PATTERN = re.compile(r'%(\d*)d|#+')
+
+    def __init__(self, folder_path: str, base_name: str, aov: str, files_names: dict,
+                 naming_template: AOVNamingTemplate = None):
+        """Initializes class attributes.
+
+        The files names are by frame, the file without frame is ignored.
+        """
+        self.folder_path = folder_path
+        self.base_name = base_name
+        self.aov = aov
+        self.frames = sorted(frame for frame in files_names if frame is not None)
+        self.padding = 1
+        self.prefix = ''
+        self.suffix = ''
+
+        if self.frames:
+            file_name = files_names[self.frames[0]]
+            frame_start, frame_end = (naming_template or AOVNamingTemplate()).get_frame_span(file_name=file_name)
+
+            self.prefix = file_name[:frame_start]
+            self.suffix = file_name[frame_end:]
+
+            frames_tokens_lengths = {
+                len(files_names[frame]) - len(self.prefix) - len(self.suffix) for frame in self.frames}
+
+            if len(frames_tokens_lengths) == 1:
+                self.padding = frames_tokens_lengths.pop()
+
+    def __len__(self) -> int:
+        """Gets the number of frames."""
+        return len(self.frames)
+
+    @classmethod
+    def get_frame_file_path(cls, pattern: str, frame: int) -> str:
+        """Gets the file path of a frame of a '%04d' or '####' file path pattern. Only the last frame pattern, the one
+        in the file name, is replaced, so the other '%' characters of the path are kept as they are.
+        """
+        matches = list(cls.FRAME_PATTERN.finditer(pattern))
+
+        if not matches:
+            return pattern
+
+        match = matches[-1]
+        padding = len(match.group(0)) if match.group(0).startswith('#') else int(match.group(1) or 1)
+
+        return f'{pattern[:match.start()]}{frame:0{padding}d}{pattern[match.end():]}'
+
+    @classmethod
+    def get_frame_token(cls, pattern: str) -> str:
+        """Gets the last frame pattern of a file path pattern, such as '%04d' or '####', empty if it has none."""
+        matches = list(cls.FRAME_PATTERN.finditer(pattern))
+
+        return matches[-1].group(0) if matches else ''
+
+    def get_first_frame(self) -> int:
+        """Gets the first frame."""
+        return self.frames[0]
+
+    def get_frame_range(self) -> tuple:
+        """Gets the (first frame, last frame) range."""
+        return self.get_first_frame(), self.get_last_frame()
+
+    def get_last_frame(self) -> int:
+        """Gets the last frame."""
+        return self.frames[-1]
+
+    def get_missing_frames(self) -> list:
+        """Gets the frames of the range that have no file."""
+        frames = set(self.frames)
+
+        return [frame for frame in range(self.get_first_frame(), self.get_last_frame() + 1) if frame not in frames]
+
+    def get_pattern(self, hashes: bool = False) -> str:
+        """Gets the file path pattern, with '%04d' or '####' frame padding."""
+        if hashes:
+            frame_pattern = '#' * self.padding
+        elif self.padding > 1:
+            frame_pattern = f'%0{self.padding}d'
+        else:
+            frame_pattern = '%d'
+
+        return f'{self.folder_path}/{self.prefix}{frame_pattern}{self.suffix}'
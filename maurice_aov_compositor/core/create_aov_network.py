@@ -2,16 +2,33 @@
 ========================================================================================================================
 Name: create_aov_network.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-06-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
 import nuke
 
-from pathlib import Path
+import logging
 import os
 
+from maurice_aov_compositor.core.aov_channel_index import AOVChannelIndex
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_header_probe import AOVHeaderProbeReport
+from maurice_aov_compositor.core.aov_header_probe import AOVHeaderProbe
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_graph_materializer import AOVGraphMaterializer
+from maurice_aov_compositor.core.aov_graph_layout import AOVGraphLayout
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+from maurice_aov_compositor.core.aov_network_transaction import AOVNetworkTransaction
+
+
+logger = logging.getLogger(__name__)
+
 
 class CreateAOVNetwork(object):
     """Create AOV network."""
@@ -19,189 +36,358 @@ class CreateAOVNetwork(object):
     def __init__(self):
         """Initializes class attributes."""
         self.aovs_settings = {}
+        self.update_existing = False
+
+        self.layout = AOVGraphLayout()
+        self.materializer = AOVGraphMaterializer()
+        self.file_finder = AOVFileFinder(index_cache=AOVIndexCache())
+        self.header_cache = AOVHeaderCache()
+        self.header_probe = AOVHeaderProbe(header_cache=self.header_cache)
+        self.probe_report = AOVHeaderProbeReport()
+        self.planner = AOVNetworkPlanner()
+        self.nuke_read_sources = []
+        self.added_paths = []
+
+    def create_networks(self, graphs: list) -> list:
+        """Creates the nodes of planned networks, side by side, and returns them by key for every graph."""
+        origins = self.layout.get_side_by_side_origins(
+            graphs=graphs,
+            origins=[self.materializer.get_origin(graph=graph) for graph in graphs])
+
+        return self.materialize_graphs(graphs=graphs, origins=origins)
 
     def create_standard_network_from_multi_files(self) -> None:
         """Creates a standard network from multiple files."""
-        files_paths = self.get_files_paths()
+        target_file_path = self.get_target_file_path()
 
-        if not files_paths:
+        if not target_file_path:
             return
 
-        last_merge_node = None
-        x_pos = 0
-        y_pos = 0
+        self.create_networks(graphs=self.plan_standard_networks_from_multi_files(target_file_path=target_file_path))
 
-        for i, file_path in enumerate(files_paths):
-            file_path, aov = file_path
+    def create_v_ray_advanced_network_from_single_file(self) -> None:
+        """Creates a V-Ray advanced network from a single."""
+        read_node = self.get_read_node()
 
-            read_node = self.create_read_node(file_path=file_path)
+        if not read_node:
+            return
 
-            if i == 0:
-                x_pos = read_node.xpos()
-                y_pos = read_node.ypos()
+    def create_standard_network_from_single_file(self) -> None:
+        """Creates a standard network from single a file for every selected read node."""
+        read_sources = self.get_selected_read_sources()
 
-            x_pos += 150
+        if not read_sources:
+            return
 
-            read_node['xpos'].setValue(x_pos)
-            read_node['ypos'].setValue(y_pos)
+        graphs = self.plan_standard_networks_from_single_file(read_sources=read_sources)
+        self.create_networks(graphs=graphs + self.plan_standard_networks_from_nuke_reads())
 
-            shuffle_node = self.create_shuffle_node(aov='rgba', input_a=read_node, label=aov)
-            shuffle_node['xpos'].setValue(x_pos)
-            shuffle_node['ypos'].setValue(y_pos + 150)
+    @staticmethod
+    def create_read_node(file_path: str) -> nuke.Node:
+        """Creates a read node."""
+        read_node = nuke.createNode('Read')
+        read_node.knob('file').setValue(file_path)
+        read_node.setSelected(False)
 
-            if i > 0:
-                merge_node = self.create_merge_node(input_a=shuffle_node, input_b=last_merge_node)
-                merge_node['xpos'].setValue(x_pos)
-                merge_node['ypos'].setValue(y_pos + 300)
-            else:
-                dot_node_l = self.create_dot_node(input_a=shuffle_node)
-                dot_node_l['xpos'].setValue(self.get_x_pos_center(node_a=shuffle_node, node_b=dot_node_l))
-                dot_node_l['ypos'].setValue(y_pos + 303)
+        return read_node
 
-                merge_node = dot_node_l
+    def get_files_paths(self) -> list:
+        """Gets the files paths."""
+        target_file_path = self.get_target_file_path()
 
-            last_merge_node = merge_node
+        if not target_file_path:
+            return []
 
-    def create_v_ray_advanced_network_from_single_file(self) -> None:
-        """Creates a V-Ray advanced network from a single."""
-        read_node = self.get_read_node()
+        return self.file_finder.find_files_paths(target_file_path=target_file_path)
 
-        if not read_node:
+    def get_read_node(self) -> nuke.Node | None:
+        """Gets the read node."""
+        read_nodes = self.get_read_nodes()
+
+        if not read_nodes:
             return
 
-    def create_standard_network_from_single_file(self) -> None:
-        """Creates a standard network from single a file."""
-        read_node = self.get_read_node()
+        return read_nodes[-1]
 
-        if not read_node:
-            return
+    def get_read_nodes(self) -> list:
+        """Gets the selected read nodes, or a new read node if none is selected."""
+        read_nodes = nuke.selectedNodes('Read')
 
-        aovs = set()
+        if not read_nodes:
+            file_path = nuke.getFilename('Select file', '*.exr')
 
-        for channel in read_node.channels():
-            channel_split = channel.split('.')
+            if not file_path:
+                return []
 
-            if channel_split[1] in ['red', 'green', 'blue']:
-                if channel_split[0] in self.aovs_settings.values():
-                    aovs.add(channel_split[0])
+            read_nodes = [self.create_read_node(file_path=file_path)]
 
-        last_dot_node = read_node
-        last_merge_node = None
+        return read_nodes
 
-        for i, aov in enumerate(sorted(list(aovs))):
-            new_y_pos = read_node.ypos() + 125
+    def get_read(self, read_source: tuple) -> tuple | None:
+        """Gets the (read node name, channel index, header) of a (read node name, file path) read source, or None if
+        the header of its EXR file cannot be read.
 
-            dot_node = self.create_dot_node(input_a=last_dot_node)
-            dot_node['xpos'].setValue(self.get_x_pos_center(node_a=read_node, node_b=dot_node) + (150 * i))
-            dot_node['ypos'].setValue(new_y_pos)
+        The channels are read from the header of the EXR file, without Nuke, so the reads are got in the background
+        thread: reading the header only reads a few kilobytes of the file, Nuke opens and decodes it. The channel index
+        is built once per file and cached with its header.
+        """
+        read_node_name, file_path = read_source
 
-            shuffle_node = self.create_shuffle_node(aov=aov, input_a=dot_node, label=aov)
-            shuffle_node['xpos'].setValue(self.get_x_pos_center(node_a=read_node, node_b=shuffle_node) + (150 * i))
-            shuffle_node['ypos'].setValue(new_y_pos + 50)
+        if not file_path or not file_path.lower().endswith('.exr'):
+            return None
 
-            if i > 0:
-                merge_node = self.create_merge_node(input_a=shuffle_node, input_b=last_merge_node)
-                merge_node['xpos'].setValue(self.get_x_pos_center(node_a=read_node, node_b=merge_node) + (150 * i))
-                merge_node['ypos'].setValue(new_y_pos + 200)
-            else:
-                dot_node_l = self.create_dot_node(input_a=shuffle_node)
-                dot_node_l['xpos'].setValue(self.get_x_pos_center(node_a=shuffle_node, node_b=dot_node_l))
-                dot_node_l['ypos'].setValue(new_y_pos + 203)
+        try:
+            header = self.header_cache.get_header(file_path=file_path)
+        except AOVEXRHeaderError as error:
+            logger.debug('Reading the channels with Nuke: %s', error)
 
-                merge_node = dot_node_l
+            return None
 
-            last_dot_node = dot_node
-            last_merge_node = merge_node
+        return read_node_name, header.get_channel_index(), header
 
-    @staticmethod
-    def create_dot_node(input_a) -> nuke.Node:
-        """Creates a dot node."""
-        dot_node = nuke.createNode('Dot')
-        dot_node.setInput(0, input_a)
-        dot_node.setSelected(False)
+    def get_nuke_read(self, read_source: tuple) -> tuple:
+        """Gets the (read node name, channel index, header) of a read source from the channels Nuke reads, for the
+        files whose header cannot be read. The channels of a picked file are read by a temporary Read node, deleted once
+        read, its Read node is only created with the network.
+        """
+        read_node_name, file_path = read_source
 
-        return dot_node
+        if read_node_name:
+            return read_node_name, AOVChannelIndex(channels=nuke.toNode(read_node_name).channels()), None
 
-    @staticmethod
-    def create_merge_node(input_a: nuke.Node, input_b: nuke.Node) -> nuke.Node:
-        """Create a merge node."""
-        merge_node = nuke.createNode('Merge')
-        merge_node.knob('operation').setValue('plus')
-        merge_node.setInput(0, input_a)
-        merge_node.setInput(1, input_b)
-        merge_node.setSelected(False)
+        undo_disabled = nuke.Undo.disabled()
+
+        if not undo_disabled:
+            nuke.Undo.disable()
+
+        read_node = nuke.nodes.Read(file=file_path)
+
+        try:
+            channels = read_node.channels()
+        finally:
+            nuke.delete(read_node)
+
+            if not undo_disabled:
+                nuke.Undo.enable()
+
+        return read_node_name, AOVChannelIndex(channels=channels), None
+
+    def get_read_sources(self, read_nodes: list) -> list:
+        """Gets the (read node name, file path) read sources of the read nodes, the only part of the reads that needs
+        Nuke.
+        """
+        return [(read_node.fullName(), read_node['file'].evaluate() or '') for read_node in read_nodes]
+
+    def get_selected_read_sources(self) -> list:
+        """Gets the read sources of the selected read nodes, or of a file picked by the user if none is selected.
+
+        The read node name of a picked file is empty: its Read node is not created now but planned with its network,
+        so it is only created, and removed on failure, with the nodes of the network.
+        """
+        read_nodes = nuke.selectedNodes('Read')
+
+        if read_nodes:
+            return self.get_read_sources(read_nodes=read_nodes)
+
+        file_path = nuke.getFilename('Select file', '*.exr')
+
+        if not file_path:
+            return []
 
-        return merge_node
+        return [('', file_path)]
 
     @staticmethod
-    def create_read_node(file_path: str) -> nuke.Node:
-        """Creates a read node."""
-        read_node = nuke.createNode('Read')
-        read_node.knob('file').setValue(file_path)
-        read_node.setSelected(False)
+    def get_target_file_path() -> str:
+        """Gets the file of the render picked by the user."""
+        return nuke.getFilename('Select file', '*.exr') or ''
 
-        return read_node
+    def get_watched_folders_paths(self) -> list:
+        """Gets the folders the AOV files were searched in, to watch while the render is written."""
+        return self.file_finder.get_folders_paths()
 
     @staticmethod
-    def create_shuffle_node(aov: str, input_a: nuke.Node, label: str) -> nuke.Node:
-        """Creates a shuffle node."""
-        shuffle_node = nuke.createNode('Shuffle2')
-        shuffle_node.knob('in1').setValue(aov)
-        shuffle_node.knob('label').setValue(label)
-        shuffle_node.setInput(0, input_a)
-        shuffle_node.setSelected(False)
+    def ignore_progress(value: int, maximum: int, text: str) -> None:
+        """Progress callback that does nothing."""
+        pass
 
-        return shuffle_node
+    def materialize_graphs(self, graphs: list, origins: list = None) -> list:
+        """Creates the nodes of the graphs, or updates their existing networks in update existing mode.
 
-    def get_files_paths(self) -> list:
-        """Gets the files paths."""
-        target_file_path = nuke.getFilename('Select file', '*.exr')
+        The build runs as a single undo entry and is rolled back if it fails.
+        """
+        with AOVNetworkTransaction(name='Create AOV Network'):
+            if self.update_existing:
+                return self.materializer.update_graphs(graphs=graphs, origins=origins)
 
-        if not target_file_path:
+            return self.materializer.materialize_graphs(graphs=graphs, origins=origins)
+
+    def plan_standard_network_from_read(self, read: tuple, read_file_path: str = '') -> AOVGraph:
+        """Plans the standard network of a (read node name, channel index, header) read, the read file path plans a
+        new Read node of the file instead of the existing read node.
+        """
+        read_node_name, channel_index, header = read
+
+        graph = self.planner.plan_standard_network_from_single_file(
+            channel_index=channel_index,
+            read_node_name=read_node_name,
+            network_id=read_node_name or read_file_path,
+            read_file_path=read_file_path,
+            data_windows=header.get_data_windows() if header else None,
+            display_window=header.get_display_window() if header else None)
+
+        self.layout.apply(graph=graph)
+
+        return graph
+
+    def plan_standard_networks_from_multi_files(self, target_file_path: str, progress: callable = None) -> list:
+        """Plans the standard network of the render the target file belongs to, without creating any node.
+
+        The headers of the AOV files are probed first, the inconsistencies between the AOVs are kept in the probe
+        report. The progress is called with the (value, maximum, text) of every step, listed folder and probed file and
+        can raise AOVGraphCancelled.
+        """
+        progress = progress or self.ignore_progress
+
+        progress(0, 3, 'Finding AOV files')
+        files_paths = self.file_finder.find_files_paths(target_file_path=target_file_path, progress=progress)
+
+        if not files_paths:
             return []
 
-        folder_path = os.path.dirname(target_file_path)
-        files_names = os.listdir(folder_path)
-        base_name = '.'.join(Path(target_file_path).stem.split('.')[:-1])
+        progress(1, 3, 'Probing AOV files')
+        self.probe_report = self.header_probe.probe(files_paths=files_paths, progress=progress)
 
-        files_paths = []
+        progress(2, 3, 'Planning network')
+        graph = self.planner.plan_standard_network_from_multi_files(
+            files_paths=files_paths,
+            network_id=self.file_finder.get_network_id(files_paths=files_paths),
+            data_windows=self.probe_report.get_data_windows(),
+            display_window=self.probe_report.get_display_window())
 
-        for file_name in files_names:
-            path = Path(file_name)
+        self.layout.apply(graph=graph)
+        progress(3, 3, 'Planning network')
 
-            if path.suffix == '.exr':
-                file_name_split = path.stem.split('.')
+        return [graph]
 
-                if len(file_name_split) > 1:
-                    file_base_name = '.'.join(file_name_split[:-1])
-                    aov_name = file_name_split[-1]
+    def plan_standard_networks_from_nuke_reads(self) -> list:
+        """Plans the standard networks of the read sources whose EXR header could not be read by the last plan, from
+        the channels Nuke reads. Runs on the main thread.
+        """
+        graphs = [
+            self.plan_standard_network_from_read(
+                read=self.get_nuke_read(read_source=read_source),
+                read_file_path='' if read_source[0] else read_source[1])
+            for read_source in self.nuke_read_sources]
 
-                    if file_base_name == base_name and aov_name in self.aovs_settings.values():
-                        files_paths.append((f'{folder_path}/{file_name}', aov_name))
+        self.nuke_read_sources = []
 
-        return files_paths
+        return graphs
 
-    def get_read_node(self) -> nuke.Node | None:
-        """Gets the read node."""
-        read_node = nuke.selectedNodes('Read')
+    def plan_standard_networks_from_single_file(self, read_sources: list, progress: callable = None) -> list:
+        """Plans the standard network of every (read node name, file path) read source, without creating any node, from
+        the header of its EXR file. The overscan of the files is cropped in crop overscan mode. The read sources whose
+        header cannot be read are kept for plan_standard_networks_from_nuke_reads.
 
-        if not read_node:
-            file_path = nuke.getFilename('Select file', '*.exr')
+        The progress is called with the (value, maximum, text) of every step and can raise AOVGraphCancelled.
+        """
+        progress = progress or self.ignore_progress
+        graphs = []
 
-            if not file_path:
-                return
+        self.nuke_read_sources = []
 
-            read_node = self.create_read_node(file_path=file_path)
-        else:
-            read_node = read_node[-1]
+        for i, read_source in enumerate(read_sources):
+            read_node_name, file_path = read_source
 
-        return read_node
+            progress(i, len(read_sources), f'Planning {read_node_name or os.path.basename(file_path)}')
 
-    @staticmethod
-    def get_x_pos_center(node_a: nuke.Node, node_b: nuke.Node) -> float:
-        """Gets the X pos center."""
-        return node_a.xpos() + (node_a.screenWidth() / 2) - (node_b.screenWidth() / 2)
+            read = self.get_read(read_source=read_source)
+
+            if read is None:
+                self.nuke_read_sources.append(read_source)
+
+                continue
+
+            graphs.append(self.plan_standard_network_from_read(
+                read=read,
+                read_file_path='' if read_node_name else file_path))
+
+        progress(len(read_sources), len(read_sources), 'Planning networks')
+
+        return graphs
+
+    def plan_networks_from_folders(self, target_file_path: str, folders_paths: list, progress: callable = None) -> list:
+        """Plans the network of the render the target file belongs to again with the files added to the folders,
+        without creating any node.
+
+        Only the changed folders are listed again and nothing is planned when no AOV file or subfolder was added, the
+        added paths are kept in the added paths. The progress is called with the (value, maximum, text) of every step
+        and can raise AOVGraphCancelled.
+        """
+        progress = progress or self.ignore_progress
+
+        progress(0, 1, 'Listing changed folders')
+        self.added_paths = self.file_finder.refresh_folders(folders_paths=folders_paths)
+
+        if not self.added_paths:
+            return []
+
+        return self.plan_standard_networks_from_multi_files(target_file_path=target_file_path, progress=progress)
+
+    def update_networks(self, graphs: list) -> None:
+        """Updates the existing networks of the planned graphs in place, their nodes are not rebuilt."""
+        if graphs:
+            with AOVNetworkTransaction(name='Update AOV Network'):
+                self.materializer.update_graphs(graphs=graphs)
+
+    def update_networks_from_folders(self, target_file_path: str, folders_paths: list) -> list:
+        """Updates the existing network of the render the target file belongs to with the files added to the folders
+        and returns the added paths.
+        """
+        self.update_networks(graphs=self.plan_networks_from_folders(
+            target_file_path=target_file_path,
+            folders_paths=folders_paths))
+
+        return self.added_paths
+
+    def set_build_mode(self, mode: str) -> None:
+        """Sets the build mode, one of the AOVGraphMaterializer modes."""
+        self.materializer.set_mode(mode=mode)
 
     def set_aovs_settings(self, aovs: dict) -> None:
         """Sets AOVs settings."""
         self.aovs_settings = aovs
+        self.file_finder.set_aovs_settings(aovs=aovs)
+        self.planner.set_aovs_settings(aovs=aovs)
+
+    def set_header_cache(self, header_cache: AOVHeaderCache) -> None:
+        """Sets the EXR header cache, shared between the builds to not parse the same headers again."""
+        self.header_cache = header_cache
+        self.header_probe.set_header_cache(header_cache=header_cache)
+
+    def set_max_depth(self, max_depth: int) -> None:
+        """Sets the maximum depth of the render layers subfolders the AOV files are searched in."""
+        self.file_finder.set_max_depth(max_depth=max_depth)
+
+    def set_naming_template(self, naming_template: AOVNamingTemplate) -> None:
+        """Sets the naming template the AOV files are found with."""
+        self.file_finder.set_naming_template(naming_template=naming_template)
+
+    def set_layout_style(self, style: str) -> None:
+        """Sets the layout style, one of the AOVGraphLayout styles."""
+        self.layout.set_style(style=style)
+
+    def set_crop_overscan(self, crop_overscan: bool) -> None:
+        """Sets the crop overscan mode, which crops the data windows that overflow the format."""
+        self.planner.set_crop_overscan(crop_overscan=crop_overscan)
+
+    def set_layer_native(self, layer_native: bool) -> None:
+        """Sets the layer native mode, which skips the per-AOV Dot and Shuffle nodes where possible."""
+        self.planner.set_layer_native(layer_native=layer_native)
+
+    def set_update_existing(self, update_existing: bool) -> None:
+        """Sets the update existing mode, which only adds, removes or rewires the changed nodes of existing networks."""
+        self.update_existing = update_existing
+
+    def set_topology(self, topology: str) -> None:
+        """Sets the merge topology, one of the AOVNetworkPlanner topologies."""
+        self.planner.set_topology(topology=topology)
@@ -2,7 +2,7 @@
 ========================================================================================================================
 Name: aov_compositor_ui.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-06-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
@@ -16,16 +16,33 @@ except ImportError:
     from PySide2 import QtCore
     from PySide2 import QtGui
 
+import nuke
+
+import logging
 import os
 
 from maurice_aov_compositor.core.aov_settings_redshift import AOVSettingsRedshift
 from maurice_aov_compositor.core.aov_settings_arnold import AOVSettingsArnold
 from maurice_aov_compositor.core.aov_settings_v_ray import AOVSettingsVRay
+from maurice_aov_compositor.core.aov_graph_materializer import AOVGraphMaterializer
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_folder_watcher import AOVFolderWatcher
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph_layout import AOVGraphLayout
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+from maurice_aov_compositor.core.aov_render_audit import AOVRenderAudit
 from maurice_aov_compositor.core.create_aov_network import CreateAOVNetwork
+from maurice_aov_compositor.ui.aov_network_worker import AOVNetworkWorker
 import maurice_aov_compositor.ui.maurice_qt as maurice_qt
 import maurice_aov_compositor.utils as maurice_utils
 import maurice_aov_compositor as maurice
 
+
+logger = logging.getLogger(__name__)
+
     
 class AOVCompositorUI(maurice_qt.QDialogNuke):
     """AOV compositor UI."""
@@ -43,6 +60,38 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
     STANDARD = 'Standard'
     ADVANCED = 'Advanced'
 
+    INTERACTIVE_BUILD = 'Interactive Build'
+    FAST_BUILD = 'Fast Build'
+    SCRIPT_BUILD = 'Script Build'
+
+    BUILD_MODES = {
+        INTERACTIVE_BUILD: AOVGraphMaterializer.INTERACTIVE,
+        FAST_BUILD: AOVGraphMaterializer.FAST,
+        SCRIPT_BUILD: AOVGraphMaterializer.SCRIPT}
+
+    LINEAR_MERGE = 'Linear Merge'
+    TREE_MERGE = 'Tree Merge'
+    WIDE_MERGE = 'Wide Merge'
+
+    MERGE_TOPOLOGIES = {
+        LINEAR_MERGE: AOVNetworkPlanner.LINEAR,
+        TREE_MERGE: AOVNetworkPlanner.TREE,
+        WIDE_MERGE: AOVNetworkPlanner.WIDE}
+
+    GRID_LAYOUT = 'Grid Layout'
+    TREE_LAYOUT = 'Tree Layout'
+    COMPACT_LAYOUT = 'Compact Layout'
+
+    LAYOUT_STYLES = {
+        GRID_LAYOUT: AOVGraphLayout.GRID,
+        TREE_LAYOUT: AOVGraphLayout.TREE,
+        COMPACT_LAYOUT: AOVGraphLayout.COMPACT}
+
+    WATCH_INTERVAL = 2000
+
+    AUDIT_COLUMNS = ('AOV', 'Compression', 'Layout', 'Pixel Types', 'Data Window', 'Findings')
+    AUDIT_WARNING_COLOR = (230, 160, 60)
+
     @classmethod
     def show_window(cls) -> None:
         """Shows the window."""
@@ -57,11 +106,43 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         self.render_engine_combo_box = None
         self.from_single_file_radio_button = None
         self.from_separate_files_radio_button = None
+        self.build_mode_combo_box = None
+        self.merge_topology_combo_box = None
+        self.layout_style_combo_box = None
+        self.layer_native_check_box = None
+        self.crop_overscan_check_box = None
+        self.update_existing_check_box = None
+        self.watch_render_check_box = None
+        self.naming_template_line_edit = None
+        self.subfolders_depth_spin_box = None
         self.create_aov_network_push_button = None
+        self.refresh_index_push_button = None
+        self.audit_render_push_button = None
+        self.progress_bar = None
+        self.cancel_push_button = None
+
+        # AOV network worker class variables.
+        self.aov_network = None
+        self.aov_network_worker = None
+        self.target_file_path = ''
+
+        # EXR header cache, shared between the builds.
+        self.header_cache = AOVHeaderCache(persistent=True)
+
+        # AOV folder watcher class variables.
+        self.aov_folder_watcher = None
+        self.watch_timer = None
+        self.watch_worker = None
 
         # AOV compositor class variables.
         self.render_compositing_operations_combo_box = None
 
+        # Render audit class variables.
+        self.audit_group_box = None
+        self.audit_tree_widget = None
+        self.save_audit_push_button = None
+        self.audit_reports = []
+
         # Arnold compositor class variables.
         self.arnold_aov_compositor_group_box = None
         self.arnold_aov_compositor_widget = None
@@ -142,12 +223,90 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         # From separate files QRadioButton.
         self.from_separate_files_radio_button = maurice_qt.QRadioButton('From Separate Files')
 
+        # Build mode QComboBox.
+        self.build_mode_combo_box = maurice_qt.QComboBox(fixed_size=False)
+        self.build_mode_combo_box.addItems([
+            AOVCompositorUI.INTERACTIVE_BUILD,
+            AOVCompositorUI.FAST_BUILD,
+            AOVCompositorUI.SCRIPT_BUILD])
+        self.build_mode_combo_box.setCurrentText(AOVCompositorUI.INTERACTIVE_BUILD)
+
+        # Merge topology QComboBox.
+        self.merge_topology_combo_box = maurice_qt.QComboBox(fixed_size=False)
+        self.merge_topology_combo_box.addItems([
+            AOVCompositorUI.LINEAR_MERGE,
+            AOVCompositorUI.TREE_MERGE,
+            AOVCompositorUI.WIDE_MERGE])
+
+        # Layout style QComboBox.
+        self.layout_style_combo_box = maurice_qt.QComboBox(fixed_size=False)
+        self.layout_style_combo_box.addItems([
+            AOVCompositorUI.GRID_LAYOUT,
+            AOVCompositorUI.TREE_LAYOUT,
+            AOVCompositorUI.COMPACT_LAYOUT])
+
+        # Layer native QCheckBox.
+        self.layer_native_check_box = maurice_qt.QCheckBox('Layer Native')
+        self.layer_native_check_box.setToolTip('Merges the AOV layers without per-AOV Dot and Shuffle nodes.')
+
+        # Crop overscan QCheckBox.
+        self.crop_overscan_check_box = maurice_qt.QCheckBox('Crop Overscan')
+        self.crop_overscan_check_box.setToolTip(
+            'Crops the data windows that overflow the format, the overscan is lost downstream.')
+
+        # Update existing QCheckBox.
+        self.update_existing_check_box = maurice_qt.QCheckBox('Update Existing')
+        self.update_existing_check_box.setToolTip('Updates only the changed nodes of the existing AOV networks.')
+
+        # Watch render QCheckBox.
+        self.watch_render_check_box = maurice_qt.QCheckBox('Watch Render')
+        self.watch_render_check_box.setToolTip(
+            'Adds the AOVs written after the network is built, while the render is running. Separate files only.')
+
+        # Watch QTimer.
+        self.watch_timer = QtCore.QTimer(self)
+        self.watch_timer.setInterval(AOVCompositorUI.WATCH_INTERVAL)
+
+        # Naming template QLineEdit.
+        self.naming_template_line_edit = maurice_qt.QLineEdit()
+        self.naming_template_line_edit.setPlaceholderText(AOVNamingTemplate.DEFAULT)
+        self.naming_template_line_edit.setToolTip(
+            'AOV files naming template, such as {shot}_{layer}.{aov}.{frame}.exr, brackets mark optional parts.')
+
+        # Subfolders depth QSpinBox.
+        self.subfolders_depth_spin_box = maurice_qt.QSpinBox()
+        self.subfolders_depth_spin_box.setRange(0, 8)
+        self.subfolders_depth_spin_box.setValue(AOVFileFinder.MAX_DEPTH)
+        self.subfolders_depth_spin_box.setPrefix('Subfolders Depth: ')
+        self.subfolders_depth_spin_box.setToolTip('Render layers subfolders searched for the AOV files.')
+
         # Create aov network QPushButton.
         self.create_aov_network_push_button = maurice_qt.QPushButton('Create AOV Network')
         self.create_aov_network_push_button.setIcon(QtGui.QIcon(self.icons['chart-tree.png']))
         self.create_aov_network_push_button.setToolTip(lmb='Create Image Network')
         self.create_aov_network_push_button.set_yellow_background()
 
+        # Refresh index QPushButton.
+        self.refresh_index_push_button = maurice_qt.QPushButton()
+        self.refresh_index_push_button.setIcon(QtGui.QIcon(self.icons['refresh.png']))
+        self.refresh_index_push_button.setToolTip(lmb='Refresh Render Folders And Headers')
+        self.refresh_index_push_button.set_small_push_button_size()
+
+        # Audit render QPushButton.
+        self.audit_render_push_button = maurice_qt.QPushButton()
+        self.audit_render_push_button.setIcon(QtGui.QIcon(self.icons['info.png']))
+        self.audit_render_push_button.setToolTip(lmb='Audit Render Files Performance')
+        self.audit_render_push_button.set_small_push_button_size()
+
+        # QProgressBar.
+        self.progress_bar = maurice_qt.QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        # Cancel QPushButton.
+        self.cancel_push_button = maurice_qt.QPushButton('Cancel')
+        self.cancel_push_button.setToolTip(lmb='Cancel AOV Network')
+        self.cancel_push_button.setVisible(False)
+
         # ==============================================================================================================
         # AOV compositor.
         # ==============================================================================================================
@@ -157,6 +316,19 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
             AOVCompositorUI.STANDARD,
             AOVCompositorUI.ADVANCED])
 
+        # ==============================================================================================================
+        # Render audit.
+        # ==============================================================================================================
+        # Audit QTreeWidget.
+        self.audit_tree_widget = QtWidgets.QTreeWidget()
+        self.audit_tree_widget.setHeaderLabels(AOVCompositorUI.AUDIT_COLUMNS)
+        self.audit_tree_widget.setAlternatingRowColors(True)
+
+        # Save audit QPushButton.
+        self.save_audit_push_button = maurice_qt.QPushButton('Save JSON')
+        self.save_audit_push_button.setIcon(QtGui.QIcon(self.icons['disk.png']))
+        self.save_audit_push_button.setToolTip(lmb='Save Render Audit Report')
+
         # ==============================================================================================================
         # Arnold AOV compositor.
         # ==============================================================================================================
@@ -327,8 +499,39 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         settings_file_form_layout.setContentsMargins(80, 0, 0, 0)
         settings_file_group_box.setLayout(settings_file_form_layout)
 
+        settings_main_v_box_layout.addWidget(self.build_mode_combo_box)
+        settings_main_v_box_layout.addWidget(self.merge_topology_combo_box)
+        settings_main_v_box_layout.addWidget(self.layout_style_combo_box)
+        settings_main_v_box_layout.addWidget(self.naming_template_line_edit)
+        settings_main_v_box_layout.addWidget(self.subfolders_depth_spin_box)
+
+        # Settings build QGroupbox.
+        settings_build_group_box = maurice_qt.QGroupBox()
+        settings_main_v_box_layout.addWidget(settings_build_group_box)
+
+        # Settings build QFormLayout.
+        settings_build_form_layout = maurice_qt.QFormLayout()
+        settings_build_form_layout.addWidget(self.layer_native_check_box)
+        settings_build_form_layout.addWidget(self.crop_overscan_check_box)
+        settings_build_form_layout.addWidget(self.update_existing_check_box)
+        settings_build_form_layout.addWidget(self.watch_render_check_box)
+        settings_build_form_layout.setContentsMargins(80, 0, 0, 0)
+        settings_build_group_box.setLayout(settings_build_form_layout)
+
         settings_main_v_box_layout.addStretch()
-        settings_main_v_box_layout.addWidget(self.create_aov_network_push_button)
+
+        # Settings progress QHBoxLayout.
+        settings_progress_h_box_layout = maurice_qt.QHBoxLayout()
+        settings_progress_h_box_layout.addWidget(self.progress_bar)
+        settings_progress_h_box_layout.addWidget(self.cancel_push_button)
+        settings_main_v_box_layout.addLayout(settings_progress_h_box_layout)
+
+        # Settings create QHBoxLayout.
+        settings_create_h_box_layout = maurice_qt.QHBoxLayout()
+        settings_create_h_box_layout.addWidget(self.create_aov_network_push_button)
+        settings_create_h_box_layout.addWidget(self.refresh_index_push_button)
+        settings_create_h_box_layout.addWidget(self.audit_render_push_button)
+        settings_main_v_box_layout.addLayout(settings_create_h_box_layout)
 
         # ==============================================================================================================
         # AOV compositor.
@@ -440,6 +643,20 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         v_ray_aov_compositor_items_v_box_layout.setAlignment(QtCore.Qt.AlignTop)
         self.v_ray_aov_compositor_widget.setLayout(v_ray_aov_compositor_items_v_box_layout)
 
+        # ==============================================================================================================
+        # Render audit.
+        # ==============================================================================================================
+        # Audit QGroupBox.
+        self.audit_group_box = QtWidgets.QGroupBox('Render Audit')
+        self.audit_group_box.setVisible(False)
+        aov_compositor_v_box_layout.addWidget(self.audit_group_box)
+
+        # Audit QVBoxLayout.
+        audit_v_box_layout = maurice_qt.QVBoxLayout()
+        audit_v_box_layout.addWidget(self.audit_tree_widget)
+        audit_v_box_layout.addWidget(self.save_audit_push_button)
+        self.audit_group_box.setLayout(audit_v_box_layout)
+
         main_splitter.setCollapsible(0, False)
         main_splitter.setCollapsible(1, False)
         main_splitter.setStretchFactor(1, 1)
@@ -448,6 +665,12 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         """Creates the connections."""
         self.render_engine_combo_box.currentTextChanged.connect(self.render_engine_current_text_changed_combo_box)
         self.create_aov_network_push_button.clicked.connect(self.create_aov_network_clicked_push_button)
+        self.refresh_index_push_button.clicked.connect(self.refresh_index_clicked_push_button)
+        self.audit_render_push_button.clicked.connect(self.audit_render_clicked_push_button)
+        self.save_audit_push_button.clicked.connect(self.save_audit_clicked_push_button)
+        self.cancel_push_button.clicked.connect(self.cancel_clicked_push_button)
+        self.watch_render_check_box.toggled.connect(self.watch_render_toggled_check_box)
+        self.watch_timer.timeout.connect(self.watch_timer_timeout)
 
         self.render_compositing_operations_combo_box.currentTextChanged.connect(
             self.render_compositing_operations_current_text_changed_combo_box)
@@ -456,6 +679,73 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         """Loads the settings."""
         pass
 
+    def refresh_index_clicked_push_button(self) -> None:
+        """Clears the render folders index cache and the EXR header cache, the next builds list the render folders and
+        read the EXR headers again.
+        """
+        AOVIndexCache().clear()
+        self.header_cache.clear()
+
+    def audit_render_clicked_push_button(self) -> None:
+        """Audits the AOV files of the render picked by the user from their headers and shows the report."""
+        render_engine = self.render_engine_combo_box.currentText()
+
+        if render_engine == AOVCompositorUI.ARNOLD:
+            aovs = self.get_current_aovs_settings(
+                aov_compositor_widget=self.arnold_aov_compositor_widget,
+                advanced_mode=self.arnold_advanced_mode,
+                standard_mode=self.arnold_standard_mode)
+        elif render_engine == AOVCompositorUI.V_RAY:
+            aovs = self.get_current_aovs_settings(
+                aov_compositor_widget=self.v_ray_aov_compositor_widget,
+                advanced_mode=self.v_ray_advanced_mode,
+                standard_mode=self.v_ray_standard_mode)
+        else:
+            aovs = self.get_mode_aovs_settings(
+                advanced_mode=self.redshift_advanced_mode,
+                standard_mode=self.redshift_standard_mode)
+
+        try:
+            naming_template = self.get_naming_template()
+        except AOVGraphError as error:
+            nuke.message(str(error))
+
+            return
+
+        target_file_path = CreateAOVNetwork.get_target_file_path()
+
+        if not target_file_path:
+            return
+
+        aov_render_audit = AOVRenderAudit(
+            aovs_settings=aovs,
+            header_cache=self.header_cache,
+            index_cache=AOVIndexCache(),
+            naming_template=naming_template)
+        aov_render_audit.set_max_depth(max_depth=self.subfolders_depth_spin_box.value())
+
+        try:
+            report = aov_render_audit.audit(path=target_file_path)
+        except AOVGraphError as error:
+            nuke.message(f'Render audit failed: {error}')
+
+            return
+
+        self.audit_reports = [report]
+        self.display_audit_report(report=report)
+
+    def save_audit_clicked_push_button(self) -> None:
+        """Saves the last render audit report as JSON."""
+        file_path = nuke.getFilename('Save render audit', '*.json', type='save')
+
+        if not file_path:
+            return
+
+        if not file_path.lower().endswith('.json'):
+            file_path += '.json'
+
+        AOVRenderAudit.write_json(reports=self.audit_reports, file_path=file_path)
+
     def render_engine_current_text_changed_combo_box(self) -> None:
         """"""
         render_engine = self.render_engine_combo_box.currentText()
@@ -492,6 +782,93 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
                 advanced_mode=advanced_mode,
                 standard_mode=standard_mode)
 
+    def aov_network_worker_cancelled(self) -> None:
+        """Resets the widgets once the AOV network planning is cancelled."""
+        logger.info('AOV network cancelled.')
+
+        self.set_aov_network_worker_running(running=False)
+
+    def aov_network_worker_failed(self, error: str) -> None:
+        """Resets the widgets once the AOV network planning failed."""
+        nuke.message(f'AOV network failed: {error}')
+
+        self.set_aov_network_worker_running(running=False)
+
+    def aov_network_worker_planned(self, graphs: list) -> None:
+        """Creates the nodes of the planned networks on the main thread, once the artist accepted the inconsistencies
+        found between the AOV files, if any. The networks of the files whose header could not be read are planned from
+        the channels Nuke reads first. A failed creation is reported as a failed planning.
+        """
+        probe_report = self.aov_network.probe_report
+
+        if graphs and not probe_report.is_consistent():
+            if not nuke.ask(f'Inconsistent AOV files:\n\n{probe_report.get_summary()}\n\nCreate the AOV network?'):
+                self.set_aov_network_worker_running(running=False)
+
+                return
+
+        self.progress_bar.set_progress(value=0, maximum=0, text='Creating nodes')
+
+        try:
+            graphs = graphs + self.aov_network.plan_standard_networks_from_nuke_reads()
+
+            if graphs:
+                self.aov_network.create_networks(graphs=graphs)
+        except Exception as error:
+            logger.exception('AOV network creation failed.')
+
+            self.aov_network_worker_failed(error=str(error))
+
+            return
+
+        self.set_aov_network_worker_running(running=False)
+
+        self.header_cache.log_stats()
+
+        if graphs and self.target_file_path and self.watch_render_check_box.isChecked():
+            self.start_watching()
+
+    def build_aov_network(self, aov_network: CreateAOVNetwork) -> None:
+        """Plans the AOV networks in a background thread, their nodes are created on the main thread once planned."""
+        if self.aov_network_worker is not None and self.aov_network_worker.isRunning():
+            return
+
+        if self.from_single_file_radio_button.isChecked():
+            read_sources = aov_network.get_selected_read_sources()
+
+            if not read_sources:
+                return
+
+            plan_function = aov_network.plan_standard_networks_from_single_file
+            plan_kwargs = {'read_sources': read_sources}
+            target_file_path = ''
+        else:
+            target_file_path = aov_network.get_target_file_path()
+
+            if not target_file_path:
+                return
+
+            plan_function = aov_network.plan_standard_networks_from_multi_files
+            plan_kwargs = {'target_file_path': target_file_path}
+
+        self.stop_watching()
+
+        self.aov_network = aov_network
+        self.target_file_path = target_file_path
+        self.aov_network_worker = AOVNetworkWorker(plan_function=plan_function, plan_kwargs=plan_kwargs, parent=self)
+        self.aov_network_worker.progress_changed.connect(self.progress_bar.set_progress)
+        self.aov_network_worker.planned.connect(self.aov_network_worker_planned)
+        self.aov_network_worker.cancelled.connect(self.aov_network_worker_cancelled)
+        self.aov_network_worker.failed.connect(self.aov_network_worker_failed)
+
+        self.set_aov_network_worker_running(running=True)
+        self.aov_network_worker.start()
+
+    def cancel_clicked_push_button(self) -> None:
+        """Cancels the AOV network planning."""
+        if self.aov_network_worker is not None:
+            self.aov_network_worker.cancel()
+
     def create_aov_network_clicked_push_button(self) -> None:
         """"""
         render_engine = self.render_engine_combo_box.currentText()
@@ -503,6 +880,51 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
         elif render_engine == AOVCompositorUI.V_RAY:
             self.v_ray_create_image_network()
 
+    def display_audit_report(self, report: dict) -> None:
+        """Shows a render audit report in the audit panel, one row per AOV file part under every render, the parts
+        with warnings are highlighted.
+        """
+        warning_brush = QtGui.QBrush(QtGui.QColor(*AOVCompositorUI.AUDIT_WARNING_COLOR))
+
+        self.audit_tree_widget.clear()
+
+        for render in report['renders']:
+            render_item = QtWidgets.QTreeWidgetItem([render['name']])
+            self.audit_tree_widget.addTopLevelItem(render_item)
+
+            for file in render['files']:
+                data_window_ratio = file['data_window_ratio']
+                file_item = QtWidgets.QTreeWidgetItem([
+                    file['aov'] or file['part'] or os.path.basename(file['file_path']),
+                    file['compression'].upper(),
+                    'Tiled' if file['tiled'] else 'Scanline',
+                    ', '.join(f'{count} {pixel_type}' for pixel_type, count in sorted(file['pixel_types'].items())),
+                    f'{data_window_ratio:.0%}' if data_window_ratio is not None else '',
+                    ' '.join(finding['message'] for finding in file['findings'])])
+                file_item.setToolTip(0, file['file_path'])
+                file_item.setToolTip(5, '\n'.join(finding['message'] for finding in file['findings']))
+
+                if any(finding['severity'] == AOVRenderAudit.WARNING for finding in file['findings']):
+                    for column in range(len(AOVCompositorUI.AUDIT_COLUMNS)):
+                        file_item.setForeground(column, warning_brush)
+
+                render_item.addChild(file_item)
+
+            for aov, error in sorted(render['errors'].items()):
+                error_item = QtWidgets.QTreeWidgetItem([aov, '', '', '', '', error])
+                error_item.setForeground(5, warning_brush)
+                render_item.addChild(error_item)
+
+            render_item.setExpanded(True)
+
+        for column in range(len(AOVCompositorUI.AUDIT_COLUMNS) - 1):
+            self.audit_tree_widget.resizeColumnToContents(column)
+
+        summary = report['summary']
+        self.audit_group_box.setTitle(
+            f'Render Audit: {summary["files"]} files, {summary["warnings"]} warnings, {summary["infos"]} infos')
+        self.audit_group_box.setVisible(True)
+
     def display_aov_compositor_widgets(self, aov_compositor_widget: QtWidgets.QWidget, advanced_mode: dict,
                                        standard_mode: dict) -> None:
         """Displays the AOV compositor widgets."""
@@ -523,6 +945,10 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
                         if aov_name == value[0]:
                             aov_widget.setVisible(True)
 
+    def get_build_mode(self) -> str:
+        """Gets the build mode."""
+        return AOVCompositorUI.BUILD_MODES[self.build_mode_combo_box.currentText()]
+
     def get_current_aovs_settings(self, aov_compositor_widget: QtWidgets.QWidget, advanced_mode: dict,
                                   standard_mode: dict) -> dict:
         """Gets current AOVs settings."""
@@ -545,6 +971,27 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
 
         return aovs
 
+    def get_mode_aovs_settings(self, advanced_mode: dict, standard_mode: dict) -> dict:
+        """Gets the default AOVs settings of the current compositing operation, for the render engines without AOV
+        compositor widgets.
+        """
+        if AOVCompositorUI.ADVANCED == self.render_compositing_operations_combo_box.currentText():
+            return {key: value[1] for key, value in advanced_mode.items()}
+
+        return {key: value[1] for key, value in standard_mode.items()}
+
+    def get_naming_template(self) -> AOVNamingTemplate:
+        """Gets the naming template, the default one if none is written."""
+        return AOVNamingTemplate(template=self.naming_template_line_edit.text().strip() or AOVNamingTemplate.DEFAULT)
+
+    def get_layout_style(self) -> str:
+        """Gets the layout style."""
+        return AOVCompositorUI.LAYOUT_STYLES[self.layout_style_combo_box.currentText()]
+
+    def get_merge_topology(self) -> str:
+        """Gets the merge topology."""
+        return AOVCompositorUI.MERGE_TOPOLOGIES[self.merge_topology_combo_box.currentText()]
+
     def arnold_create_image_network(self) -> None:
         """Arnold creates the image network."""
         aovs = self.get_current_aovs_settings(
@@ -552,13 +999,26 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
             advanced_mode=self.arnold_advanced_mode,
             standard_mode=self.arnold_standard_mode)
 
+        try:
+            naming_template = self.get_naming_template()
+        except AOVGraphError as error:
+            nuke.message(str(error))
+
+            return
+
         aov_network = CreateAOVNetwork()
         aov_network.set_aovs_settings(aovs=aovs)
-
-        if self.from_single_file_radio_button.isChecked():
-            aov_network.create_standard_network_from_single_file()
-        elif self.from_separate_files_radio_button.isChecked():
-            aov_network.create_standard_network_from_multi_files()
+        aov_network.set_header_cache(header_cache=self.header_cache)
+        aov_network.set_naming_template(naming_template=naming_template)
+        aov_network.set_max_depth(max_depth=self.subfolders_depth_spin_box.value())
+        aov_network.set_build_mode(mode=self.get_build_mode())
+        aov_network.set_topology(topology=self.get_merge_topology())
+        aov_network.set_layout_style(style=self.get_layout_style())
+        aov_network.set_layer_native(layer_native=self.layer_native_check_box.isChecked())
+        aov_network.set_crop_overscan(crop_overscan=self.crop_overscan_check_box.isChecked())
+        aov_network.set_update_existing(update_existing=self.update_existing_check_box.isChecked())
+
+        self.build_aov_network(aov_network=aov_network)
 
     def redshift_create_image_network(self) -> None:
         """Redshift creates the image network."""
@@ -575,20 +1035,117 @@ class AOVCompositorUI(maurice_qt.QDialogNuke):
             advanced_mode=self.v_ray_advanced_mode,
             standard_mode=self.v_ray_standard_mode)
 
+        try:
+            naming_template = self.get_naming_template()
+        except AOVGraphError as error:
+            nuke.message(str(error))
+
+            return
+
         aov_network = CreateAOVNetwork()
         aov_network.set_aovs_settings(aovs=aovs)
+        aov_network.set_header_cache(header_cache=self.header_cache)
+        aov_network.set_naming_template(naming_template=naming_template)
+        aov_network.set_max_depth(max_depth=self.subfolders_depth_spin_box.value())
+        aov_network.set_build_mode(mode=self.get_build_mode())
+        aov_network.set_topology(topology=self.get_merge_topology())
+        aov_network.set_layout_style(style=self.get_layout_style())
+        aov_network.set_layer_native(layer_native=self.layer_native_check_box.isChecked())
+        aov_network.set_crop_overscan(crop_overscan=self.crop_overscan_check_box.isChecked())
+        aov_network.set_update_existing(update_existing=self.update_existing_check_box.isChecked())
 
         if self.from_single_file_radio_button.isChecked():
             if AOVCompositorUI.STANDARD == render_compositing_operation:
-                aov_network.create_standard_network_from_single_file()
+                self.build_aov_network(aov_network=aov_network)
             elif AOVCompositorUI.ADVANCED == render_compositing_operation:
                 print('TODO: V-Ray Advanced Single File.')
         elif self.from_separate_files_radio_button.isChecked():
             if AOVCompositorUI.STANDARD == render_compositing_operation:
-                aov_network.create_standard_network_from_multi_files()
+                self.build_aov_network(aov_network=aov_network)
             elif AOVCompositorUI.ADVANCED == render_compositing_operation:
                 print('TODO: V-Ray Advanced Multi Files.')
 
+    def set_aov_network_worker_running(self, running: bool) -> None:
+        """Shows the progress widgets while the AOV network worker runs."""
+        self.progress_bar.set_progress(value=0, maximum=1)
+        self.progress_bar.setVisible(running)
+        self.cancel_push_button.setVisible(running)
+        self.create_aov_network_push_button.setEnabled(not running)
+
+    def start_watching(self) -> None:
+        """Watches the folders of the render of the last built network for new AOV files."""
+        self.stop_watching()
+
+        self.aov_folder_watcher = AOVFolderWatcher()
+        self.aov_folder_watcher.add_folders(folders_paths=self.aov_network.get_watched_folders_paths())
+        self.watch_timer.start()
+
+        logger.info('Watching %d render folders.', len(self.aov_folder_watcher))
+
+    def stop_watching(self) -> None:
+        """Stops watching the render folders, a running update is cancelled."""
+        self.watch_timer.stop()
+
+        if self.watch_worker is not None:
+            self.watch_worker.cancel()
+
+        if self.aov_folder_watcher is not None:
+            self.aov_folder_watcher.close()
+            self.aov_folder_watcher = None
+
+    def watch_render_toggled_check_box(self, checked: bool) -> None:
+        """Stops watching the render folders when unchecked."""
+        if not checked:
+            self.stop_watching()
+
+    def watch_timer_timeout(self) -> None:
+        """Polls the watched render folders and plans the existing network again in a background thread when they
+        changed, the changed folders are listed and the AOV headers probed off the main thread.
+        """
+        for worker in (self.aov_network_worker, self.watch_worker):
+            if worker is not None and worker.isRunning():
+                return
+
+        changed_folders_paths = self.aov_folder_watcher.poll()
+
+        if not changed_folders_paths:
+            return
+
+        self.watch_worker = AOVNetworkWorker(
+            plan_function=self.aov_network.plan_networks_from_folders,
+            plan_kwargs={'target_file_path': self.target_file_path, 'folders_paths': changed_folders_paths},
+            parent=self)
+        self.watch_worker.planned.connect(self.watch_worker_planned)
+        self.watch_worker.failed.connect(self.watch_worker_failed)
+        self.watch_worker.start()
+
+    def watch_worker_failed(self, error: str) -> None:
+        """Stops watching the render folders once the update of the watched AOV network failed."""
+        self.stop_watching()
+
+        nuke.message(f'AOV network update failed: {error}')
+
+    def watch_worker_planned(self, graphs: list) -> None:
+        """Updates the existing network with the files added to the watched folders on the main thread, unless the
+        watching stopped while planning.
+        """
+        if self.aov_folder_watcher is None:
+            return
+
+        try:
+            self.aov_network.update_networks(graphs=graphs)
+        except Exception as error:
+            logger.exception('Failed to update the watched AOV network.')
+
+            self.watch_worker_failed(error=str(error))
+
+            return
+
+        if self.aov_network.added_paths:
+            logger.info('Added to the AOV network: %s', ', '.join(self.aov_network.added_paths))
+
+        self.aov_folder_watcher.add_folders(folders_paths=self.aov_network.get_watched_folders_paths())
+
     def showEvent(self, event):
         """Shows event."""
         super(AOVCompositorUI, self).showEvent(event)
@@ -0,0 +1,67 @@
+"""
+========================================================================================================================
+Name: aov_network_worker.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+import logging
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphCancelled
+
+
+logger = logging.getLogger(__name__)
+
+
+class AOVNetworkWorker(QtCore.QThread):
+    """AOV network worker.
+
+    Runs a CreateAOVNetwork plan function, the file discovery and the planning, in a background thread. The planned
+    graphs are sent back with the planned signal, which is received on the main thread where the nodes are created.
+    """
+    progress_changed = QtCore.Signal(int, int, str)
+    planned = QtCore.Signal(list)
+    cancelled = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+    def __init__(self, plan_function: callable, plan_kwargs: dict, parent: QtCore.QObject = None):
+        """Initializes class attributes."""
+        super(AOVNetworkWorker, self).__init__(parent)
+
+        self.plan_function = plan_function
+        self.plan_kwargs = plan_kwargs
+        self.cancel_requested = False
+
+    def cancel(self) -> None:
+        """Requests the cancellation, the plan stops at its next progress step."""
+        self.cancel_requested = True
+
+    def progress(self, value: int, maximum: int, text: str) -> None:
+        """Sends the progress, or stops the plan if the cancellation was requested."""
+        if self.cancel_requested:
+            raise AOVGraphCancelled('Cancelled by the user.')
+
+        self.progress_changed.emit(value, maximum, text)
+
+    def run(self) -> None:
+        """Runs the plan function."""
+        try:
+            graphs = self.plan_function(progress=self.progress, **self.plan_kwargs)
+        except AOVGraphCancelled:
+            self.cancelled.emit()
+        except Exception as error:
+            logger.exception('AOV network planning failed.')
+
+            self.failed.emit(str(error))
+        else:
+            if self.cancel_requested:
+                self.cancelled.emit()
+            else:
+                self.planned.emit(graphs)
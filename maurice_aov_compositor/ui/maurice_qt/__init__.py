@@ -2,7 +2,7 @@
 ========================================================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-06-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
@@ -58,6 +58,9 @@ from maurice_aov_compositor.ui.maurice_qt.list_widget import QListWidget
 # message_box_question.py
 from maurice_aov_compositor.ui.maurice_qt.message_box_question import QMessageBoxQuestion
 
+# progress_bar.py
+from maurice_aov_compositor.ui.maurice_qt.progress_bar import QProgressBar
+
 # push_button.py
 from maurice_aov_compositor.ui.maurice_qt.push_button import QPushButton
 
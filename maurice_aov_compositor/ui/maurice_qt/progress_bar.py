@@ -0,0 +1,34 @@
+"""
+========================================================================================================================
+Name: progress_bar.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    from PySide6 import QtWidgets
+except ImportError:
+    from PySide2 import QtWidgets
+
+import maurice_aov_compositor.ui.maurice_qt.widgets_attributes as widgets_attributes
+import maurice_aov_compositor.ui.maurice_qt.widgets_styles as widgets_styles
+
+
+class QProgressBar(QtWidgets.QProgressBar):
+    """QProgressBar."""
+
+    def __init__(self, *args):
+        """Initializes class attributes."""
+        super(QProgressBar, self).__init__(*args)
+
+        # QProgressBar settings.
+        self.setFixedHeight(widgets_attributes.height)
+        self.setStyleSheet(widgets_styles.progress_bar_style())
+
+    def set_progress(self, value: int, maximum: int, text: str = '') -> None:
+        """Sets the progress and the text shown over it."""
+        self.setMaximum(max(maximum, 1))
+        self.setValue(value)
+        self.setFormat(f'{text} %p%' if text else '%p%')
@@ -2,19 +2,26 @@
 ========================================================================================================================
 Name: maurice_screen.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-06-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-from ctypes import windll
 from typing import Union
 
+try:
+    from ctypes import windll
+except ImportError:
+    windll = None
+
 import maurice_aov_compositor as maurice
 
 
 def get_ppi() -> int:
     """Gets the PPI of the screen."""
+    if windll is None:
+        return maurice.PPI
+
     user32 = windll.user32
     user32.SetProcessDPIAware()
     pix_per_inch = windll.gdi32.GetDeviceCaps(user32.GetDC(0), 88)
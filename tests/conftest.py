@@ -0,0 +1,64 @@
+"""
+========================================================================================================================
+Name: conftest.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+
+The tests run without Nuke or Qt, from the repository root:
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineWriter
+
+
+@pytest.fixture
+def render_folder(tmp_path):
+    """Gets a function that creates the empty files of a render folder, in subfolders for the names with slashes, and
+    returns the folder path.
+    """
+    def create_render_folder(files_names: list, folder_name: str = 'render') -> str:
+        folder_path = tmp_path / folder_name
+        folder_path.mkdir(parents=True, exist_ok=True)
+
+        for file_name in files_names:
+            file_path = folder_path / file_name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
+
+        return folder_path.as_posix()
+
+    return create_render_folder
+
+
+@pytest.fixture
+def exr_file(tmp_path):
+    """Gets a function that writes a synthetic EXR file, its header and an empty chunks offsets table, and returns its
+    path. The header is written by the scanline writer, which needs no NumPy to write a header.
+    """
+    def write_exr_file(file_name: str, channels_names: tuple = ('R', 'G', 'B', 'A'),
+                       data_window: tuple = (0, 0, 63, 31), display_window: tuple = None, pixel_type: str = 'half',
+                       compression: str = 'zip') -> str:
+        file_path = tmp_path / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        exr_writer = AOVEXRScanlineWriter(
+            file_path=str(file_path),
+            channels_names=list(channels_names),
+            data_window=data_window,
+            display_window=display_window or data_window,
+            pixel_type=pixel_type,
+            compression=compression)
+        file_path.write_bytes(exr_writer.get_header_data() + b'\0' * 8 * (data_window[3] - data_window[1] + 1))
+
+        return file_path.as_posix()
+
+    return write_exr_file
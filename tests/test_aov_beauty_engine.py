@@ -0,0 +1,107 @@
+"""
+========================================================================================================================
+Name: test_aov_beauty_engine.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import os
+
+import pytest
+
+from maurice_aov_compositor.core.aov_beauty_engine import AOVBeautyEngine
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineReader
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineWriter
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+def write_aov_file(file_path: str, channels: dict, data_window: tuple) -> None:
+    """Writes the (lines, width) arrays of the channels to a half float EXR file."""
+    with AOVEXRScanlineWriter(
+            file_path=file_path,
+            channels_names=list(channels),
+            data_window=data_window,
+            display_window=(0, 0, 31, 15),
+            pixel_type='half',
+            compression='zip') as writer:
+        writer.write_lines(channels=channels)
+
+
+@pytest.mark.parametrize('pattern, output_files_paths', (
+    ('/render/beauty.diffuse.%04d.exr', ['/out/beauty.0099.exr', '/out/beauty.0100.exr']),
+    ('/render/beauty.diffuse.%06d.exr', ['/out/beauty.000099.exr', '/out/beauty.000100.exr']),
+    ('/render/beauty.diffuse.###.exr', ['/out/beauty.099.exr', '/out/beauty.100.exr']),
+    ('/render/beauty.diffuse.%d.exr', ['/out/beauty.99.exr', '/out/beauty.100.exr']),
+))
+def test_render_frames_padding(pattern: str, output_files_paths: list):
+    frames = AOVBeautyEngine.get_render_frames(
+        files_paths=[('/render/beauty.specular.exr', 'specular', None), (pattern, 'diffuse', (99, 100))],
+        output_file_path='/out/beauty')
+
+    assert [output_file_path for _, output_file_path in frames] == output_files_paths
+    assert frames[0][0] == [
+        ('/render/beauty.specular.exr', 'rgba'),
+        (AOVSequence.get_frame_file_path(pattern=pattern, frame=99), 'rgba')]
+
+
+def test_render_frames_without_sequence():
+    assert AOVBeautyEngine.get_render_frames(
+        files_paths=[('/render/beauty.diffuse.exr', 'diffuse', None)],
+        output_file_path='/out/beauty') == [([('/render/beauty.diffuse.exr', 'rgba')], '/out/beauty.exr')]
+
+
+def test_build_frame(tmp_path):
+    np = pytest.importorskip('numpy')
+    rng = np.random.default_rng(seed=11)
+    diffuse = {channel_name: rng.random((16, 32), dtype=np.float32) for channel_name in ('R', 'G', 'B')}
+    specular = {channel_name: rng.random((8, 16), dtype=np.float32) for channel_name in ('R', 'G', 'B', 'A')}
+    write_aov_file(file_path=str(tmp_path / 'beauty.diffuse.exr'), channels=diffuse, data_window=(0, 0, 31, 15))
+    write_aov_file(file_path=str(tmp_path / 'beauty.specular.exr'), channels=specular, data_window=(8, 4, 23, 11))
+    output_file_path = str(tmp_path / 'beauty_beauty_rebuild.exr')
+
+    aov_beauty_engine = AOVBeautyEngine()
+    aov_beauty_engine.set_block_lines(block_lines=5)
+
+    assert aov_beauty_engine.build_frame(
+        sources=[(str(tmp_path / 'beauty.diffuse.exr'), 'rgba'), (str(tmp_path / 'beauty.specular.exr'), 'rgba')],
+        output_file_path=output_file_path) == output_file_path
+    assert sorted(os.listdir(tmp_path)) == ['beauty.diffuse.exr', 'beauty.specular.exr', 'beauty_beauty_rebuild.exr']
+
+    with AOVEXRScanlineReader(file_path=output_file_path) as reader:
+        _, lines = reader.read_lines(y_start=0, y_end=16)
+
+    for channel_name in ('R', 'G', 'B'):
+        expected = diffuse[channel_name].astype(np.float16).astype(np.float32)
+        expected[4:12, 8:24] += specular[channel_name].astype(np.float16).astype(np.float32)
+
+        assert np.array_equal(lines[channel_name], expected)
+
+
+def test_build_frame_failure(tmp_path, exr_file):
+    np = pytest.importorskip('numpy')
+    write_aov_file(
+        file_path=str(tmp_path / 'beauty.diffuse.exr'),
+        channels={channel_name: np.ones((16, 32), dtype=np.float32) for channel_name in ('R', 'G', 'B')},
+        data_window=(0, 0, 31, 15))
+    exr_file(file_name='beauty.specular.exr', data_window=(0, 0, 31, 15))
+    output_file_path = tmp_path / 'beauty_beauty_rebuild.exr'
+    output_file_path.write_bytes(b'previous beauty')
+
+    aov_beauty_engine = AOVBeautyEngine()
+    aov_beauty_engine.set_block_lines(block_lines=4)
+
+    with pytest.raises(AOVEXRHeaderError):
+        aov_beauty_engine.build_frame(
+            sources=[(str(tmp_path / 'beauty.diffuse.exr'), 'rgba'), (str(tmp_path / 'beauty.specular.exr'), 'rgba')],
+            output_file_path=str(output_file_path))
+
+    assert sorted(os.listdir(tmp_path)) == ['beauty.diffuse.exr', 'beauty.specular.exr', 'beauty_beauty_rebuild.exr']
+    assert output_file_path.read_bytes() == b'previous beauty'
+
+
+def test_temp_file_path():
+    assert AOVBeautyEngine.get_temp_file_path(file_path='/out/beauty.0001.exr') == \
+        f'/out/.beauty.0001.exr.{os.getpid()}.tmp'
@@ -0,0 +1,85 @@
+"""
+========================================================================================================================
+Name: test_aov_channel_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_channel_index import AOVChannelIndex
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeader
+
+
+CHANNELS = [
+    'rgba.red', 'rgba.green', 'rgba.blue', 'rgba.alpha',
+    'diffuse.red', 'diffuse.green', 'diffuse.blue',
+    'specular.red', 'specular.green',
+    'N.X', 'N.Y', 'N.Z',
+    'P.x', 'P.y', 'P.z', 'P.alpha',
+    'depth.Z',
+    'crypto00.red', 'crypto00.green', 'crypto00.blue', 'crypto00.alpha',
+    'id.id', 'id.weight',
+    'nolayer']
+
+
+@pytest.fixture
+def channel_index() -> AOVChannelIndex:
+    """Gets a channel index of every kind of layer."""
+    return AOVChannelIndex(channels=CHANNELS)
+
+
+@pytest.mark.parametrize('layer, kind', [
+    ('rgba', AOVChannelIndex.COLOR),
+    ('diffuse', AOVChannelIndex.COLOR),
+    ('crypto00', AOVChannelIndex.COLOR),
+    ('N', AOVChannelIndex.VECTOR),
+    ('P', AOVChannelIndex.VECTOR),
+    ('depth', AOVChannelIndex.SCALAR),
+    ('specular', AOVChannelIndex.CUSTOM),
+    ('id', AOVChannelIndex.CUSTOM)])
+def test_layer_kind(channel_index, layer, kind):
+    assert channel_index.get_layer_kind(layer=layer) == kind
+
+
+def test_layers(channel_index):
+    assert len(channel_index) == 8
+    assert 'diffuse' in channel_index
+    assert 'nolayer' not in channel_index
+    assert channel_index.get_layers() == ['N', 'P', 'crypto00', 'depth', 'diffuse', 'id', 'rgba', 'specular']
+    assert channel_index.get_channels(layer='missing') == set()
+
+
+def test_color_channels(channel_index):
+    assert channel_index.has_alpha(layer='rgba')
+    assert channel_index.has_alpha(layer='P')
+    assert not channel_index.has_alpha(layer='diffuse')
+
+    assert channel_index.has_color_channels(layer='specular')
+    assert not channel_index.has_color_channels(layer='N')
+    assert not channel_index.has_color_channels(layer='missing')
+
+    assert channel_index.get_missing_color_channels(layer='diffuse') == []
+    assert channel_index.get_missing_color_channels(layer='specular') == ['blue']
+    assert channel_index.get_missing_color_channels(layer='missing') == ['red', 'green', 'blue']
+
+
+def test_aovs_and_custom_channels(channel_index):
+    assert channel_index.get_aovs(aovs={'diffuse', 'specular', 'N', 'depth', 'sss'}) == ['diffuse', 'specular']
+
+    assert channel_index.get_custom_channels(layer='id') == {'id', 'weight'}
+    assert channel_index.get_custom_channels(layer='N') == set()
+    assert channel_index.get_custom_channels(layer='P') == set()
+    assert channel_index.get_custom_channels(layer='rgba') == set()
+
+
+def test_header_channel_index(exr_file):
+    file_path = exr_file(file_name='beauty.exr', channels_names=('R', 'G', 'B', 'A', 'diffuse.R', 'N.X', 'N.Y', 'N.Z'))
+    channel_index = AOVEXRHeader(file_path=file_path).read().get_channel_index()
+
+    assert channel_index.get_layers() == ['N', 'diffuse', 'rgba']
+    assert channel_index.get_layer_kind(layer='rgba') == AOVChannelIndex.COLOR
+    assert channel_index.get_layer_kind(layer='N') == AOVChannelIndex.VECTOR
+    assert channel_index.get_layer_kind(layer='diffuse') == AOVChannelIndex.SCALAR
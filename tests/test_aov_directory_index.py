@@ -0,0 +1,63 @@
+"""
+========================================================================================================================
+Name: test_aov_directory_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maurice_aov_compositor.core.aov_directory_index import AOVDirectoryIndex
+
+
+FILES_NAMES = [
+    'beauty.diffuse.1001.exr',
+    'beauty.diffuse.1002.exr',
+    'beauty.diffuse.1004.exr',
+    'beauty.specular.exr',
+    'fx.emission.0001.exr',
+    'notes.txt',
+    'key/beauty.sss.exr',
+]
+
+
+def test_build(render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    directory_index = AOVDirectoryIndex(folder_path=folder_path + '/').build()
+
+    assert directory_index.folder_path == folder_path
+    assert directory_index.entries_count == 7
+    assert directory_index.get_base_names() == ['beauty', 'fx']
+    assert 'beauty' in directory_index and 'notes' not in directory_index
+    assert directory_index.get_aovs(base_name='beauty') == ['diffuse', 'specular']
+    assert directory_index.get_frames(base_name='beauty', aov='diffuse') == [1001, 1002, 1004]
+    assert directory_index.get_folders_paths() == [f'{folder_path}/key']
+
+
+def test_get_files_paths(render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    directory_index = AOVDirectoryIndex(folder_path=folder_path).build()
+
+    assert directory_index.get_files_paths(base_name='beauty') == [
+        (f'{folder_path}/beauty.diffuse.%04d.exr', 'diffuse', (1001, 1004)),
+        (f'{folder_path}/beauty.specular.exr', 'specular', None)]
+    assert directory_index.get_files_paths(base_name='beauty', aovs={'specular'}) == [
+        (f'{folder_path}/beauty.specular.exr', 'specular', None)]
+    assert directory_index.get_files_paths(base_name='missing') == []
+    assert directory_index.get_sequence(base_name='beauty', aov='diffuse').get_missing_frames() == [1003]
+    assert directory_index.get_sequence(base_name='beauty', aov='specular') is None
+
+
+def test_load(render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    directory_index = AOVDirectoryIndex(folder_path=folder_path).build()
+    loaded_directory_index = AOVDirectoryIndex(folder_path=folder_path).load(
+        files_names=directory_index.get_all_files_names(),
+        entries_count=directory_index.entries_count,
+        folders_names=directory_index.folders_names)
+
+    assert loaded_directory_index.renders == directory_index.renders
+    assert loaded_directory_index.folders_names == ['key']
+    assert loaded_directory_index.entries_count == 7
+    assert sorted(loaded_directory_index.get_all_files_names()) == sorted(
+        file_name for file_name in FILES_NAMES if file_name.endswith('.exr') and '/' not in file_name)
@@ -0,0 +1,128 @@
+"""
+========================================================================================================================
+Name: test_aov_exr_header.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import struct
+
+import pytest
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeader
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineWriter
+
+
+def get_attribute_data(name: str, attribute_type: str, value: bytes) -> bytes:
+    """Gets the bytes of a header attribute."""
+    return name.encode('utf-8') + b'\0' + attribute_type.encode('utf-8') + b'\0' + struct.pack('<i', len(value)) + value
+
+
+def get_channels_data(channels_names: list, pixel_type: int = 1) -> bytes:
+    """Gets the bytes of a channel list."""
+    return b''.join(
+        channel_name.encode('utf-8') + b'\0' + struct.pack('<iB3xii', pixel_type, 0, 1, 1)
+        for channel_name in channels_names) + b'\0'
+
+
+def get_multipart_header_data(parts: list) -> bytes:
+    """Gets the header bytes of a multipart file of (part name, channels names) parts."""
+    data = struct.pack('<ii', AOVEXRHeader.MAGIC, 2 | AOVEXRHeader.MULTIPART_FLAG)
+
+    for part_name, channels_names in parts:
+        data += get_attribute_data(name='channels', attribute_type='chlist', value=get_channels_data(channels_names))
+        data += get_attribute_data(name='compression', attribute_type='compression', value=b'\3')
+        data += get_attribute_data(name='dataWindow', attribute_type='box2i', value=struct.pack('<4i', 0, 0, 63, 31))
+        data += get_attribute_data(
+            name='displayWindow', attribute_type='box2i', value=struct.pack('<4i', 0, 0, 63, 31))
+        data += get_attribute_data(name='name', attribute_type='string', value=part_name.encode('utf-8'))
+        data += get_attribute_data(name='type', attribute_type='string', value=b'scanlineimage')
+        data += b'\0'
+
+    return data + b'\0'
+
+
+def test_single_part_round_trip():
+    writer = AOVEXRScanlineWriter(
+        file_path='beauty.exr',
+        channels_names=['R', 'G', 'B', 'A', 'diffuse.R', 'diffuse.G', 'diffuse.B'],
+        data_window=(-8, -4, 71, 35),
+        display_window=(0, 0, 63, 31),
+        pixel_type='float',
+        compression='zips')
+    data = writer.get_header_data()
+    header = AOVEXRHeader(file_path='beauty.exr').load(data=data)
+    part = header.get_part()
+
+    assert header.version == AOVEXRScanlineWriter.VERSION
+    assert not header.is_multipart() and not header.is_tiled() and not header.is_deep()
+    assert header.header_size == len(data)
+    assert part.compression == 'zips'
+    assert part.get_channels_names() == ['A', 'B', 'G', 'R', 'diffuse.B', 'diffuse.G', 'diffuse.R']
+    assert set(part.get_pixel_types().values()) == {'float'}
+    assert header.get_data_windows() == [(-8, -4, 71, 35)]
+    assert header.get_display_window() == (0, 0, 63, 31)
+    assert part.get_data_window_size() == (80, 40)
+    assert part.get_scanlines_per_chunk() == 1
+    assert header.get_layers() == ['diffuse']
+    assert sorted(header.get_nuke_channels()) == [
+        'diffuse.blue', 'diffuse.green', 'diffuse.red', 'rgba.alpha', 'rgba.blue', 'rgba.green', 'rgba.red']
+    assert header.get_channel_index().get_aovs(aovs={'diffuse', 'specular'}) == ['diffuse']
+
+
+def test_read(tmp_path):
+    file_path = str(tmp_path / 'beauty.exr')
+    data = AOVEXRScanlineWriter(
+        file_path=file_path,
+        channels_names=['R', 'G', 'B'],
+        data_window=(0, 0, 15, 15),
+        display_window=(0, 0, 15, 15)).get_header_data()
+
+    with open(file_path, 'wb') as file:
+        file.write(data + b'\0' * 64)
+
+    header = AOVEXRHeader(file_path=file_path).read()
+
+    assert header.data == data
+    assert header.get_part().compression == 'zip'
+    assert header.get_part().get_scanlines_per_chunk() == 16
+
+
+def test_multipart_round_trip():
+    data = get_multipart_header_data(parts=[
+        ('beauty', ['R', 'G', 'B', 'A']),
+        ('specular', ['R', 'G', 'B']),
+        ('lights', ['key.R', 'key.G', 'key.B'])])
+    header = AOVEXRHeader(file_path='multi.exr').load(data=data)
+
+    assert header.is_multipart()
+    assert [part.name for part in header.parts] == ['beauty', 'specular', 'lights']
+    assert header.get_part(name='specular').get_channels_names() == ['R', 'G', 'B']
+    assert header.get_nuke_channels() == [
+        'rgba.red', 'rgba.green', 'rgba.blue', 'rgba.alpha',
+        'specular.red', 'specular.green', 'specular.blue',
+        'key.red', 'key.green', 'key.blue']
+    assert header.get_part_default_layer(index=1) == 'specular'
+    assert header.get_channel_index().get_aovs(aovs={'specular', 'key', 'sss'}) == ['key', 'specular']
+    assert header.get_data_windows() == [(0, 0, 63, 31)] * 3
+
+
+@pytest.mark.parametrize('data', (
+    b'',
+    b'\x76\x2f\x31',
+    struct.pack('<ii', 0, 2),
+    struct.pack('<ii', AOVEXRHeader.MAGIC, 2) + b'channels\0chlist\0',
+    struct.pack('<ii', AOVEXRHeader.MAGIC, 2) + get_attribute_data(
+        name='channels', attribute_type='chlist', value=b'diffuse.R') + b'\0',
+))
+def test_invalid_header(data: bytes):
+    with pytest.raises(AOVEXRHeaderError):
+        AOVEXRHeader(file_path='broken.exr').load(data=data)
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(AOVEXRHeaderError):
+        AOVEXRHeader(file_path=str(tmp_path / 'missing.exr')).read()
@@ -0,0 +1,100 @@
+"""
+========================================================================================================================
+Name: test_aov_exr_image.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineCodec
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineReader
+from maurice_aov_compositor.core.aov_exr_image import AOVEXRScanlineWriter
+
+
+@pytest.mark.parametrize('data', (
+    b'',
+    b'a',
+    b'abc',
+    b'aaaa',
+    b'abcabcabc',
+    b'a' * 300,
+    bytes(range(256)) * 2,
+    b'ab' + b'c' * 200 + b'de' * 100,
+))
+def test_rle_round_trip(data: bytes):
+    assert AOVEXRScanlineCodec.decode_rle(data=AOVEXRScanlineCodec.encode_rle(data=data)) == data
+
+
+def test_unsupported_compression():
+    with pytest.raises(AOVEXRHeaderError):
+        AOVEXRScanlineCodec(compression='piz')
+
+
+@pytest.mark.parametrize('compression', AOVEXRScanlineCodec.SUPPORTED_COMPRESSIONS)
+def test_codec_round_trip(compression: str):
+    np = pytest.importorskip('numpy')
+    data = np.linspace(0, 1, 999, dtype=np.float16).tobytes()
+    codec = AOVEXRScanlineCodec(compression=compression)
+
+    assert codec.decompress(data=codec.compress(data=data), size=len(data)) == data
+
+
+@pytest.mark.parametrize('compression', AOVEXRScanlineCodec.SUPPORTED_COMPRESSIONS)
+@pytest.mark.parametrize('pixel_type', ('half', 'float'))
+def test_image_round_trip(tmp_path, compression: str, pixel_type: str):
+    np = pytest.importorskip('numpy')
+    file_path = str(tmp_path / 'beauty.exr')
+    data_window = (-4, -2, 35, 40)
+    width, height = 40, 43
+    rng = np.random.default_rng(seed=7)
+    channels = {channel_name: rng.random((height, width), dtype=np.float32) for channel_name in ('R', 'G', 'B')}
+    channels['B'][:, :20] = 0.5
+
+    with AOVEXRScanlineWriter(
+            file_path=file_path,
+            channels_names=list(channels),
+            data_window=data_window,
+            display_window=(0, 0, 31, 31),
+            pixel_type=pixel_type,
+            compression=compression) as writer:
+        for y_start in range(0, height, 10):
+            writer.write_lines(channels={
+                channel_name: lines[y_start:y_start + 10] for channel_name, lines in channels.items()})
+
+    dtype = AOVEXRScanlineReader.DTYPES[pixel_type]
+
+    with AOVEXRScanlineReader(file_path=file_path) as reader:
+        assert reader.part.data_window == data_window
+        assert reader.part.compression == compression
+        assert reader.get_channels_names(layer='rgba') == {'red': 'R', 'green': 'G', 'blue': 'B'}
+
+        lines_y, lines = reader.read_lines(y_start=-10, y_end=100)
+
+        assert lines_y == -2
+        assert len(lines) == height
+
+        for channel_name, expected_lines in channels.items():
+            assert np.array_equal(lines[channel_name], expected_lines.astype(dtype))
+
+        lines_y, lines = reader.read_lines(y_start=5, y_end=7)
+
+        assert lines_y == 5
+        assert np.array_equal(lines['G'], channels['G'][7:9].astype(dtype))
+        assert reader.read_lines(y_start=41, y_end=50) is None
+
+
+def test_incomplete_image(tmp_path):
+    np = pytest.importorskip('numpy')
+    writer = AOVEXRScanlineWriter(
+        file_path=str(tmp_path / 'beauty.exr'),
+        channels_names=['R'],
+        data_window=(0, 0, 7, 7),
+        display_window=(0, 0, 7, 7)).open()
+    writer.write_lines(channels={'R': np.zeros((4, 8), dtype=np.float32)})
+
+    with pytest.raises(AOVEXRHeaderError):
+        writer.close()
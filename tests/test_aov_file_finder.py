@@ -0,0 +1,121 @@
+"""
+========================================================================================================================
+Name: test_aov_file_finder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import os
+
+import pytest
+
+from maurice_aov_compositor.core.aov_file_finder import AOVFileFinder
+from maurice_aov_compositor.core.aov_graph import AOVGraphCancelled
+
+
+AOVS_SETTINGS = {'Diffuse': 'diffuse', 'Specular': 'specular', 'SSS': 'sss', 'Emission': 'emission'}
+
+
+def get_file_finder(max_depth: int = AOVFileFinder.MAX_DEPTH) -> AOVFileFinder:
+    """Gets a file finder of the AOVs settings without index cache."""
+    file_finder = AOVFileFinder(aovs_settings=AOVS_SETTINGS)
+    file_finder.set_max_depth(max_depth=max_depth)
+
+    return file_finder
+
+
+def get_aovs_folders(files_paths: list, folder_path: str) -> dict:
+    """Gets the folder of every AOV relative to the folder."""
+    return {aov: os.path.relpath(os.path.dirname(file_path), folder_path) for file_path, aov, _ in files_paths}
+
+
+def test_get_renders(render_folder):
+    folder_path = render_folder(files_names=[
+        'beauty.diffuse.1001.exr',
+        'beauty.diffuse.1002.exr',
+        'beauty.specular.exr',
+        'beauty.crypto.exr',
+        'fx.emission.exr'])
+
+    assert get_file_finder().get_renders(folder_path=folder_path) == {
+        'beauty': [
+            (f'{folder_path}/beauty.diffuse.%04d.exr', 'diffuse', (1001, 1002)),
+            (f'{folder_path}/beauty.specular.exr', 'specular', None)],
+        'fx': [(f'{folder_path}/fx.emission.exr', 'emission', None)]}
+
+
+@pytest.mark.parametrize('max_depth, aovs_folders', (
+    (0, {'diffuse': '.'}),
+    (1, {'diffuse': '.', 'specular': 'key'}),
+    (2, {'diffuse': '.', 'specular': 'key', 'sss': 'key/sss'}),
+    (3, {'diffuse': '.', 'specular': 'key', 'sss': 'key/sss', 'emission': 'key/sss/deep'}),
+))
+def test_depth_limit(render_folder, max_depth: int, aovs_folders: dict):
+    folder_path = render_folder(files_names=[
+        'beauty.diffuse.exr',
+        'key/beauty.specular.exr',
+        'key/sss/beauty.sss.exr',
+        'key/sss/deep/beauty.emission.exr'])
+    renders = get_file_finder(max_depth=max_depth).get_renders(folder_path=folder_path)
+
+    assert get_aovs_folders(files_paths=renders['beauty'], folder_path=folder_path) == aovs_folders
+
+
+def test_shallowest_duplicate(render_folder):
+    folder_path = render_folder(files_names=['beauty.diffuse.exr', 'old/beauty.diffuse.exr', 'old/beauty.sss.exr'])
+    renders = get_file_finder().get_renders(folder_path=folder_path)
+
+    assert get_aovs_folders(files_paths=renders['beauty'], folder_path=folder_path) == {'diffuse': '.', 'sss': 'old'}
+
+
+def test_find_files_paths_in_aov_folders(render_folder):
+    folder_path = render_folder(files_names=[
+        'diffuse/beauty.diffuse.1001.exr',
+        'specular/beauty.specular.1001.exr',
+        'sss/beauty.sss.1001.exr',
+        'other/fx.emission.1001.exr'])
+    files_paths = get_file_finder(max_depth=0).find_files_paths(
+        target_file_path=f'{folder_path}/diffuse/beauty.diffuse.1001.exr')
+
+    assert get_aovs_folders(files_paths=files_paths, folder_path=folder_path) == {
+        'diffuse': 'diffuse', 'specular': 'specular', 'sss': 'sss'}
+    assert get_file_finder().get_network_id(files_paths=files_paths) == f'{folder_path}/beauty'
+
+
+def test_find_files_paths_from_pattern(render_folder):
+    folder_path = render_folder(files_names=['beauty.diffuse.1001.exr', 'beauty.specular.1001.exr'])
+    files_paths = get_file_finder().find_files_paths(target_file_path=f'{folder_path}/beauty.diffuse.####.exr 1-10')
+
+    assert [aov for _, aov, _ in files_paths] == ['diffuse', 'specular']
+    assert get_file_finder().find_files_paths(target_file_path=f'{folder_path}/notes.txt') == []
+
+
+def test_progress_and_cancel(render_folder):
+    folder_path = render_folder(files_names=['beauty.diffuse.exr', 'key/beauty.specular.exr', 'fill/beauty.sss.exr'])
+    texts = []
+
+    get_file_finder().get_renders(folder_path=folder_path, progress=lambda value, maximum, text: texts.append(text))
+
+    assert texts == [f'Listing {folder_path}', f'Listing {folder_path}/fill', f'Listing {folder_path}/key']
+
+    def cancel(value: int, maximum: int, text: str) -> None:
+        if value:
+            raise AOVGraphCancelled('Cancelled')
+
+    with pytest.raises(AOVGraphCancelled):
+        get_file_finder().get_renders(folder_path=folder_path, progress=cancel)
+
+
+def test_refresh_folders(render_folder):
+    folder_path = render_folder(files_names=['beauty.diffuse.exr'])
+    file_finder = get_file_finder()
+    file_finder.get_renders(folder_path=folder_path)
+
+    render_folder(files_names=['beauty.specular.exr', 'notes.txt', 'key/beauty.sss.exr'])
+
+    assert file_finder.refresh_folders(folders_paths=file_finder.get_folders_paths()) == [
+        f'{folder_path}/beauty.specular.exr', f'{folder_path}/key']
+    assert [aov for _, aov, _ in file_finder.get_renders(folder_path=folder_path)['beauty']] == [
+        'diffuse', 'specular', 'sss']
@@ -0,0 +1,116 @@
+"""
+========================================================================================================================
+Name: test_aov_graph_diff.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph_diff import AOVGraphDiff
+
+
+def get_graph(read_knobs: dict = None, merge_class: str = 'Merge2', merge_inputs: list = None) -> AOVGraph:
+    """Gets a network of two Read nodes and their merge."""
+    graph = AOVGraph(network_id='beauty')
+    graph.add_node(key='read/diffuse', node_class='Read', knobs=read_knobs or {'file': '/render/beauty.diffuse.exr'})
+    graph.add_node(key='read/specular', node_class='Read', knobs={'file': '/render/beauty.specular.exr'})
+    graph.add_node(
+        key='merge/specular',
+        node_class=merge_class,
+        knobs={'operation': 'plus'},
+        inputs=merge_inputs or ['read/specular', 'read/diffuse'])
+
+    return graph
+
+
+def test_unchanged_graph():
+    graph_diff = AOVGraphDiff(graph=get_graph(), existing_graph=get_graph())
+
+    assert len(graph_diff) == 0
+    assert graph_diff.changed_knobs == {}
+    assert graph_diff.rewired_keys == []
+    assert sorted(graph_diff.get_unchanged_keys()) == ['merge/specular', 'read/diffuse', 'read/specular']
+
+
+@pytest.mark.parametrize('value, existing_value', (
+    (1001, 1001.0),
+    (0.1, 0.1000000001),
+    ([0, 0, 1920, 1080], (0.0, 0.0, 1920.0, 1080.0)),
+    (True, 1),
+    ('/render/beauty.diffuse.exr', '/render/beauty.diffuse.exr'),
+))
+def test_equal_knob_values(value: object, existing_value: object):
+    graph_diff = AOVGraphDiff(
+        graph=get_graph(read_knobs={'first': value}),
+        existing_graph=get_graph(read_knobs={'first': existing_value}))
+
+    assert graph_diff.changed_knobs == {}
+
+
+def test_changed_knob_values():
+    graph_diff = AOVGraphDiff(
+        graph=get_graph(read_knobs={'first': 1001, 'last': 1010}),
+        existing_graph=get_graph(read_knobs={'first': 1001.0, 'last': 1020.0}))
+
+    assert graph_diff.changed_knobs == {'read/diffuse': {'last': 1010}}
+    assert graph_diff.get_unchanged_keys() == ['read/specular', 'merge/specular']
+
+
+def test_unplanned_knobs_are_ignored():
+    existing_graph = get_graph()
+    existing_graph.get_node('merge/specular').knobs['mix'] = 0.5
+
+    assert len(AOVGraphDiff(graph=get_graph(), existing_graph=existing_graph)) == 0
+
+
+def test_trailing_empty_inputs():
+    graph_diff = AOVGraphDiff(
+        graph=get_graph(merge_inputs=['read/specular', 'read/diffuse']),
+        existing_graph=get_graph(merge_inputs=['read/specular', 'read/diffuse', None, None]))
+
+    assert graph_diff.rewired_keys == []
+
+
+def test_rewired_inputs():
+    graph_diff = AOVGraphDiff(
+        graph=get_graph(merge_inputs=['read/specular', 'read/diffuse']),
+        existing_graph=get_graph(merge_inputs=['read/diffuse', 'read/specular']))
+
+    assert graph_diff.rewired_keys == ['merge/specular']
+
+
+def test_changed_node_class():
+    graph_diff = AOVGraphDiff(graph=get_graph(merge_class='Merge2'), existing_graph=get_graph(merge_class='Plus'))
+
+    assert graph_diff.removed_keys == ['merge/specular']
+    assert graph_diff.added_keys == ['merge/specular']
+    assert 'merge/specular' not in graph_diff.changed_knobs
+    assert len(graph_diff) == 1
+
+
+def test_added_and_removed_nodes():
+    graph = get_graph()
+    graph.add_node(key='dot/output', node_class='Dot', inputs=['merge/specular'])
+    existing_graph = get_graph()
+    existing_graph.add_node(key='shuffle/diffuse', node_class='Shuffle2', inputs=['read/diffuse'])
+
+    graph_diff = AOVGraphDiff(graph=graph, existing_graph=existing_graph)
+
+    assert graph_diff.added_keys == ['dot/output']
+    assert graph_diff.removed_keys == ['shuffle/diffuse']
+
+
+def test_external_nodes_are_skipped():
+    graph = get_graph()
+    graph.add_external_node(key='read', node_class='Read', external_name='Read1')
+    existing_graph = get_graph()
+    existing_graph.add_external_node(key='read/old', node_class='Read', external_name='Read2')
+
+    graph_diff = AOVGraphDiff(graph=graph, existing_graph=existing_graph)
+
+    assert graph_diff.added_keys == []
+    assert graph_diff.removed_keys == []
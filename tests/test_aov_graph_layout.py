@@ -0,0 +1,108 @@
+"""
+========================================================================================================================
+Name: test_aov_graph_layout.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_graph_layout import AOVGraphLayout
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+
+
+def get_graph(aovs: tuple = ('diffuse', 'specular')) -> AOVGraph:
+    """Gets the linear network of the AOVs."""
+    planner = AOVNetworkPlanner()
+    planner.set_aovs_settings(aovs={aov.title(): aov for aov in aovs})
+
+    return planner.plan_standard_network_from_multi_files(
+        files_paths=[(f'/render/beauty.{aov}.exr', aov, None) for aov in aovs])
+
+
+def get_layout(style: str) -> AOVGraphLayout:
+    """Gets a layout of the style."""
+    layout = AOVGraphLayout()
+    layout.set_style(style=style)
+
+    return layout
+
+
+def get_position(graph: AOVGraph, key: str) -> tuple:
+    """Gets the (X, Y) position of a node."""
+    graph_node = graph.get_node(key)
+
+    return graph_node.x_pos, graph_node.y_pos
+
+
+def test_grid_layout():
+    graph = get_graph()
+    get_layout(style=AOVGraphLayout.GRID).apply(graph=graph)
+
+    assert get_position(graph=graph, key='read/diffuse') == (0, 0)
+    assert get_position(graph=graph, key='read/specular') == (150, 0)
+    assert get_position(graph=graph, key='shuffle/specular') == (150, 110)
+    assert get_position(graph=graph, key='dot/base') == (34, 163)
+    assert get_position(graph=graph, key='merge/specular') == (150, 160)
+    assert get_position(graph=graph, key=AOVNetworkPlanner.OUTPUT_KEY) == (184, 213)
+
+
+def test_compact_layout():
+    graph = get_graph()
+    get_layout(style=AOVGraphLayout.COMPACT).apply(graph=graph)
+
+    assert get_position(graph=graph, key='read/specular') == (100, 0)
+    assert get_position(graph=graph, key='shuffle/specular') == (100, 90)
+
+
+def test_tree_layout():
+    graph = get_graph()
+    get_layout(style=AOVGraphLayout.TREE).apply(graph=graph)
+
+    assert get_position(graph=graph, key='shuffle/diffuse') == (0, 110)
+    assert get_position(graph=graph, key='dot/base') == (34, 163)
+    assert get_position(graph=graph, key='merge/specular') == (75, 210)
+
+
+def test_bounding_box():
+    graph = get_graph()
+    get_layout(style=AOVGraphLayout.GRID).apply(graph=graph)
+
+    assert AOVGraphLayout.get_bounding_box(graph=graph) == (0, 0, 230, 225)
+    assert AOVGraphLayout.get_bounding_box(graph=AOVGraph()) == (0, 0, 0, 0)
+
+
+def test_side_by_side_origins():
+    graphs = [get_graph(), get_graph(aovs=('diffuse',)), get_graph()]
+    layout = get_layout(style=AOVGraphLayout.GRID)
+
+    for graph in graphs:
+        layout.apply(graph=graph)
+
+    origins = layout.get_side_by_side_origins(graphs=graphs, origins=[(0, 0), (1000, 50), (0, 100)])
+
+    assert origins == [(0, 0), (1000, 50), (380, 100)]
+
+
+def test_side_by_side_origins_keep_external_graphs():
+    external_graph = AOVGraph()
+    external_graph.add_external_node(key='read', node_class='Read', external_name='Read1')
+    external_graph.add_node(key='shuffle/diffuse', node_class='Shuffle2', inputs=['read'], row=2)
+    graphs = [get_graph(), external_graph, get_graph()]
+    layout = get_layout(style=AOVGraphLayout.GRID)
+
+    for graph in graphs:
+        layout.apply(graph=graph)
+
+    origins = layout.get_side_by_side_origins(graphs=graphs, origins=[(0, 0), (100, 500), (700, 0)])
+
+    assert origins == [(330, 0), (100, 500), (710, 0)]
+
+
+def test_unknown_style():
+    with pytest.raises(AOVGraphError):
+        AOVGraphLayout().set_style(style='radial')
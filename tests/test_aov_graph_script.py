@@ -0,0 +1,77 @@
+"""
+========================================================================================================================
+Name: test_aov_graph_script.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraph
+from maurice_aov_compositor.core.aov_graph_script import AOVGraphScriptWriter
+
+
+@pytest.mark.parametrize('value, word', (
+    (True, 'true'),
+    (False, 'false'),
+    (3, '3'),
+    (0.5, '0.5'),
+    ('plus', 'plus'),
+    ('/render/beauty.diffuse.%04d.exr', '/render/beauty.diffuse.%04d.exr'),
+    ('/render/beauty.diffuse.####.exr', '/render/beauty.diffuse.####.exr'),
+    ([0, 0, 1920, 1080], '{0 0 1920 1080}'),
+    (('a', True), '{a true}'),
+    ('', '""'),
+    ('two words', '"two words"'),
+    ('C:\\render', '"C:\\\\render"'),
+    ('say "hi"', '"say \\"hi\\""'),
+    ('$env(HOME)', '"\\$env(HOME)"'),
+    ('[exit]', '"\\[exit\\]"'),
+    ('a\nb', '"a\\nb"'),
+))
+def test_format_value(value: any, word: str):
+    assert AOVGraphScriptWriter.format_value(value=value) == word
+
+
+def test_write_wide_merge_inputs():
+    graph = AOVGraph(network_id='beauty')
+    graph.add_node(key='read/diffuse', node_class='Read', knobs={'file': '/render/diffuse.exr'})
+    graph.add_node(key='read/specular', node_class='Read', knobs={'file': '/render/specular.exr'})
+    graph.add_node(key='read/sss', node_class='Read', knobs={'file': '/render/sss.exr'})
+
+    merge_node = graph.add_node(key='merge/wide', node_class='Merge2', knobs={'operation': 'plus'})
+    merge_node.set_input(0, 'read/diffuse')
+    merge_node.set_input(1, 'read/specular')
+    merge_node.set_input(3, 'read/sss')
+
+    script = AOVGraphScriptWriter().write(graph=graph)
+
+    assert script.count('Read {') == 3
+    assert 'push $Naov2\npush $Naov1\npush $Naov0\nMerge2 {\n inputs 3\n' in script
+    assert 'operation plus' in script
+
+
+def test_write_merge_mask_input():
+    graph = AOVGraph()
+    graph.add_node(key='read/diffuse', node_class='Read')
+    graph.add_node(key='read/specular', node_class='Read')
+    graph.add_node(key='read/matte', node_class='Read')
+    graph.add_node(key='read/sss', node_class='Read')
+    graph.add_node(
+        key='merge/wide',
+        node_class='Merge2',
+        inputs=['read/diffuse', 'read/specular', 'read/matte', 'read/sss'])
+
+    script = AOVGraphScriptWriter().write(graph=graph)
+
+    assert 'push $Naov2\npush $Naov3\npush $Naov1\npush $Naov0\nMerge2 {\n inputs 3+1\n' in script
+
+
+def test_write_mask_input_of_other_nodes():
+    graph = AOVGraph()
+    graph.add_node(key='read/diffuse', node_class='Read')
+    graph.add_node(key='dot', node_class='Dot', inputs=['read/diffuse', None, None])
+
+    assert 'push $Naov0\nDot {\n inputs 1\n' in AOVGraphScriptWriter().write(graph=graph)
@@ -0,0 +1,88 @@
+"""
+========================================================================================================================
+Name: test_aov_header_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import os
+
+import pytest
+
+from maurice_aov_compositor.core.aov_exr_header import AOVEXRHeaderError
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+
+
+def test_hit(exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.exr')
+    header_cache = AOVHeaderCache()
+    header = header_cache.get_header(file_path=file_path)
+
+    assert header_cache.get_header(file_path=file_path) is header
+    assert header_cache.get_stats() == {
+        'hits': 1, 'persistent_hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, 'hit_rate': 0.5}
+
+
+def test_invalidation_on_size_change(exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.exr')
+    header_cache = AOVHeaderCache()
+    header_cache.get_header(file_path=file_path)
+
+    exr_file(file_name='beauty.diffuse.exr', channels_names=('diffuse.R', 'diffuse.G', 'diffuse.B'))
+
+    assert header_cache.get_header(file_path=file_path).get_layers() == ['diffuse']
+    assert header_cache.get_stats()['misses'] == 2
+
+
+def test_invalidation_on_mtime_change(exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.exr')
+    header_cache = AOVHeaderCache()
+    header = header_cache.get_header(file_path=file_path)
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns - 10 ** 9))
+
+    assert header_cache.get_header(file_path=file_path) is not header
+    assert header_cache.get_stats()['hits'] == 0
+
+
+def test_lru_eviction(exr_file):
+    files_paths = [exr_file(file_name=f'beauty.{aov}.exr') for aov in ('diffuse', 'specular', 'sss')]
+    header_cache = AOVHeaderCache(max_entries=2)
+    header_cache.get_header(file_path=files_paths[0])
+    header_cache.get_header(file_path=files_paths[1])
+    header_cache.get_header(file_path=files_paths[0])
+    header_cache.get_header(file_path=files_paths[2])
+
+    assert list(header_cache.headers) == [files_paths[0], files_paths[2]]
+    assert header_cache.get_stats()['evictions'] == 1
+
+    header_cache.set_max_entries(max_entries=1)
+
+    assert list(header_cache.headers) == [files_paths[2]]
+    assert header_cache.get_stats()['evictions'] == 2
+
+
+def test_persistent_tier(tmp_path, exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.exr', channels_names=('diffuse.R', 'diffuse.G', 'diffuse.B'))
+    cache_file_path = str(tmp_path / 'cache.db')
+    AOVHeaderCache(persistent=True, file_path=cache_file_path).get_header(file_path=file_path)
+
+    header_cache = AOVHeaderCache(persistent=True, file_path=cache_file_path)
+    header = header_cache.get_header(file_path=file_path)
+
+    assert header.get_layers() == ['diffuse']
+    assert header_cache.get_stats()['persistent_hits'] == 1
+    assert header_cache.get_stats()['misses'] == 0
+
+    header_cache.clear()
+
+    assert len(header_cache) == 0
+    assert AOVHeaderCache(persistent=True, file_path=cache_file_path).get_persistent_header(
+        file_path=file_path, size=os.path.getsize(file_path), mtime_ns=os.stat(file_path).st_mtime_ns) is None
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(AOVEXRHeaderError):
+        AOVHeaderCache().get_header(file_path=str(tmp_path / 'missing.exr'))
@@ -0,0 +1,86 @@
+"""
+========================================================================================================================
+Name: test_aov_header_probe.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphCancelled
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_header_probe import AOVHeaderProbe
+
+
+def test_consistent_render(exr_file):
+    files_paths = [
+        (exr_file(file_name=f'beauty.{aov}.exr', data_window=(-8, -4, 71, 35), display_window=(0, 0, 63, 31)), aov,
+         None)
+        for aov in ('diffuse', 'specular')]
+    report = AOVHeaderProbe().probe(files_paths=files_paths)
+
+    assert report.is_consistent()
+    assert report.get_summary() == ''
+    assert sorted(report.headers) == ['diffuse', 'specular']
+    assert report.get_data_windows() == [(-8, -4, 71, 35)] * 2
+    assert report.get_display_window() == (0, 0, 63, 31)
+
+
+def test_mismatches(tmp_path, exr_file):
+    files_paths = [
+        (exr_file(file_name='beauty.diffuse.exr'), 'diffuse', None),
+        (exr_file(file_name='beauty.specular.exr', data_window=(0, 0, 127, 63)), 'specular', None),
+        (exr_file(file_name='beauty.sss.exr', pixel_type='float'), 'sss', None),
+        (exr_file(file_name='beauty.emission.exr', channels_names=('R', 'G')), 'emission', None),
+        (str(tmp_path / 'beauty.crypto.exr'), 'crypto', None)]
+    report = AOVHeaderProbe().probe(files_paths=files_paths)
+
+    assert not report.is_consistent()
+    assert report.mismatches == [
+        'Resolutions differ: 128x64: specular; 64x32: diffuse, emission, sss',
+        'Pixel types differ: float: sss; half: diffuse, emission, specular',
+        'Missing blue channels: emission']
+    assert list(report.errors) == ['crypto']
+    assert report.get_summary().splitlines()[-1].startswith('Cannot read crypto: ')
+
+
+def test_sequence_first_frame(exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.0007.exr')
+    pattern = file_path.replace('0007', '####')
+    report = AOVHeaderProbe().probe(files_paths=[(pattern, 'diffuse', (7, 9))])
+
+    assert report.is_consistent()
+    assert AOVHeaderProbe.get_probe_file_path(file_path=pattern, frame_range=(7, 9)) == file_path
+    assert AOVHeaderProbe.get_probe_file_path(file_path=file_path, frame_range=None) == file_path
+
+
+def test_progress_and_cancel(exr_file):
+    files_paths = [(exr_file(file_name=f'beauty.{aov}.exr'), aov, None) for aov in ('diffuse', 'specular', 'sss')]
+    header_cache = AOVHeaderCache()
+    texts = []
+
+    AOVHeaderProbe(header_cache=header_cache, max_workers=1).probe(
+        files_paths=files_paths,
+        progress=lambda value, maximum, text: texts.append((value, maximum, text)))
+
+    assert texts == [(1, 3, 'Probing diffuse'), (2, 3, 'Probing specular'), (3, 3, 'Probing sss')]
+    assert header_cache.get_stats()['entries'] == 3
+
+    AOVHeaderProbe(header_cache=header_cache).probe(files_paths=files_paths)
+
+    assert header_cache.get_stats()['hits'] == 3
+
+    def cancel(value: int, maximum: int, text: str) -> None:
+        raise AOVGraphCancelled('Cancelled')
+
+    with pytest.raises(AOVGraphCancelled):
+        AOVHeaderProbe().probe(files_paths=files_paths, progress=cancel)
+
+
+def test_empty_render():
+    report = AOVHeaderProbe().probe(files_paths=[])
+
+    assert report.is_consistent()
+    assert report.get_display_window() is None
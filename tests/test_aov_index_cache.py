@@ -0,0 +1,113 @@
+"""
+========================================================================================================================
+Name: test_aov_index_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from types import SimpleNamespace
+import itertools
+import json
+import os
+import time
+
+from maurice_aov_compositor.core import aov_index_cache
+from maurice_aov_compositor.core.aov_directory_index import AOVDirectoryIndex
+from maurice_aov_compositor.core.aov_index_cache import AOVIndexCache
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+
+
+FILES_NAMES = ['beauty.diffuse.1001.exr', 'beauty.diffuse.1002.exr', 'beauty.specular.exr', 'key/beauty.sss.exr']
+
+
+def set_folder_age(folder_path: str, age: float) -> None:
+    """Sets the modification time of a folder to the age in seconds."""
+    mtime = time.time() - age
+    os.utime(folder_path, (mtime, mtime))
+
+
+def get_stored_size(index: AOVDirectoryIndex) -> int:
+    """Gets the size of the stored file names of an index."""
+    return len(json.dumps(index.get_all_files_names()))
+
+
+def test_cache_hit(tmp_path, render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    set_folder_age(folder_path=folder_path, age=60)
+    index_cache = AOVIndexCache(file_path=str(tmp_path / 'cache.db'))
+    naming_template = AOVNamingTemplate()
+
+    assert index_cache.get(folder_path=folder_path, naming_template=naming_template) is None
+
+    index = index_cache.get_index(folder_path=folder_path, naming_template=naming_template)
+    cached_index = index_cache.get(folder_path=folder_path, naming_template=naming_template)
+
+    assert cached_index.renders == index.renders
+    assert cached_index.folders_names == ['key']
+    assert cached_index.entries_count == index.entries_count
+    assert index_cache.get(folder_path=folder_path, naming_template=AOVNamingTemplate(template='{aov}.exr')) is None
+
+
+def test_recent_folder_not_cached(tmp_path, render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    index_cache = AOVIndexCache(file_path=str(tmp_path / 'cache.db'))
+    naming_template = AOVNamingTemplate()
+
+    index = index_cache.get_index(folder_path=folder_path, naming_template=naming_template)
+
+    assert index.get_aovs(base_name='beauty') == ['diffuse', 'specular']
+    assert index_cache.get(folder_path=folder_path, naming_template=naming_template) is None
+
+
+def test_invalidation_on_mtime_change(tmp_path, render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    set_folder_age(folder_path=folder_path, age=60)
+    index_cache = AOVIndexCache(file_path=str(tmp_path / 'cache.db'))
+    naming_template = AOVNamingTemplate()
+    index_cache.get_index(folder_path=folder_path, naming_template=naming_template)
+
+    open(os.path.join(folder_path, 'beauty.sss.exr'), 'wb').close()
+    set_folder_age(folder_path=folder_path, age=30)
+
+    assert index_cache.get(folder_path=folder_path, naming_template=naming_template) is None
+    assert index_cache.get_index(folder_path=folder_path, naming_template=naming_template).get_aovs(
+        base_name='beauty') == ['diffuse', 'specular', 'sss']
+
+
+def test_invalidation_on_size_change(tmp_path, render_folder):
+    folder_path = render_folder(files_names=FILES_NAMES)
+    index_cache = AOVIndexCache(file_path=str(tmp_path / 'cache.db'))
+    naming_template = AOVNamingTemplate()
+    folder_stat = os.stat(folder_path)
+    index_cache.set(
+        index=AOVDirectoryIndex(folder_path=folder_path, naming_template=naming_template).build(),
+        mtime_ns=folder_stat.st_mtime_ns,
+        size=folder_stat.st_size + 1)
+
+    assert index_cache.get(folder_path=folder_path, naming_template=naming_template) is None
+
+
+def test_lru_eviction(tmp_path, render_folder, monkeypatch):
+    monkeypatch.setattr(aov_index_cache, 'time', SimpleNamespace(time=itertools.count(start=1000).__next__))
+    index_cache = AOVIndexCache(file_path=str(tmp_path / 'cache.db'))
+    naming_template = AOVNamingTemplate()
+    folders_paths = [render_folder(files_names=FILES_NAMES, folder_name=f'sh0{i}0') for i in range(1, 4)]
+    indices = [
+        AOVDirectoryIndex(folder_path=folder_path, naming_template=naming_template).build()
+        for folder_path in folders_paths]
+    index_cache.set_max_size(max_size=2 * get_stored_size(index=indices[0]))
+
+    for index in indices[:2]:
+        folder_stat = os.stat(index.folder_path)
+        index_cache.set(index=index, mtime_ns=folder_stat.st_mtime_ns, size=folder_stat.st_size)
+
+    assert index_cache.get(folder_path=folders_paths[0], naming_template=naming_template) is not None
+
+    folder_stat = os.stat(folders_paths[2])
+    index_cache.set(index=indices[2], mtime_ns=folder_stat.st_mtime_ns, size=folder_stat.st_size)
+
+    assert index_cache.get(folder_path=folders_paths[0], naming_template=naming_template) is not None
+    assert index_cache.get(folder_path=folders_paths[1], naming_template=naming_template) is None
+    assert index_cache.get(folder_path=folders_paths[2], naming_template=naming_template) is not None
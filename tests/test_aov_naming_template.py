@@ -0,0 +1,53 @@
+"""
+========================================================================================================================
+Name: test_aov_naming_template.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+
+
+@pytest.mark.parametrize('file_name, parsed_file_name', (
+    ('beauty.diffuse.exr', ('beauty', 'diffuse', None)),
+    ('beauty.diffuse.1001.exr', ('beauty', 'diffuse', 1001)),
+    ('sh010_beauty.specular.0042.EXR', ('sh010_beauty', 'specular', 42)),
+    ('beauty.diffuse.####.exr', ('beauty', 'diffuse', None)),
+    ('beauty.diffuse.%04d.exr', ('beauty', 'diffuse', None)),
+    ('beauty.exr', None),
+    ('beauty.diffuse.1001.jpg', None),
+))
+def test_parse_default(file_name: str, parsed_file_name: tuple | None):
+    assert AOVNamingTemplate().parse(file_name=file_name) == parsed_file_name
+
+
+def test_parse_custom():
+    naming_template = AOVNamingTemplate(template='{shot}_{layer}_{aov}_{frame}.exr')
+
+    assert naming_template.parse(file_name='sh010_key_diffuse_1001.exr') == ('sh010_key', 'diffuse', 1001)
+    assert naming_template.parse(file_name='sh010_key_diffuse.exr') is None
+
+
+def test_get_frame_span():
+    naming_template = AOVNamingTemplate()
+
+    assert naming_template.get_frame_span(file_name='beauty.diffuse.1001.exr') == (15, 19)
+    assert naming_template.get_frame_span(file_name='beauty.diffuse.exr') is None
+    assert AOVNamingTemplate(template='{base}.{aov}.exr').get_frame_span(file_name='beauty.diffuse.exr') is None
+
+
+@pytest.mark.parametrize('template', (
+    '{base}.{frame}.exr',
+    '{aov}.{aov}.exr',
+    '{base}.{aov}[.{frame}.exr',
+    '{base}.{aov}].exr',
+    '{base}.{aov',
+))
+def test_invalid_template(template: str):
+    with pytest.raises(AOVGraphError):
+        AOVNamingTemplate.compile(template=template)
@@ -0,0 +1,168 @@
+"""
+========================================================================================================================
+Name: test_aov_network_planner.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_channel_index import AOVChannelIndex
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_network_planner import AOVNetworkPlanner
+
+
+AOVS = ('diffuse', 'specular', 'sss', 'emission', 'transmission')
+
+
+def get_planner(topology: str, layer_native: bool = False, crop_overscan: bool = False) -> AOVNetworkPlanner:
+    """Gets a planner of the AOVs."""
+    planner = AOVNetworkPlanner()
+    planner.set_aovs_settings(aovs={aov.title(): aov for aov in AOVS})
+    planner.set_topology(topology=topology)
+    planner.set_layer_native(layer_native=layer_native)
+    planner.set_crop_overscan(crop_overscan=crop_overscan)
+
+    return planner
+
+
+def get_files_paths(aovs: tuple = AOVS) -> list:
+    """Gets the (file path, AOV, frame range) files of the AOVs."""
+    return [(f'/render/beauty.{aov}.%04d.exr', aov, (1001, 1010)) for aov in aovs]
+
+
+def get_channel_index(aovs: tuple = AOVS) -> AOVChannelIndex:
+    """Gets the channel index of a single file with the AOVs as layers."""
+    return AOVChannelIndex(channels=[
+        f'{layer}.{suffix}' for layer in ('rgba',) + aovs for suffix in ('red', 'green', 'blue', 'alpha')])
+
+
+def test_linear_network():
+    planner = get_planner(topology=AOVNetworkPlanner.LINEAR)
+    graph = planner.plan_standard_network_from_multi_files(files_paths=get_files_paths(), network_id='beauty')
+
+    assert graph.get_node('read/diffuse').knobs == {
+        'file': '/render/beauty.diffuse.%04d.exr', 'first': 1001, 'last': 1010, 'origfirst': 1001, 'origlast': 1010}
+    assert graph.get_node('shuffle/diffuse').inputs == ['read/diffuse']
+    assert graph.get_node('dot/base').inputs == ['shuffle/diffuse']
+
+    last_key = 'dot/base'
+
+    for aov in AOVS[1:]:
+        merge_node = graph.get_node(f'merge/{aov}')
+
+        assert merge_node.node_class == 'Merge2'
+        assert merge_node.knobs == AOVNetworkPlanner.MERGE_KNOBS
+        assert merge_node.inputs == [f'shuffle/{aov}', last_key]
+
+        last_key = merge_node.key
+
+    assert graph.output_key == AOVNetworkPlanner.OUTPUT_KEY
+    assert graph.get_node(graph.output_key).inputs == [last_key]
+    assert graph.get_node_count() == 3 * len(AOVS) + 1
+
+
+def test_tree_network():
+    planner = get_planner(topology=AOVNetworkPlanner.TREE)
+    graph = planner.plan_standard_network_from_multi_files(files_paths=get_files_paths())
+
+    assert graph.get_node('merge/tree/0/0').inputs == ['shuffle/diffuse', 'shuffle/specular']
+    assert graph.get_node('merge/tree/0/1').inputs == ['shuffle/sss', 'shuffle/emission']
+    assert graph.get_node('merge/tree/1/0').inputs == ['merge/tree/0/0', 'merge/tree/0/1']
+    assert graph.get_node('merge/tree/2/0').inputs == ['merge/tree/1/0', 'shuffle/transmission']
+    assert graph.get_node('merge/tree/1/0').row == AOVNetworkPlanner.MERGE_ROW + 1
+    assert graph.get_node(graph.output_key).inputs == ['merge/tree/2/0']
+    assert len([node for node in graph.get_nodes() if node.node_class == 'Merge2']) == len(AOVS) - 1
+
+
+def test_wide_network_skips_mask_input():
+    planner = get_planner(topology=AOVNetworkPlanner.WIDE)
+    graph = planner.plan_standard_network_from_multi_files(files_paths=get_files_paths())
+    merge_node = graph.get_node('merge/wide')
+
+    assert merge_node.inputs[:2] == ['shuffle/diffuse', 'shuffle/specular']
+    assert merge_node.inputs[AOVNetworkPlanner.MERGE_MASK_INPUT] is None
+    assert merge_node.inputs[3:] == ['shuffle/sss', 'shuffle/emission', 'shuffle/transmission']
+    assert len([node for node in graph.get_nodes() if node.node_class == 'Merge2']) == 1
+
+
+def test_single_branch_network():
+    planner = get_planner(topology=AOVNetworkPlanner.WIDE)
+    graph = planner.plan_standard_network_from_multi_files(files_paths=get_files_paths(aovs=('diffuse',)))
+
+    assert 'merge/wide' not in graph
+    assert graph.get_node(graph.output_key).inputs == ['dot/base']
+
+
+def test_layer_native_network():
+    planner = get_planner(topology=AOVNetworkPlanner.LINEAR, layer_native=True)
+    graph = planner.plan_standard_network_from_single_file(
+        channel_index=get_channel_index(),
+        read_node_name='Read1',
+        read_file_path='/render/beauty.exr')
+    merge_node = graph.get_node('merge/emission')
+
+    assert merge_node.inputs == ['read', 'read']
+    assert merge_node.knobs['Achannels'] == 'emission'
+    assert merge_node.knobs['Bchannels'] == 'diffuse'
+    assert merge_node.knobs['output'] == 'rgba'
+    assert graph.get_node('merge/specular').knobs['Bchannels'] == 'rgba'
+    assert not any(node.node_class == 'Shuffle2' for node in graph.get_nodes())
+
+
+@pytest.mark.parametrize('topology', (AOVNetworkPlanner.LINEAR, AOVNetworkPlanner.TREE))
+@pytest.mark.parametrize('aovs_count', range(len(AOVS) + 1))
+def test_layer_native_nodes_saved(topology: str, aovs_count: int):
+    aovs = AOVS[:aovs_count]
+    planner = get_planner(topology=topology)
+    shuffle_graph = planner.plan_standard_network_from_single_file(
+        channel_index=get_channel_index(aovs=aovs),
+        read_node_name='Read1')
+
+    planner.set_layer_native(layer_native=True)
+    layer_native_graph = planner.plan_standard_network_from_single_file(
+        channel_index=get_channel_index(aovs=aovs),
+        read_node_name='Read1')
+
+    assert planner.nodes_saved == shuffle_graph.get_node_count() - layer_native_graph.get_node_count()
+
+
+@pytest.mark.parametrize('crop_overscan, crop_count', ((False, 0), (True, 1)))
+def test_crop_overscan(crop_overscan: bool, crop_count: int):
+    planner = get_planner(topology=AOVNetworkPlanner.LINEAR, crop_overscan=crop_overscan)
+    graph = planner.plan_standard_network_from_multi_files(
+        files_paths=get_files_paths(),
+        data_windows=[(-96, -54, 2015, 1133)],
+        display_window=(0, 0, 1919, 1079))
+
+    assert len([node for node in graph.get_nodes() if node.node_class == 'Crop']) == crop_count
+
+
+def test_crop_overscan_inside_format():
+    planner = get_planner(topology=AOVNetworkPlanner.LINEAR, crop_overscan=True)
+    graph = planner.plan_standard_network_from_multi_files(
+        files_paths=get_files_paths(),
+        data_windows=[(100, 100, 1000, 800)],
+        display_window=(0, 0, 1919, 1079))
+
+    assert AOVNetworkPlanner.CROP_KEY not in graph
+
+
+@pytest.mark.parametrize('display_window, box', (
+    ((0, 0, 1919, 1079), [0, 0, 1920, 1080]),
+    ((100, 50, 2019, 1129), [100, 50, 2020, 1130])))
+def test_crop_overscan_box(display_window: tuple, box: list):
+    planner = get_planner(topology=AOVNetworkPlanner.LINEAR, crop_overscan=True)
+    graph = planner.plan_standard_network_from_multi_files(
+        files_paths=get_files_paths(),
+        data_windows=[(-96, -54, 2115, 1183)],
+        display_window=display_window)
+
+    assert graph.get_node(AOVNetworkPlanner.CROP_KEY).knobs['box'] == box
+
+
+def test_unknown_topology():
+    with pytest.raises(AOVGraphError):
+        AOVNetworkPlanner().set_topology(topology='star')
@@ -0,0 +1,107 @@
+"""
+========================================================================================================================
+Name: test_aov_render_audit.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import json
+import os
+
+import pytest
+
+from maurice_aov_compositor.core.aov_graph import AOVGraphError
+from maurice_aov_compositor.core.aov_header_cache import AOVHeaderCache
+from maurice_aov_compositor.core.aov_render_audit import AOVRenderAudit
+
+
+AOVS_SETTINGS = {'Diffuse': 'diffuse', 'Specular': 'specular', 'SSS': 'sss', 'Emission': 'emission'}
+
+
+def get_messages(file: dict) -> list:
+    """Gets the (severity, message) of the findings of an audited file."""
+    return [(finding['severity'], finding['message']) for finding in file['findings']]
+
+
+def test_audit_folder(tmp_path, exr_file):
+    exr_file(file_name='render/beauty.diffuse.exr')
+    exr_file(file_name='render/beauty.specular.exr', compression='none')
+    exr_file(file_name='render/beauty.sss.exr', pixel_type='float', compression='rle')
+    exr_file(file_name='render/beauty.emission.exr', data_window=(-8, -4, 71, 35), display_window=(0, 0, 63, 31))
+    folder_path = (tmp_path / 'render').as_posix()
+
+    report = AOVRenderAudit(aovs_settings=AOVS_SETTINGS).audit(path=folder_path)
+    files = {file['aov']: file for file in report['renders'][0]['files']}
+
+    assert report['path'] == folder_path
+    assert [render['name'] for render in report['renders']] == ['beauty']
+    assert get_messages(file=files['diffuse']) == []
+    assert get_messages(file=files['specular']) == [
+        (AOVRenderAudit.WARNING, 'Uncompressed, every frame reads the raw pixels.')]
+    assert get_messages(file=files['sss']) == [
+        (AOVRenderAudit.INFO, 'RLE decodes 1 scanlines at a time, ZIPS, ZIP or DWAA decode faster.'),
+        (AOVRenderAudit.WARNING, 'Full float channels read by the network: rgba.alpha, rgba.blue, rgba.green, '
+                                 'rgba.red, half float is enough for color AOVs.')]
+    assert files['emission']['data_window_ratio'] == 1.562
+    assert get_messages(file=files['emission']) == [
+        (AOVRenderAudit.WARNING, 'Data window is 156% of the format, the overscan is read on every frame.')]
+    assert report['summary'] == {
+        'files': 4, 'warnings': 3, 'infos': 1, 'errors': 0, 'aovs_to_change': ['emission', 'specular', 'sss']}
+
+
+def test_audit_unused_channels(exr_file):
+    channels_names = ('R', 'G', 'B', 'A', *(f'extra.c{i}' for i in range(10)))
+    file_path = exr_file(file_name='beauty.diffuse.exr', channels_names=channels_names)
+
+    report = AOVRenderAudit(aovs_settings=AOVS_SETTINGS).audit(path=file_path)
+    file = report['renders'][0]['files'][0]
+
+    assert file['unused_channels'] == [f'extra.c{i}' for i in range(10)]
+    assert get_messages(file=file) == [(
+        AOVRenderAudit.INFO,
+        'Channels not read by the network: extra.c0, extra.c1, extra.c2, extra.c3, extra.c4, extra.c5, extra.c6, '
+        'extra.c7 and 2 more.')]
+
+
+def test_audit_single_file_layers(exr_file):
+    file_path = exr_file(file_name='beauty.exr', channels_names=(
+        'R', 'G', 'B', 'A', 'diffuse.R', 'diffuse.G', 'diffuse.B', 'crypto.R'))
+
+    report = AOVRenderAudit(aovs_settings=AOVS_SETTINGS).audit(path=file_path)
+    file = report['renders'][0]['files'][0]
+
+    assert report['renders'][0]['name'] == 'beauty.exr'
+    assert file['aov'] == ''
+    assert file['unused_channels'] == ['crypto.red']
+
+
+def test_audit_errors(tmp_path, exr_file):
+    exr_file(file_name='render/beauty.diffuse.exr')
+    (tmp_path / 'render' / 'beauty.specular.exr').write_bytes(b'not an exr')
+
+    report = AOVRenderAudit(aovs_settings=AOVS_SETTINGS).audit(path=(tmp_path / 'render').as_posix())
+
+    assert list(report['renders'][0]['errors']) == ['specular']
+    assert report['summary']['errors'] == 1
+
+    with pytest.raises(AOVGraphError):
+        AOVRenderAudit(aovs_settings=AOVS_SETTINGS).audit(path=(tmp_path / 'missing').as_posix())
+
+
+def test_header_cache_and_json(tmp_path, exr_file):
+    file_path = exr_file(file_name='beauty.diffuse.exr')
+    header_cache = AOVHeaderCache()
+    render_audit = AOVRenderAudit(aovs_settings=AOVS_SETTINGS, header_cache=header_cache)
+
+    report = render_audit.audit(path=file_path)
+    render_audit.audit(path=file_path)
+
+    assert header_cache.get_stats()['hits'] == 1
+
+    json_file_path = os.path.join(tmp_path, 'audit.json')
+    AOVRenderAudit.write_json(reports=[report], file_path=json_file_path)
+
+    with open(json_file_path, encoding='utf-8') as file:
+        assert json.load(file) == [report]
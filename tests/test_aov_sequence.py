@@ -0,0 +1,85 @@
+"""
+========================================================================================================================
+Name: test_aov_sequence.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import pytest
+
+from maurice_aov_compositor.core.aov_naming_template import AOVNamingTemplate
+from maurice_aov_compositor.core.aov_sequence import AOVSequence
+
+
+def get_sequence(frames: list, padding: int = 4, aov: str = 'diffuse') -> AOVSequence:
+    """Gets the sequence of the frames of an AOV."""
+    return AOVSequence(
+        folder_path='/render',
+        base_name='beauty',
+        aov=aov,
+        files_names={frame: f'beauty.{aov}.{frame:0{padding}d}.exr' for frame in frames})
+
+
+def test_sequence():
+    sequence = get_sequence(frames=[1003, 1001, 1002, 1005])
+
+    assert len(sequence) == 4
+    assert sequence.get_frame_range() == (1001, 1005)
+    assert sequence.get_missing_frames() == [1004]
+    assert sequence.get_pattern() == '/render/beauty.diffuse.%04d.exr'
+    assert sequence.get_pattern(hashes=True) == '/render/beauty.diffuse.####.exr'
+
+
+def test_sequence_without_padding():
+    sequence = get_sequence(frames=[8, 9, 10, 11], padding=1)
+
+    assert sequence.padding == 1
+    assert sequence.get_pattern() == '/render/beauty.diffuse.%d.exr'
+    assert sequence.get_missing_frames() == []
+
+
+def test_sequence_ignores_file_without_frame():
+    sequence = AOVSequence(
+        folder_path='/render',
+        base_name='beauty',
+        aov='diffuse',
+        files_names={None: 'beauty.diffuse.exr', 1: 'beauty.diffuse.0001.exr'})
+
+    assert sequence.frames == [1]
+
+
+def test_sequence_naming_template():
+    sequence = AOVSequence(
+        folder_path='/render',
+        base_name='sh010',
+        aov='diffuse',
+        files_names={frame: f'sh010_diffuse_{frame:03d}.exr' for frame in (1, 2)},
+        naming_template=AOVNamingTemplate(template='{base}_{aov}_{frame}.exr'))
+
+    assert sequence.get_pattern() == '/render/sh010_diffuse_%03d.exr'
+
+
+@pytest.mark.parametrize('pattern, frame, file_path', (
+    ('/render/beauty.diffuse.%04d.exr', 1001, '/render/beauty.diffuse.1001.exr'),
+    ('/render/beauty.diffuse.%04d.exr', 7, '/render/beauty.diffuse.0007.exr'),
+    ('/render/beauty.diffuse.%d.exr', 7, '/render/beauty.diffuse.7.exr'),
+    ('/render/beauty.diffuse.###.exr', 7, '/render/beauty.diffuse.007.exr'),
+    ('/render/v%02d/beauty.diffuse.%04d.exr', 1001, '/render/v%02d/beauty.diffuse.1001.exr'),
+    ('/render/100%/beauty.diffuse.%04d.exr', 1001, '/render/100%/beauty.diffuse.1001.exr'),
+    ('/render/beauty.diffuse.exr', 1001, '/render/beauty.diffuse.exr'),
+))
+def test_get_frame_file_path(pattern: str, frame: int, file_path: str):
+    assert AOVSequence.get_frame_file_path(pattern=pattern, frame=frame) == file_path
+
+
+@pytest.mark.parametrize('pattern, frame_token', (
+    ('/render/beauty.diffuse.%04d.exr', '%04d'),
+    ('/render/beauty.diffuse.%d.exr', '%d'),
+    ('/render/beauty.diffuse.######.exr', '######'),
+    ('/render/100%/beauty.diffuse.%05d.exr', '%05d'),
+    ('/render/beauty.diffuse.exr', ''),
+))
+def test_get_frame_token(pattern: str, frame_token: str):
+    assert AOVSequence.get_frame_token(pattern=pattern) == frame_token